@@ -0,0 +1,108 @@
+import http.client
+import json
+import statistics
+import sys
+import threading
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlencode, urlsplit
+
+# Usage: python benchmarks/api_load.py [clients] [requests per client] [url]
+# Sends the requests of many clients at once to the web API started with python3 dex/api.py,
+# each client on its own keep-alive connection, and shows the p50/p99 latency of each endpoint.
+# The first round asks each answer once, so it is run by the process pool, the next rounds
+# are answered by the cache.
+
+API_URL: str = "http://127.0.0.1:8000"
+
+PLAYERS: List[Tuple[str, str]] = [
+    (f"{monster}/{file_format}/{monster}s_1.{file_format}", f"{monster}/{other_format}/{monster}s_2.{other_format}")
+    for monster in ("pokemon", "digimon")
+    for file_format, other_format in (("json", "csv"), ("csv", "xml"), ("xml", "yaml"), ("yaml", "json"))
+]
+REQUESTS: List[Tuple[str, str]] = [
+    *((f"/trivia?{urlencode(dict(roster=player1))}", "trivia") for player1, _ in PLAYERS),
+    *((f"/info?{urlencode(dict(player1=player1, player2=player2))}", "info") for player1, player2 in PLAYERS),
+    *((f"/battle?{urlencode(dict(player1=player1, player2=player2))}", "battle") for player1, player2 in PLAYERS),
+]
+
+
+def client(url: str, paths: List[Tuple[str, str]], latencies: Dict[str, List[float]], errors: List[str]) -> None:
+    """
+    This function is one of the concurrent clients, it sends its
+    requests one after the other and keeps the latency of each one.
+    """
+    address = urlsplit(url)
+    connection = http.client.HTTPConnection(address.hostname, address.port or 80, timeout=60)
+    for path, endpoint in paths:
+        start = time.perf_counter()
+        try:
+            connection.request("GET", path)
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException) as error:
+            errors.append(f"{path}: {error}")
+            connection.close()
+            continue
+        latencies[endpoint].append(time.perf_counter() - start)
+        if response.status != 200:
+            errors.append(f"{path}: {response.status} {body[:200]!r}")
+        else:
+            json.loads(body)
+    connection.close()
+
+
+def load(url: str, clients: int, requests: int) -> Tuple[float, Dict[str, List[float]], List[str]]:
+    """
+    This function runs the clients at once, each one with requests
+    taken in turn from REQUESTS, starting at a different one.
+
+    Returns
+    -------
+        The seconds it took, the latencies by endpoint and the errors.
+    """
+    latencies: Dict[str, List[float]] = {"trivia": [], "info": [], "battle": []}
+    errors: List[str] = []
+    threads = [
+        threading.Thread(
+            target=client,
+            args=(url, [REQUESTS[(idx + step) % len(REQUESTS)] for step in range(requests)], latencies, errors),
+        )
+        for idx in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start, latencies, errors
+
+
+def show(title: str, elapsed: float, latencies: Dict[str, List[float]], errors: List[str]) -> None:
+    """
+    This function prints the p50 and p99 latency of each endpoint.
+    """
+    total = sum(len(times) for times in latencies.values())
+    print(f"\n{title}: {total} requests in {elapsed:.2f}s, {total / elapsed:.0f} requests/s, {len(errors)} errors")
+    for endpoint, times in latencies.items():
+        if len(times) < 2:
+            continue
+        cuts = statistics.quantiles(times, n=100, method="inclusive")
+        percentiles = f"p50 {cuts[49] * 1000:>8.2f} ms | p99 {cuts[98] * 1000:>8.2f} ms"
+        print(f"{endpoint:>8} | {percentiles} | {len(times)} requests")
+    for error in errors[:5]:
+        print(f"    {error}")
+
+
+def main() -> None:
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    url = sys.argv[3] if len(sys.argv) > 3 else API_URL
+
+    # Every answer once, at the same time, none of them is in the cache yet.
+    show("first round", *load(url, len(REQUESTS), 1))
+    show(f"{clients} clients", *load(url, clients, requests))
+
+
+if __name__ == "__main__":
+    main()
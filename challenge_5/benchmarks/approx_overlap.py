@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterator, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import core  # noqa: E402
+
+# Usage: python benchmarks/approx_overlap.py [rows] [error]
+# Compares the exact repeated/different counts of two rosters with the NameSketch estimates,
+# and the memory of the name sets with the memory of the sketches.
+
+
+def names(start: int, rows: int) -> Iterator[str]:
+    """
+    This function generates the names Mon<start> to Mon<start + rows - 1>.
+    """
+    return (f"Mon{idx}" for idx in range(start, start + rows))
+
+
+def exact_overlap(rows: int, start_2: int) -> Tuple[int, int]:
+    """
+    This function counts the repeated and different names with sets.
+    """
+    set_1 = set(names(0, rows))
+    set_2 = set(names(start_2, rows))
+    return len(set_1 & set_2), len(set_1 - set_2)
+
+
+def approx_overlap(rows: int, start_2: int, error: float) -> Tuple[int, int]:
+    """
+    This function estimates the repeated and different names with sketches.
+    """
+    sketch_1 = core.NameSketch(error).consume(names(0, rows))
+    sketch_2 = core.NameSketch(error).consume(names(start_2, rows))
+    return sketch_1.overlap(sketch_2)
+
+
+def measure(function: Callable, *args) -> Tuple[Tuple[int, int], float, float]:
+    """
+    This function runs a function twice, once to time it and once to
+    trace its peak memory, tracemalloc slows down the allocations.
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    error = float(sys.argv[2]) if len(sys.argv) > 2 else core.DEFAULT_APPROX_ERROR
+    # The second roster shares 40% of its names with the first one.
+    start_2 = int(rows * 0.6)
+
+    exact, exact_elapsed, exact_memory = measure(exact_overlap, rows, start_2)
+    approx, approx_elapsed, approx_memory = measure(approx_overlap, rows, start_2, error)
+
+    print(f"{rows} names per roster, error {error}")
+    print(f"{'':>8} | {'repeated':>10} | {'different':>10} | {'seconds':>8} | {'peak MiB':>8}")
+    print(f"{'exact':>8} | {exact[0]:>10} | {exact[1]:>10} | {exact_elapsed:>8.2f} | {exact_memory:>8.1f}")
+    print(f"{'approx':>8} | {approx[0]:>10} | {approx[1]:>10} | {approx_elapsed:>8.2f} | {approx_memory:>8.1f}")
+    print(f"relative error of repeated: {abs(approx[0] - exact[0]) / exact[0]:.4f}")
+
+
+if __name__ == "__main__":
+    main()
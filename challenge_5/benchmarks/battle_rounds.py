@@ -0,0 +1,94 @@
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Union
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import core  # noqa: E402
+import menu  # noqa: E402
+
+# Usage: python benchmarks/battle_rounds.py [max_team_size]
+# Compares start_battle with the old round by round loop, and checks both give the same result.
+
+
+def loop_battle(monster_team: core.AnswersBattle, team_size: int) -> core.AnswersResult:
+    """
+    This function is start_battle before the rounds were computed
+    with a division, playing one round at a time.
+    """
+    team_player1 = monster_team["p1_player"]
+    team_player2 = monster_team["p2_player"]
+    lowest_round = 9999999
+
+    for position in range(team_size):
+        round_counter = 0
+        p1_monster_hp = team_player1[position]["hp"]
+        p2_monster_hp = team_player2[position]["hp"]
+        damage_player1_monster = 0.5 * (team_player1[position]["attack"]) / (team_player2[position]["defense"]) + 1
+        damage_player2_monster = 0.5 * (team_player2[position]["attack"]) / (team_player2[position]["defense"]) + 1
+
+        while True:
+            round_counter += 1
+
+            p1_monster_hp -= damage_player1_monster
+            p2_monster_hp -= damage_player2_monster
+
+            if p1_monster_hp <= 0:
+                if round_counter < lowest_round:
+                    first_mon_dead = team_player1[position]["name"]
+                    victorious_player = "2"
+                    lowest_round = round_counter
+                break
+            elif p2_monster_hp <= 0:
+                if round_counter < lowest_round:
+                    first_mon_dead = team_player2[position]["name"]
+                    victorious_player = "1"
+                    lowest_round = round_counter
+                break
+    return core.AnswersResult(winner=victorious_player, rounds=lowest_round, loser_monster=first_mon_dead)
+
+
+def random_team(size: int, rng: random.Random, player: str) -> List[Dict[str, Union[str, int]]]:
+    """
+    This function generates a team of random monsters.
+    """
+    return [
+        dict(
+            name=f"{player}-Mon{idx}",
+            hp=rng.randint(50, 5000),
+            attack=rng.randint(1, 300),
+            defense=rng.randint(1, 300),
+        )
+        for idx in range(size)
+    ]
+
+
+def main() -> None:
+    max_team_size = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    rng = random.Random(42)
+
+    print(f"{'team size':>10} | {'loop s':>8} | {'closed s':>8} | {'speedup':>8}")
+    team_size = 3
+    while team_size <= max_team_size:
+        battle = core.AnswersBattle(
+            p1_player=random_team(team_size, rng, "p1"), p2_player=random_team(team_size, rng, "p2")
+        )
+
+        start = time.perf_counter()
+        expected = loop_battle(battle, team_size)
+        loop_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = menu.start_battle(battle, team_size)
+        closed_elapsed = time.perf_counter() - start
+
+        assert result == expected, (result, expected)
+        speedup = loop_elapsed / closed_elapsed
+        print(f"{team_size:>10} | {loop_elapsed:>8.3f} | {closed_elapsed:>8.3f} | {speedup:>7.0f}x")
+        team_size *= 10
+
+
+if __name__ == "__main__":
+    main()
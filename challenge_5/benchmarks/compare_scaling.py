@@ -0,0 +1,54 @@
+import os
+import random
+import sys
+import time
+from itertools import combinations
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import menu  # noqa: E402
+
+# Usage: python benchmarks/compare_scaling.py [rosters] [roster_size] [name_pool]
+# Compares compare_rosters with one intersection per pair of sets, and checks both give the same counts.
+
+
+def synthetic_rosters(total: int, roster_size: int, name_pool: int) -> Dict[str, List[Dict[str, str]]]:
+    """
+    This function generates rosters drawing the names from a shared pool,
+    so the rosters overlap.
+    """
+    rng = random.Random(42)
+    return {
+        f"player_{player:03}": [dict(name=f"Mon{rng.randrange(name_pool)}") for _ in range(roster_size)]
+        for player in range(total)
+    }
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    roster_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    name_pool = int(sys.argv[3]) if len(sys.argv) > 3 else 500_000
+    rosters = synthetic_rosters(total, roster_size, name_pool)
+
+    start = time.perf_counter()
+    comparison = menu.compare_rosters(rosters)
+    index_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    name_sets = [set(monster["name"] for monster in roster) for roster in rosters.values()]
+    for player1, player2 in combinations(range(total), 2):
+        shared = len(name_sets[player1] & name_sets[player2])
+        assert comparison["intersection"][player1][player2] == shared
+    for player in range(total):
+        others = set().union(*(names for position, names in enumerate(name_sets) if position != player))
+        assert comparison["unique"][player] == len(name_sets[player] - others)
+    pairwise_elapsed = time.perf_counter() - start
+
+    print(f"{total} rosters of {roster_size} monsters, {name_pool} names")
+    print(f"name index      {index_elapsed:>8.2f}s")
+    print(f"pairwise sets   {pairwise_elapsed:>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import client  # noqa: E402
+
+# Usage: python benchmarks/daemon_requests.py [runs]
+# Runs the same commands with main.py, a new process each time, and with dex/client.py sending
+# them to a daemon started with --serve, then sends them to the daemon from this process, which
+# shows the time of the request alone, without starting python.
+
+DEX_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex")
+DATA_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+
+COMMANDS: Dict[str, List[str]] = {
+    "yaml trivia": ["--trivia", os.path.join(DATA_DIR, "pokemon", "yaml", "pokemons_1.yaml")],
+    "xml info": [
+        "--player1",
+        os.path.join(DATA_DIR, "digimon", "xml", "digimons_1.xml"),
+        "--player2",
+        os.path.join(DATA_DIR, "digimon", "xml", "digimons_2.xml"),
+        "--info",
+    ],
+    "csv battle": [
+        "--player1",
+        os.path.join(DATA_DIR, "pokemon", "csv", "pokemons_1.csv"),
+        "--player2",
+        os.path.join(DATA_DIR, "pokemon", "csv", "pokemons_2.csv"),
+        "--battle",
+    ],
+}
+
+
+def best_time(function: Callable[[], object], runs: int) -> float:
+    """
+    This function returns the fewest seconds a call took in the runs.
+    """
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    directory = tempfile.mkdtemp()
+    socket_path = os.path.join(directory, "dex.sock")
+    environment = dict(os.environ, DEX_CACHE_DIR=os.path.join(directory, "cache"), DEX_SOCKET=socket_path)
+
+    daemon = subprocess.Popen(
+        [sys.executable, os.path.join(DEX_DIR, "main.py"), "--serve"],
+        env=environment,
+        cwd=directory,
+        stdout=subprocess.DEVNULL,
+    )
+    while not os.path.exists(socket_path):
+        time.sleep(0.01)
+
+    def run(script: str, arguments: List[str]) -> Callable[[], object]:
+        return lambda: subprocess.run(
+            [sys.executable, os.path.join(DEX_DIR, script), *arguments],
+            env=environment,
+            cwd=directory,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+    print(f"{'':>12} | {'main.py':>10} | {'client.py':>10} | {'request':>10}")
+    try:
+        for name, arguments in COMMANDS.items():
+            # The first runs fill the disk cache and the daemon memory.
+            run("main.py", arguments)()
+            run("client.py", arguments)()
+            cli = best_time(run("main.py", arguments), runs)
+            forwarded = best_time(run("client.py", arguments), runs)
+            request = best_time(lambda: client.send_request(arguments, socket_path), runs * 10)
+            print(f"{name:>12} | {cli * 1000:>7.1f} ms | {forwarded * 1000:>7.1f} ms | {request * 1e6:>7.0f} us")
+    finally:
+        daemon.terminate()
+        daemon.wait()
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
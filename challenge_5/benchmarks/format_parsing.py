@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+import time
+
+import yaml
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import core  # noqa: E402
+from synthetic_data import write_roster  # noqa: E402
+
+# Usage: python benchmarks/format_parsing.py [rows] [monster_type]
+# Writes the same synthetic roster in the four formats and times, for each one, the parsing
+# alone, then decoding into typed monsters, then building the Roster. The yaml line before the change, the
+# whole file with the pure python safe_load, is timed as well.
+
+
+def timed(function, *args) -> float:
+    """
+    This function returns how many seconds a call takes.
+    """
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    monster_type = sys.argv[2] if len(sys.argv) > 2 else "pokemon"
+
+    print(f"{rows} {monster_type}s, libyaml: {yaml.__with_libyaml__}")
+    print(f"{'format':>16} | {'MiB':>6} | {'parse s':>8} | {'+ decode s':>10} | {'+ roster s':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in ("json", "csv", "xml", "yaml"):
+            filepath = os.path.join(directory, f"{monster_type}s.{extension}")
+            write_roster(filepath, rows, monster_type)
+            size = os.path.getsize(filepath) / 2**20
+
+            parse = timed(lambda: sum(1 for _ in core.iter_records(filepath)))
+            decode = timed(lambda: sum(1 for _ in core.iter_monsters(filepath, monster_type)))
+            roster = timed(core.cache.read_roster, filepath, monster_type)
+            print(f"{extension:>16} | {size:>6.1f} | {parse:>8.2f} | {decode:>10.2f} | {roster:>10.2f}")
+
+            if extension == "yaml":
+                with open(filepath) as source_data:
+                    old = timed(yaml.safe_load, source_data.read())
+                print(f"{'yaml safe_load':>16} | {size:>6.1f} | {old:>8.2f} | {'':>10} | {'':>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import core  # noqa: E402
+import menu  # noqa: E402
+from tournament_scaling import synthetic_roster  # noqa: E402
+
+# Usage: python benchmarks/info_scaling.py [max_rows]
+# Times process_info between two synthetic rosters, from 1k rows up to max_rows.
+
+
+def main() -> None:
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(42)
+
+    print(f"{'rows':>10} | {'roster s':>8} | {'dicts s':>8}")
+    rows = 1000
+    while rows <= max_rows:
+        roster_1 = synthetic_roster(rows, rng, 1)
+        roster_2 = synthetic_roster(rows, rng, 2)
+        set_1 = core.cast_to_set(roster_1)
+        set_2 = core.cast_to_set(roster_2)
+
+        start = time.perf_counter()
+        expected = menu.process_info(roster_1, roster_2, set_1, set_2, "pokemon", "pokemon")
+        roster_elapsed = time.perf_counter() - start
+
+        monsters_1 = list(roster_1)
+        monsters_2 = list(roster_2)
+        start = time.perf_counter()
+        info = menu.process_info(monsters_1, monsters_2, set_1, set_2, "pokemon", "pokemon")
+        dicts_elapsed = time.perf_counter() - start
+
+        assert info == expected
+        print(f"{rows:>10} | {roster_elapsed:>8.3f} | {dicts_elapsed:>8.3f}")
+        rows *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import core  # noqa: E402
+from synthetic_data import write_roster  # noqa: E402
+
+# Usage: python benchmarks/parallel_loading.py [files] [rows] [extension]
+# Loads the same synthetic files one after the other and with load_many, the cache is
+# disabled so every file is parsed.
+
+
+def main() -> None:
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    extension = sys.argv[3] if len(sys.argv) > 3 else "xml"
+    # Every file is bigger than a quarter of the cache, so none of them is cached.
+    core.cache.CACHE_MAX_SIZE = 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepaths = [os.path.join(directory, f"pokemons_{idx}.{extension}") for idx in range(total)]
+        for idx, filepath in enumerate(filepaths):
+            write_roster(filepath, rows, "pokemon", seed=idx)
+        monster_types = ["pokemon"] * total
+
+        start = time.perf_counter()
+        expected = [core.load_monsters(filepath, "pokemon") for filepath in filepaths]
+        sequential_elapsed = time.perf_counter() - start
+
+        print(f"{total} {extension} files of {rows} pokemons, {os.cpu_count()} CPUs")
+        print(f"{'workers':>10} | {'seconds':>8} | {'speedup':>8}")
+        print(f"{'sequential':>10} | {sequential_elapsed:>8.2f} | {1:>7.1f}x")
+        workers = 2
+        while workers <= max(2, total):
+            start = time.perf_counter()
+            rosters = core.load_many(filepaths, monster_types, workers)
+            elapsed = time.perf_counter() - start
+            assert [list(roster) for roster in rosters] == [list(roster) for roster in expected]
+            print(f"{workers:>10} | {elapsed:>8.2f} | {sequential_elapsed / elapsed:>7.1f}x")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+from core import io  # noqa: E402
+
+# Usage: python benchmarks/report_rendering.py [reports]
+# Renders the same digimon trivia reports with the old msg += concatenation and msg.format(**info),
+# and with the compiled DIGIMON_TRIVIA_REPORT template.
+
+break_line: str = (" " * 80) + "\n"
+
+
+def synthetic_infos(reports: int) -> List[Dict]:
+    """
+    This function returns the answers of many digimon trivia, each
+    one with different names.
+    """
+    stages = ["In-Training", "Baby", "Rookie", "Champion", "Ultimate", "Mega", "Ultra", "Armor", "None"]
+    types = ["Data", "Vaccine", "Virus", "Free"]
+    infos = []
+    for idx in range(reports):
+        infos.append(
+            dict(
+                total_trivia=str(150 + idx),
+                highest_atk_name=f"Chaosmon{idx}",
+                highest_atk_stage="Ultra",
+                highest_atk_type="Free",
+                lowest_atk_name=f"Botamon{idx}",
+                lowest_atk_stage="Baby",
+                lowest_atk_type="Data",
+                stage_groups=[
+                    dict(group_name=stage, total=str(idx % 40), strongest=f"{stage}mon{idx}", attack=str(idx % 300))
+                    for stage in stages
+                ],
+                type_groups=[
+                    dict(group_name=kind, total=str(idx % 50), strongest=f"{kind}mon{idx}", attack=str(idx % 300))
+                    for kind in types
+                ],
+                digimon_stages=stages,
+                stages_sum=str(len(stages)),
+                digimon_types=types,
+                types_sum=str(len(types)),
+            )
+        )
+    return infos
+
+
+def concatenated_report(digimon_info: Dict) -> str:
+    """
+    This function is the show_digimon_trivia message before the
+    templates, with the same lines built by concatenation.
+    """
+    msg = break_line
+    msg += "reported generated on: " + datetime.now().isoformat() + (" " * 31) + "\n"
+    msg += break_line
+    msg += ("=" * 29) + " Welcome to the Dex! " + ("=" * 30) + "\n"
+    msg += break_line
+    msg += "Here we have some useful information gathered from the list you provided us:    \n"
+    msg += break_line
+    msg += "1. How many Digimon there is in this list:" + (" " * 37) + "\n"
+    msg += (" " * 4) + "> " + digimon_info["total_trivia"] + " digimon"
+    msg += (" " * (25 - len(digimon_info["total_trivia"]))) + "\n"
+    msg += break_line
+    msg += "2. How many different stages a digimon have?" + (" " * 36) + "\n"
+    msg += (" " * 4) + "> In this list we have " + digimon_info["stages_sum"] + " stages of digimon, they're "
+    msg += " ".join(digimon_info["digimon_stages"]) + "\n"
+    msg += break_line
+    msg += "3. How many digimon in each stage there are?" + (" " * 36) + "\n"
+    for stage in digimon_info["stage_groups"]:
+        line = (" " * 4) + "> " + stage["group_name"] + ": " + stage["total"] + " digimon"
+        msg += line + (" " * (80 - len(line))) + "\n"
+    msg += break_line
+    msg += "4. The strongest digimon in each stage based on the Atk attribute is:" + (" " * 11) + "\n"
+    for stage in digimon_info["stage_groups"]:
+        line = (" " * 4) + "> " + stage["group_name"] + ": " + stage["strongest"] + ", " + stage["attack"]
+        msg += line + (" " * (80 - len(line))) + "\n"
+    msg += break_line
+    msg += "5. How many different types of digimon there is?" + (" " * 32) + "\n"
+    msg += (" " * 4) + "> In this list we have " + digimon_info["types_sum"] + " types of digimon, they're "
+    msg += " ".join(digimon_info["digimon_types"]) + "\n"
+    msg += break_line
+    msg += "6. How many digimon in each type there is:" + (" " * 38) + "\n"
+    for digimon_type in digimon_info["type_groups"]:
+        line = (" " * 4) + "> " + digimon_type["group_name"] + ": " + digimon_type["total"]
+        msg += line + (" " * (80 - len(line))) + "\n"
+    msg += break_line
+    msg += "7. The strongest digimon in each type based on the Atk attribute is:" + (" " * 11) + "\n"
+    for digimon_type in digimon_info["type_groups"]:
+        line = (" " * 4) + "> " + digimon_type["group_name"] + ": " + digimon_type["strongest"]
+        line += ", " + digimon_type["attack"]
+        msg += line + (" " * (80 - len(line))) + "\n"
+    msg += break_line
+    msg += "8. Which is the weakest digimon of all, based on the Atk attribute is:" + (" " * 10) + "\n"
+    msg += (" " * 4) + "> " + digimon_info["lowest_atk_name"] + ", on " + digimon_info["lowest_atk_stage"]
+    msg += " stage, " + digimon_info["lowest_atk_type"] + " type." + "\n"
+    msg += break_line
+    msg += "9. Which is the strongest digimon of all, based on the Atk attribute is:" + (" " * 8) + "\n"
+    msg += (" " * 4) + "> " + digimon_info["highest_atk_name"] + ", on " + digimon_info["highest_atk_stage"]
+    msg += " stage, " + digimon_info["highest_atk_type"] + " type." + "\n"
+    msg += break_line
+    msg += "Thanks for using this Dex!" + (" " * 50) + "\n"
+    msg += break_line
+    msg += break_line
+    msg += break_line
+    return msg.format(**digimon_info)
+
+
+def template_report(digimon_info: Dict) -> str:
+    """
+    This function renders the same message with the compiled template.
+    """
+    return io.DIGIMON_TRIVIA_REPORT.render(
+        dict(
+            digimon_info,
+            date=datetime.now().isoformat(),
+            digimon_stages=" ".join(digimon_info["digimon_stages"]),
+            digimon_types=" ".join(digimon_info["digimon_types"]),
+        )
+    )
+
+
+def timed(render: Callable[[Dict], str], infos: List[Dict]) -> float:
+    """
+    This function returns how many seconds rendering every report takes.
+    """
+    start = time.perf_counter()
+    for info in infos:
+        render(info)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    reports = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    infos = synthetic_infos(reports)
+
+    print(f"{reports} digimon trivia reports")
+    for name, render in (("concatenation", concatenated_report), ("template", template_report)):
+        elapsed = timed(render, infos)
+        print(f"{name:>14} | {elapsed:>6.2f}s | {reports / elapsed:>9.0f} reports/s")
+
+    # The old message was formatted again with the answers, a name with braces broke it.
+    braces = dict(infos[0], highest_atk_name="{Chaos}mon")
+    for name, render in (("concatenation", concatenated_report), ("template", template_report)):
+        try:
+            render(braces)
+            print(f"{name:>14} | a name with braces is rendered")
+        except (KeyError, IndexError, ValueError) as error:
+            print(f"{name:>14} | a name with braces fails: {type(error).__name__} {error}")
+
+
+if __name__ == "__main__":
+    main()
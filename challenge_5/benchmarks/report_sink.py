@@ -0,0 +1,107 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+from core import sink  # noqa: E402
+
+# Usage: python benchmarks/report_sink.py [reports]
+# Saves many reports like the show_* functions do: each one with its own fsync, then with the
+# background writer batching them, and checks that parallel processes appending to the same
+# file, or saving versions of it, never lose or mix a report.
+
+WORKERS: int = 4
+
+
+def report(worker: int, idx: int) -> str:
+    """
+    This function returns a report of 26 lines of 80 columns, like
+    the trivia ones, with its worker and number on every line.
+    """
+    return "".join(f"{worker:>4} {idx:>8} ".ljust(80, "=") + "\n" for _ in range(26))
+
+
+def append_reports(filepath: str, worker: int, reports: int) -> None:
+    """
+    This function is one of the parallel workers, it appends its
+    reports to the shared file.
+    """
+    report_sink = sink.ReportSink("append", sync=False)
+    for idx in range(reports):
+        report_sink.save(report(worker, idx), filepath)
+
+
+def version_reports(filepath: str, worker: int, reports: int) -> List[str]:
+    """
+    This function is one of the parallel workers, it saves each of its
+    reports in a new version of the shared file.
+    """
+    report_sink = sink.ReportSink("version", sync=False)
+    return [report_sink.save(report(worker, idx), filepath) for idx in range(reports)]
+
+
+def check_reports(text: str, reports: int) -> bool:
+    """
+    This function returns whether every report of every worker is in
+    the text once and whole, its 26 lines together.
+    """
+    lines = text.splitlines()
+    if len(lines) != WORKERS * reports * 26:
+        return False
+    blocks = [lines[start:start + 26] for start in range(0, len(lines), 26)]
+    if any(len(set(block)) != 1 for block in blocks):
+        return False
+    return len({block[0] for block in blocks}) == WORKERS * reports
+
+
+def main() -> None:
+    reports = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    directory = tempfile.mkdtemp()
+
+    print(f"{reports} reports appended to one file")
+    for name, background in (("fsync each", False), ("background", True)):
+        filepath = os.path.join(directory, f"{background}_append.txt")
+        report_sink = sink.ReportSink("append", background=background)
+        start = time.perf_counter()
+        for idx in range(reports):
+            report_sink.save(report(0, idx), filepath)
+        report_sink.close()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>12} | {elapsed:>6.2f}s | {reports / elapsed:>9.0f} reports/s")
+
+    print(f"\n{reports} reports overwriting one file")
+    for name, background in (("fsync each", False), ("background", True)):
+        filepath = os.path.join(directory, f"{background}_overwrite.txt")
+        report_sink = sink.ReportSink("overwrite", background=background)
+        start = time.perf_counter()
+        for idx in range(reports):
+            report_sink.save(report(0, idx), filepath)
+        report_sink.close()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>12} | {elapsed:>6.2f}s | {reports / elapsed:>9.0f} reports/s")
+
+    per_worker = max(reports // WORKERS, 1)
+    filepath = os.path.join(directory, "shared.txt")
+    with ProcessPoolExecutor(WORKERS) as executor:
+        list(executor.map(append_reports, [filepath] * WORKERS, range(WORKERS), [per_worker] * WORKERS))
+    with open(filepath, "r", encoding="utf-8") as source_data:
+        whole = check_reports(source_data.read(), per_worker)
+    print(f"\n{WORKERS} processes appending {per_worker} reports each, every report whole: {whole}")
+
+    filepath = os.path.join(directory, "versions.txt")
+    with ProcessPoolExecutor(WORKERS) as executor:
+        saved = sum(executor.map(version_reports, [filepath] * WORKERS, range(WORKERS), [per_worker] * WORKERS), [])
+    print(f"{WORKERS} processes saving {per_worker} versions each, different files: {len(set(saved)) == len(saved)}")
+
+    leftovers = [name for name in os.listdir(directory) if name.endswith(".tmp")]
+    print(f"temporary files left: {len(leftovers)}")
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
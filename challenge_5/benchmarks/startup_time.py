@@ -0,0 +1,133 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Set, Tuple
+
+# Usage: python benchmarks/startup_time.py [runs] [path/to/main.py]
+# Runs the CLI with python -X importtime for commands that don't need every format, and fails
+# (exit status 1) when one imports a module it shouldn't, or its imports take longer than the
+# budget. The wrapper scripts start the CLI thousands of times a day, the budget keeps it fast.
+
+DEX_MAIN: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex", "main.py")
+DATA_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+
+# The modules that are only needed by other formats, other commands or many files.
+FORMAT_MODULES: Set[str] = {"yaml", "csv", "xml.etree.ElementTree", "concurrent.futures", "multiprocessing"}
+
+# Each command, the modules it must not import, and the most milliseconds its imports can take,
+# the dex modules and everything they import, counted by -X importtime.
+COMMANDS: Dict[str, Tuple[List[str], Set[str], float]] = {
+    "help": (["--help"], FORMAT_MODULES | {"json", "pickle", "hashlib", "core.parser", "core.cache"}, 40.0),
+    "json trivia": (
+        ["--trivia", os.path.join(DATA_DIR, "pokemon", "json", "pokemons_1.json")],
+        FORMAT_MODULES,
+        60.0,
+    ),
+    "json info": (
+        [
+            "--player1",
+            os.path.join(DATA_DIR, "pokemon", "json", "pokemons_1.json"),
+            "--player2",
+            os.path.join(DATA_DIR, "pokemon", "json", "pokemons_2.json"),
+            "--info",
+        ],
+        FORMAT_MODULES,
+        60.0,
+    ),
+}
+
+
+def import_times(
+    dex_main: str, arguments: List[str], environment: Dict[str, str], directory: str
+) -> Tuple[float, Dict[str, int], Set[str]]:
+    """
+    This function runs the CLI once with -X importtime.
+
+    Returns
+    -------
+        The seconds the run took, the cumulative microseconds of each
+        module imported by the script itself, not by another module, so
+        the times don't count a module twice, and every module imported.
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", dex_main, *arguments],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=environment,
+        cwd=directory,
+        text=True,
+    )
+    elapsed = time.perf_counter() - start
+
+    modules: Dict[str, int] = {}
+    imported: Set[str] = set()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        imported.add(name.strip())
+        # The modules imported by other modules are indented under them.
+        if not name.startswith("  "):
+            modules[name.strip()] = int(cumulative)
+    return elapsed, modules, imported
+
+
+def dex_import_ms(modules: Dict[str, int]) -> float:
+    """
+    This function returns the milliseconds spent importing the dex
+    packages, core and menu, with the modules imported by them.
+    """
+    return sum(cumulative for name, cumulative in modules.items() if name.split(".")[0] in ("core", "menu")) / 1000
+
+
+def python_startup(environment: Dict[str, str], directory: str) -> float:
+    """
+    This function returns the seconds python takes to start and exit,
+    the part of every run that the CLI can't make faster.
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], env=environment, cwd=directory)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    dex_main = sys.argv[2] if len(sys.argv) > 2 else DEX_MAIN
+    directory = tempfile.mkdtemp()
+    environment = dict(os.environ, DEX_CACHE_DIR=os.path.join(directory, "cache"), DEX_ON_EXISTS="overwrite")
+
+    interpreter = min(python_startup(environment, directory) for _ in range(runs))
+    print(f"python -c pass: {interpreter * 1000:.1f} ms")
+
+    failed = False
+    for name, (arguments, forbidden, budget) in COMMANDS.items():
+        # The first run fills the cache, the wrapper scripts read the same files many times.
+        import_times(dex_main, arguments, environment, directory)
+        results = [import_times(dex_main, arguments, environment, directory) for _ in range(runs)]
+        elapsed = min(result[0] for result in results)
+        imports = min(dex_import_ms(result[1]) for result in results)
+        unexpected = sorted(forbidden.intersection(*(result[2] for result in results)))
+
+        status = "ok"
+        if unexpected or imports > budget:
+            status = "OVER BUDGET"
+            failed = True
+        timing = f"run {elapsed * 1000:>7.1f} ms | imports {imports:>6.1f} ms (budget {budget:.0f})"
+        print(f"{name:>12} | {timing} | {status}")
+        if unexpected:
+            print(f"{'':>12} | imported {', '.join(unexpected)}")
+
+    shutil.rmtree(directory)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
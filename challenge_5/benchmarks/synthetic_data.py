@@ -0,0 +1,120 @@
+import csv
+import json
+import os
+import random
+import sys
+from typing import Dict, Iterator, List, Union
+
+import yaml
+
+# Usage: python benchmarks/synthetic_data.py DIRECTORY [rows] [monster_type]
+# Writes the same synthetic roster as DIRECTORY/<monster_type>s_synthetic.{json,csv,xml,yaml},
+# with the keys and layout of the files in ../data.
+
+FIELDS: Dict[str, List[str]] = {
+    "pokemon": [
+        "Id", "Name", "Type 1", "Type 2", "Total", "HP", "Attack", "Defense",
+        "Sp. Atk", "Sp. Def", "Speed", "Generation", "Legendary",
+    ],
+    "digimon": [
+        "Id", "Name", "Stage", "Type", "Attribute", "Memory", "Equip Slots",
+        "HP", "SP", "Atk", "Def", "Int", "Spd", "Image link",
+    ],
+}
+
+# The xml tags can't have spaces or dots, the parser maps them back.
+XML_TAGS: Dict[str, str] = {
+    "Type 1": "Type1",
+    "Type 2": "Type2",
+    "Sp. Atk": "Sp_Atk",
+    "Sp. Def": "Sp_Def",
+    "Equip Slots": "Equip_Slots",
+    "Image link": "Image_link",
+}
+
+
+def synthetic_records(rows: int, monster_type: str, seed: int = 42) -> Iterator[Dict[str, Union[str, int]]]:
+    """
+    This function generates random monsters with the keys of the data files.
+
+    Parameters
+    ----------
+    rows:
+        How many monsters will be generated.
+    monster_type:
+        "pokemon" or "digimon".
+
+    Returns
+    -------
+        A generator of monster dicts.
+    """
+    rng = random.Random(seed)
+    for idx in range(rows):
+        if monster_type == "pokemon":
+            stats = [rng.randint(1, 255) for _ in range(6)]
+            yield {
+                "Id": idx, "Name": f"Mon{idx}", "Type 1": rng.choice(["Fire", "Water", "Grass"]),
+                "Type 2": rng.choice(["", "Flying", "Poison"]), "Total": sum(stats), "HP": stats[0],
+                "Attack": stats[1], "Defense": stats[2], "Sp. Atk": stats[3], "Sp. Def": stats[4],
+                "Speed": stats[5], "Generation": rng.randint(1, 8), "Legendary": rng.choice(["False", "True"]),
+            }
+        else:
+            yield {
+                "Id": idx, "Name": f"Mon{idx}", "Stage": rng.choice(["Rookie", "Champion", "Mega"]),
+                "Type": rng.choice(["Data", "Vaccine", "Virus", "Free"]), "Attribute": "Fire",
+                "Memory": rng.randint(1, 25), "Equip Slots": rng.randint(1, 3), "HP": rng.randint(500, 2000),
+                "SP": rng.randint(50, 300), "Atk": rng.randint(50, 300), "Def": rng.randint(50, 300),
+                "Int": rng.randint(50, 300), "Spd": rng.randint(50, 300),
+                "Image link": f"http://digidb.io/images/dot/dot{idx}.png",
+            }
+
+
+def write_roster(filepath: str, rows: int, monster_type: str, seed: int = 42) -> None:
+    """
+    This function writes a synthetic roster in the format of the
+    file extension.
+
+    Parameters
+    ----------
+    filepath:
+        The file to be written, ending in .json, .csv, .xml or .yaml.
+    rows:
+        How many monsters will be generated.
+    monster_type:
+        "pokemon" or "digimon".
+    """
+    records = synthetic_records(rows, monster_type, seed)
+    with open(filepath, "w") as target:
+        if filepath.endswith(".json"):
+            json.dump(list(records), target, indent=2)
+        elif filepath.endswith(".csv"):
+            writer = csv.DictWriter(target, fieldnames=FIELDS[monster_type])
+            writer.writeheader()
+            writer.writerows(records)
+        elif filepath.endswith(".xml"):
+            target.write('<?xml version="1.0" encoding="UTF-8" ?>\n<root>\n')
+            for idx, record in enumerate(records):
+                target.write(f"  <id{idx}>\n")
+                for key, value in record.items():
+                    tag = XML_TAGS.get(key, key)
+                    target.write(f"    <{tag}>{value}</{tag}>\n")
+                target.write(f"  </id{idx}>\n")
+            target.write("</root>\n")
+        else:
+            target.write("---\n")
+            dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+            for record in records:
+                target.write(yaml.dump([record], Dumper=dumper, sort_keys=False))
+
+
+def main() -> None:
+    directory = sys.argv[1]
+    rows = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    monster_type = sys.argv[3] if len(sys.argv) > 3 else "pokemon"
+    os.makedirs(directory, exist_ok=True)
+    for extension in ("json", "csv", "xml", "yaml"):
+        write_roster(os.path.join(directory, f"{monster_type}s_synthetic.{extension}"), rows, monster_type)
+
+
+if __name__ == "__main__":
+    main()
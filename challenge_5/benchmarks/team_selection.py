@@ -0,0 +1,41 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import menu  # noqa: E402
+from tournament_scaling import synthetic_roster  # noqa: E402
+
+# Usage: python benchmarks/team_selection.py [roster_size] [team_size]
+# Compares select_team with a full sort of the roster, and checks both pick the same team.
+
+
+def main() -> None:
+    roster_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    team_size = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    roster = synthetic_roster(roster_size, random.Random(42), 1)
+    monsters = list(roster)
+
+    start = time.perf_counter()
+    expected = sorted(monsters, key=menu.team_rank, reverse=True)[:team_size]
+    sort_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    team = menu.select_team(monsters, team_size)
+    heap_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    roster_team = menu.select_team(roster, team_size)
+    roster_elapsed = time.perf_counter() - start
+
+    assert team == expected and roster_team == expected
+    print(f"{roster_size} monsters, team size {team_size}")
+    print(f"full sort       {sort_elapsed:>8.3f}s")
+    print(f"heap (dicts)    {heap_elapsed:>8.3f}s  {sort_elapsed / heap_elapsed:>5.1f}x")
+    print(f"heap (columns)  {roster_elapsed:>8.3f}s  {sort_elapsed / roster_elapsed:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
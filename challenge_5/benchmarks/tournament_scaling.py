@@ -0,0 +1,82 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import core  # noqa: E402
+import menu  # noqa: E402
+
+# Usage: python benchmarks/tournament_scaling.py [players] [roster_size] [team_size]
+# Plays a round-robin tournament between synthetic rosters with 1, 2, 4... workers up to the CPU count.
+
+
+def synthetic_roster(size: int, rng: random.Random, player: int) -> core.Roster:
+    """
+    This function generates a roster of random pokemons.
+
+    Parameters
+    ----------
+    size:
+        How many pokemons will be generated.
+    rng:
+        The random generator, seeded by the caller.
+    player:
+        The player number, used in the pokemon names.
+
+    Returns
+    -------
+        The roster of the player.
+    """
+    monsters = []
+    for idx in range(size):
+        stats = [rng.randint(1, 255) for _ in range(6)]
+        monsters.append(
+            dict(
+                id=idx,
+                name=f"P{player}-Mon{idx}",
+                type1="Normal",
+                type2="",
+                total=sum(stats),
+                hp=stats[0],
+                attack=stats[1],
+                defense=stats[2],
+                spatk=stats[3],
+                spdef=stats[4],
+                speed=stats[5],
+                generation=1,
+                legendary=False,
+            )
+        )
+    return core.Roster.from_monsters(monsters, "pokemon")
+
+
+def main() -> None:
+    players = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    roster_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    team_size = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    rng = random.Random(42)
+    rosters = {f"player_{idx:04}": synthetic_roster(roster_size, rng, idx) for idx in range(players)}
+    # Each pair plays twice, once as each player.
+    battles = players * (players - 1)
+
+    print(f"{players} players, {battles} battles, team size {team_size}")
+    print(f"{'workers':>8} | {'seconds':>8} | {'battles/s':>10} | {'speedup':>8}")
+    expected = None
+    baseline = None
+    workers = 1
+    while workers <= max(2, os.cpu_count() or 1):
+        start = time.perf_counter()
+        standings = menu.run_tournament(rosters, team_size, workers)
+        elapsed = time.perf_counter() - start
+
+        if expected is None:
+            expected, baseline = standings, elapsed
+        assert standings == expected
+        print(f"{workers:>8} | {elapsed:>8.2f} | {battles / elapsed:>10.0f} | {baseline / elapsed:>7.1f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
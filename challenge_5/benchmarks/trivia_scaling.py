@@ -0,0 +1,86 @@
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterator, Union
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import menu  # noqa: E402
+
+# Usage: python benchmarks/trivia_scaling.py [max_rows]
+# The rows are generated on the fly, so 10M rows do not need 10M dicts in memory.
+
+
+def synthetic_pokemons(rows: int, seed: int = 42) -> Iterator[Dict[str, Union[str, int]]]:
+    """
+    This function generates random pokemons already in the
+    iter_monsters key format.
+
+    Parameters
+    ----------
+    rows:
+        How many pokemons will be generated.
+
+    Returns
+    -------
+        A generator of pokemon dicts.
+    """
+    rng = random.Random(seed)
+    for idx in range(rows):
+        yield dict(
+            id=idx,
+            name=f"Mon{idx}",
+            hp=rng.randint(1, 255),
+            attack=rng.randint(1, 255),
+            defense=rng.randint(1, 255),
+            speed=rng.randint(1, 255),
+        )
+
+
+def synthetic_digimons(rows: int, seed: int = 42) -> Iterator[Dict[str, Union[str, int]]]:
+    """
+    This function generates random digimons already in the
+    iter_monsters key format.
+
+    Parameters
+    ----------
+    rows:
+        How many digimons will be generated.
+
+    Returns
+    -------
+        A generator of digimon dicts.
+    """
+    rng = random.Random(seed)
+    stages = ["Baby", "In-Training", "Rookie", "Champion", "Ultimate", "Mega", "Ultra", "Armor", "None"]
+    types = ["Data", "Vaccine", "Virus", "Free"]
+    for idx in range(rows):
+        yield dict(
+            id=idx,
+            name=f"Digi{idx}",
+            stage=rng.choice(stages),
+            type1=rng.choice(types),
+            attack=rng.randint(1, 400),
+        )
+
+
+def main() -> None:
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rows = 1_000
+
+    print(f"{'rows':>12} | {'trivia':>8} | {'seconds':>10} | {'ns/row':>8}")
+    while rows <= max_rows:
+        for trivia, generator in (
+            ("pokemon", lambda: menu.pokemon_trivia(synthetic_pokemons(rows))),
+            ("digimon", lambda: menu.digimon_trivia(synthetic_digimons(rows))),
+        ):
+            start = time.perf_counter()
+            generator()
+            elapsed = time.perf_counter() - start
+            print(f"{rows:>12} | {trivia:>8} | {elapsed:>10.3f} | {elapsed / rows * 1e9:>8.0f}")
+        rows *= 10
+
+
+if __name__ == "__main__":
+    main()
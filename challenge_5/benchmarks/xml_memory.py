@@ -0,0 +1,102 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import xmltodict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import core  # noqa: E402
+
+# Usage: python benchmarks/xml_memory.py [rows]
+# Compares the peak memory of the old xmltodict path with the incremental reader.
+
+POKEMON_XML = """    <id{idx}>
+        <Id>{idx}</Id>
+        <Name>Mon{idx}</Name>
+        <Type1>Dragon</Type1>
+        <Type2></Type2>
+        <Total>410</Total>
+        <HP>68</HP>
+        <Attack>90</Attack>
+        <Defense>65</Defense>
+        <Sp_Atk>50</Sp_Atk>
+        <Sp_Def>55</Sp_Def>
+        <Speed>82</Speed>
+        <Generation>4</Generation>
+        <Legendary>False</Legendary>
+    </id{idx}>
+"""
+
+
+def write_xml(rows: int) -> str:
+    """
+    This function writes a pokemon xml file with the given
+    amount of rows and returns its path.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".xml", delete=False) as target:
+        target.write('<?xml version="1.0" encoding="UTF-8" ?>\n<root>\n')
+        for idx in range(rows):
+            target.write(POKEMON_XML.format(idx=idx))
+        target.write("</root>\n")
+    return target.name
+
+
+def xmltodict_path(filepath: str) -> int:
+    """
+    This function is the xml branch of read_file before the incremental reader.
+    """
+    with open(filepath, "r") as source_data:
+        file = source_data.read()
+        file_xml = xmltodict.parse(file)
+        dict_id = {key: value for key, value in file_xml["root"].items()}
+        data_read = []
+        for key, value in dict_id.items():
+            data_read += [{key_list: value_list for key_list, value_list in value.items()}]
+    return len(data_read)
+
+
+def pullparser_path(filepath: str) -> int:
+    """
+    This function consumes iter_records without keeping the monsters.
+    """
+    total = 0
+    for _ in core.iter_records(filepath):
+        total += 1
+    return total
+
+
+def measure(reader: Callable[[str], int], filepath: str) -> Tuple[int, float, int]:
+    """
+    This function returns the rows read, the seconds spent and the
+    peak of memory allocated by the reader.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = reader(filepath)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    filepath = write_xml(rows)
+    size = os.path.getsize(filepath)
+    try:
+        print(f"file: {rows} rows, {size / 2**20:.1f} MiB")
+        print(f"{'reader':>10} | {'seconds':>8} | {'peak MiB':>9} | {'peak/file':>9}")
+        for name, reader in (("xmltodict", xmltodict_path), ("pullparser", pullparser_path)):
+            total, elapsed, peak = measure(reader, filepath)
+            assert total == rows
+            print(f"{name:>10} | {elapsed:>8.2f} | {peak / 2**20:>9.1f} | {peak / size:>9.2f}")
+    finally:
+        os.remove(filepath)
+
+
+if __name__ == "__main__":
+    main()
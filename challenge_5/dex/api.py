@@ -0,0 +1,110 @@
+import json
+import os
+import service
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from typing import AsyncIterator, List, Tuple
+
+# Usage: uvicorn api:app --app-dir dex, or python3 dex/api.py
+# GET /trivia?roster=pokemon/json/pokemons_1.json
+# GET /info?player1=digimon/json/digimons_1.json&player2=digimon/csv/digimons_2.csv
+# GET /battle?player1=pokemon/json/pokemons_1.json&player2=pokemon/yaml/pokemons_2.yaml&team_size=3
+# The roster IDs are paths inside DEX_DATA_DIR, the answers are the ones of the CLI as json.
+API_HOST: str = os.environ.get("DEX_API_HOST", "127.0.0.1")
+API_PORT: int = int(os.environ.get("DEX_API_PORT", 8000))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    This function starts the process pool of the CPU bound work, and
+    the answers cache, when the server starts, and stops them with it.
+    """
+    app.state.executor = ProcessPoolExecutor(max_workers=service.API_WORKERS)
+    app.state.results = service.ResultCache()
+    yield
+    app.state.executor.shutdown(cancel_futures=True)
+
+
+app = FastAPI(title="Monster Dex", lifespan=lifespan)
+
+
+def rosters(*roster_ids: str) -> Tuple[List[str], str]:
+    """
+    This function returns the files and monster type of the rosters
+    of a request, or answers it with the error.
+    """
+    try:
+        return service.resolve_rosters(list(roster_ids))
+    except FileNotFoundError as error:
+        raise HTTPException(status_code=404, detail=str(error))
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error))
+
+
+async def run(request: Request, key: Tuple, *args) -> bytes:
+    """
+    This function returns the json answers of a request from the
+    cache, or runs it in the process pool, the event loop only waits
+    for it. When the answers can't be made of the rosters, it answers 422.
+    """
+    try:
+        return await request.app.state.results.get(key, request.app.state.executor, *args)
+    except ValueError as error:
+        raise HTTPException(status_code=422, detail=str(error))
+
+
+async def answers(request: Request, key: Tuple, *args) -> Response:
+    """
+    This function answers a request with the json answers of run.
+    """
+    return Response(content=await run(request, key, *args), media_type="application/json")
+
+
+@app.get("/trivia", response_model=None)
+async def trivia(request: Request, roster: str) -> Response:
+    """
+    This function returns the AnswersPokemonTrivia or the
+    AnswersDigimonTrivia of a roster.
+    """
+    (filepath,), monster_type = rosters(roster)
+    key = ("trivia", await service.content_hash(filepath), monster_type)
+    return await answers(request, key, service.trivia_answers, filepath, monster_type)
+
+
+@app.get("/info", response_model=None)
+async def info(request: Request, player1: str, player2: str) -> Response:
+    """
+    This function returns the AnswersInfo of two rosters.
+    """
+    (filepath_1, filepath_2), monster_type = rosters(player1, player2)
+    key = ("info", await service.content_hash(filepath_1), await service.content_hash(filepath_2), monster_type)
+    return await answers(request, key, service.info_answers, filepath_1, filepath_2, monster_type)
+
+
+@app.get("/battle", response_model=None)
+async def battle(
+    request: Request, player1: str, player2: str, team_size: int = Query(3, ge=1, le=service.MAX_TEAM_SIZE)
+) -> Response:
+    """
+    This function returns the AnswersResult of the battle of two
+    rosters, it is the same every time for the same rosters.
+    """
+    (filepath_1, filepath_2), monster_type = rosters(player1, player2)
+    digest_1 = await service.content_hash(filepath_1)
+    digest_2 = await service.content_hash(filepath_2)
+    # The sizes are cached like the answers, a team too big never reaches the battle.
+    for roster_id, filepath, digest in ((player1, filepath_1, digest_1), (player2, filepath_2, digest_2)):
+        body = await run(request, ("size", digest, monster_type), service.roster_size, filepath, monster_type)
+        if team_size > json.loads(body)["size"]:
+            raise HTTPException(status_code=422, detail=f"Team size bigger than the monster list of {roster_id}.")
+
+    key = ("battle", digest_1, digest_2, monster_type, team_size)
+    return await answers(request, key, service.battle_answers, filepath_1, filepath_2, monster_type, team_size)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(app, host=API_HOST, port=API_PORT)
@@ -0,0 +1,84 @@
+import json
+import os
+import socket
+import sys
+from typing import Dict, List, Union
+
+# The socket of the daemon started by main.py --serve, the client only imports what it needs
+# to talk to it.
+SOCKET_PATH: str = os.environ.get(
+    "DEX_SOCKET", os.path.join(os.environ.get("XDG_RUNTIME_DIR", "/tmp"), f"dex-{os.getuid()}.sock")
+)
+# The environment variables sent with a request, the daemon was started with its own.
+FORWARDED_ENV: List[str] = ["DEX_ON_EXISTS"]
+
+
+def receive_all(connection: socket.socket) -> bytes:
+    """
+    This function reads a message until the other side closes its end
+    of the connection.
+
+    Parameters
+    ----------
+    connection:
+        The connected socket.
+
+    Returns
+    -------
+        The whole message.
+    """
+    chunks = []
+    while True:
+        chunk = connection.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
+def send_request(arguments: List[str], socket_path: str = SOCKET_PATH) -> Dict[str, Union[str, int]]:
+    """
+    This function runs the CLI arguments in the daemon, from the
+    current directory, so relative paths and reports work like a run
+    of main.py.
+
+    Parameters
+    ----------
+    arguments:
+        The arguments of main.py, without the script name.
+
+    socket_path:
+        The socket of the daemon.
+
+    Returns
+    -------
+        The stdout, stderr and exit status of the run.
+    """
+    request = dict(
+        args=arguments,
+        cwd=os.getcwd(),
+        env={name: os.environ[name] for name in FORWARDED_ENV if name in os.environ},
+    )
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall(json.dumps(request).encode("utf-8"))
+        connection.shutdown(socket.SHUT_WR)
+        return json.loads(receive_all(connection).decode("utf-8"))
+
+
+def main() -> None:
+    try:
+        response = send_request(sys.argv[1:])
+    except (FileNotFoundError, ConnectionRefusedError):
+        # No daemon is running, the command runs in this process instead.
+        import runpy
+
+        runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py"), run_name="__main__")
+        return
+
+    sys.stdout.write(str(response["stdout"]))
+    sys.stderr.write(str(response["stderr"]))
+    sys.exit(int(response["status"]))
+
+
+if __name__ == "__main__":
+    main()
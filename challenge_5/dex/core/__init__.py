@@ -1,19 +1,65 @@
-from core.io import (
-    client_helper,
-    client_usage,
-    data_saver,
-    show_battle_winner,
-    show_info_pokemon,
-    show_info_digimon,
-    show_pokemon_trivia,
-    show_digimon_trivia,
-)
-from core.formatter import cast_to_bool, cast_to_int, cast_to_set, cast_to_lower
-from core.parser import read_file
-from core.basic_types import (
-    AnswersPokemonTrivia,
-    AnswersDigimonTrivia,
-    AnswersBattle,
-    AnswersResult,
-    AnswersInfo,
-)
+from importlib import import_module
+from typing import Any, Dict, List
+
+# The names exported by core, by module. A module is imported the first time one of its
+# names is used, so --help doesn't import the parsers, and a json run doesn't import yaml.
+MODULE_EXPORTS: Dict[str, List[str]] = {
+    "core.io": [
+        "client_helper",
+        "client_usage",
+        "data_saver",
+        "show_battle_winner",
+        "show_info_pokemon",
+        "show_info_digimon",
+        "show_pokemon_trivia",
+        "show_digimon_trivia",
+        "show_tournament_standings",
+        "show_compare",
+        "save_compare_json",
+    ],
+    "core.report": ["ReportTemplate", "ReportSection", "REPORT_WIDTH"],
+    "core.sink": ["ReportSink", "configure_report_sink", "report_sink", "ON_EXISTS_MODES", "ON_EXISTS"],
+    "core.formatter": [
+        "cast_to_bool",
+        "cast_to_int",
+        "cast_to_str",
+        "cast_to_set",
+        "cast_to_sketch",
+        "monster_decoder",
+        "iter_decode_monsters",
+        "MONSTER_SCHEMAS",
+    ],
+    "core.parser": ["read_file", "iter_records", "iter_monsters"],
+    "core.roster": ["Roster", "StringTable"],
+    "core.aggregator": ["StatAggregator", "GroupAggregator", "RosterStats"],
+    "core.cache": ["load_monsters", "cached_roster", "clear_cache", "remember_roster", "stale_rosters", "file_digest"],
+    "core.loader": ["load_many"],
+    "core.sketch": ["HyperLogLog", "MinHash", "NameSketch", "sketch_roster", "DEFAULT_APPROX_ERROR"],
+    "core.basic_types": [
+        "AnswersPokemonTrivia",
+        "AnswersDigimonTrivia",
+        "MonsterGroup",
+        "AnswersBattle",
+        "AnswersResult",
+        "AnswersInfo",
+        "TournamentStanding",
+        "AnswersCompare",
+    ],
+}
+EXPORTS: Dict[str, str] = {name: module for module, names in MODULE_EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    This function imports the module of an exported name the first
+    time it is used, and keeps the name in core for the next uses.
+    """
+    if name not in EXPORTS:
+        raise AttributeError(f"module 'core' has no attribute {name!r}")
+    value = getattr(import_module(EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(EXPORTS))
@@ -0,0 +1,300 @@
+from core.roster import Roster
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+# The stats asked by the info and the trivia of each monster type.
+ROSTER_STATS: Dict[str, List[str]] = {
+    "pokemon": ["hp", "attack", "defense", "speed"],
+    "digimon": ["attack"],
+}
+
+# The field and value that make a monster special, counted in the info.
+SPECIAL_MONSTERS: Dict[str, Tuple[str, Union[str, bool]]] = {
+    "pokemon": ("legendary", True),
+    "digimon": ("stage", "Ultra"),
+}
+
+
+class StatAggregator:
+    """
+    This class keeps the running highest and lowest monster for
+    each stat while the monsters are consumed one at a time, so the
+    whole list is visited only once and never sorted.
+
+    When two monsters have the same value the first one seen is kept,
+    the same result a stable sort would give.
+
+    Parameters
+    ----------
+    stats:
+        The stat names to be tracked, e.g. ["hp", "attack"].
+    """
+
+    def __init__(self, stats: List[str]) -> None:
+        self.stats = stats
+        self.total = 0
+        self.highest: Dict[str, Dict[str, Union[str, int]]] = {}
+        self.lowest: Dict[str, Dict[str, Union[str, int]]] = {}
+
+    def update(self, monster: Dict[str, Union[str, int]]) -> None:
+        """
+        This function adds one monster to the running results.
+
+        Parameters
+        ----------
+        monster:
+            The monster dict, it must have every tracked stat.
+        """
+        self.total += 1
+        for stat in self.stats:
+            value = monster[stat]
+            highest = self.highest.get(stat)
+            if highest is None or value > highest[stat]:
+                self.highest[stat] = monster
+            lowest = self.lowest.get(stat)
+            if lowest is None or value < lowest[stat]:
+                self.lowest[stat] = monster
+
+    def consume(self, monsters: Iterable[Dict[str, Union[str, int]]]) -> "StatAggregator":
+        """
+        This function adds every monster of an iterable, it can be a
+        list, a generator or a Roster, to the running results.
+
+        Parameters
+        ----------
+        monsters:
+            The monsters to be added.
+
+        Returns
+        -------
+        self:
+            The same aggregator, so the calls can be chained.
+        """
+        if isinstance(monsters, Roster):
+            return self.consume_roster(monsters, range(len(monsters)))
+
+        update = self.update
+        for monster in monsters:
+            update(monster)
+        return self
+
+    def consume_roster(self, roster: Roster, indexes: Sequence[int]) -> "StatAggregator":
+        """
+        This function adds some monsters of a roster to the running
+        results, scanning only the stat columns.
+
+        Parameters
+        ----------
+        roster:
+            The roster with the monsters.
+
+        indexes:
+            The positions of the monsters to be added.
+
+        Returns
+        -------
+        self:
+            The same aggregator, so the calls can be chained.
+        """
+        if not indexes:
+            return self
+
+        self.total += len(indexes)
+        whole_roster = len(indexes) == len(roster)
+        for stat in self.stats:
+            column = roster.column(stat)
+            # max, min and index return the first position found, like update does on ties.
+            if whole_roster:
+                highest_idx = column.index(max(column))
+                lowest_idx = column.index(min(column))
+            else:
+                highest_idx = max(indexes, key=column.__getitem__)
+                lowest_idx = min(indexes, key=column.__getitem__)
+            highest = self.highest.get(stat)
+            if highest is None or column[highest_idx] > highest[stat]:
+                self.highest[stat] = roster[highest_idx]
+            lowest = self.lowest.get(stat)
+            if lowest is None or column[lowest_idx] < lowest[stat]:
+                self.lowest[stat] = roster[lowest_idx]
+        return self
+
+    def max_of(self, stat: str) -> Optional[Dict[str, Union[str, int]]]:
+        """
+        This function returns the monster with the highest value
+        for the given stat, or None if no monster was added.
+        """
+        return self.highest.get(stat)
+
+    def min_of(self, stat: str) -> Optional[Dict[str, Union[str, int]]]:
+        """
+        This function returns the monster with the lowest value
+        for the given stat, or None if no monster was added.
+        """
+        return self.lowest.get(stat)
+
+
+class GroupAggregator:
+    """
+    This class groups the monsters by the value of one key, e.g.
+    "stage" or "type1", and keeps a StatAggregator for each group.
+
+    The groups are discovered while the monsters are consumed, and
+    only the running results are stored, so the memory depends on
+    the number of groups and not on the number of monsters.
+
+    Parameters
+    ----------
+    key:
+        The monster key used to group them.
+
+    stats:
+        The stat names to be tracked in each group.
+    """
+
+    def __init__(self, key: str, stats: List[str]) -> None:
+        self.key = key
+        self.stats = stats
+        self.groups: Dict[str, StatAggregator] = {}
+
+    def update(self, monster: Dict[str, Union[str, int]]) -> None:
+        """
+        This function adds one monster to its group.
+
+        Parameters
+        ----------
+        monster:
+            The monster dict, it must have the group key and
+            every tracked stat.
+        """
+        group_name = str(monster[self.key])
+        group = self.groups.get(group_name)
+        if group is None:
+            group = self.groups[group_name] = StatAggregator(self.stats)
+        group.update(monster)
+
+    def consume(self, monsters: Iterable[Dict[str, Union[str, int]]]) -> "GroupAggregator":
+        """
+        This function adds every monster of an iterable to its group.
+
+        Parameters
+        ----------
+        monsters:
+            The monsters to be added.
+
+        Returns
+        -------
+        self:
+            The same aggregator, so the calls can be chained.
+        """
+        if isinstance(monsters, Roster):
+            for group_name, indexes in monsters.group_indexes(self.key).items():
+                group = self.groups.get(group_name)
+                if group is None:
+                    group = self.groups[group_name] = StatAggregator(self.stats)
+                group.consume_roster(monsters, indexes)
+            return self
+
+        update = self.update
+        for monster in monsters:
+            update(monster)
+        return self
+
+    def ordered(self, known_order: Iterable[str] = ()) -> List[str]:
+        """
+        This function returns the group names, the ones listed in
+        known_order come first in that order and the others follow
+        in alphabetical order.
+
+        Parameters
+        ----------
+        known_order:
+            The preferred order for the group names.
+
+        Returns
+        -------
+            The group names.
+        """
+        position = {name: idx for idx, name in enumerate(known_order)}
+        return sorted(self.groups, key=lambda name: (position.get(name, len(position)), name))
+
+
+class RosterStats:
+    """
+    This class gathers, in a single pass, the statistics of one
+    roster used by both the info and the trivia: how many monsters
+    there are, the highest and lowest of each stat, and how many are
+    special, legendary for pokemon or on the Ultra stage for digimon.
+
+    The same object can be passed to process_info and to the trivia,
+    so a roster already visited doesn't need to be visited again.
+
+    Parameters
+    ----------
+    monster_type:
+        "pokemon" or "digimon".
+
+    stats:
+        The stat names to be tracked, every stat in ROSTER_STATS
+        for the monster type by default.
+    """
+
+    def __init__(self, monster_type: str, stats: Optional[List[str]] = None) -> None:
+        self.monster_type = monster_type
+        self.special_field, self.special_value = SPECIAL_MONSTERS[monster_type]
+        self.stats = StatAggregator(ROSTER_STATS[monster_type] if stats is None else stats)
+        self.special = 0
+
+    @property
+    def total(self) -> int:
+        return self.stats.total
+
+    def update(self, monster: Dict[str, Union[str, int]]) -> None:
+        """
+        This function adds one monster to the statistics.
+
+        Parameters
+        ----------
+        monster:
+            The monster dict with the patterned keys.
+        """
+        self.stats.update(monster)
+        if monster[self.special_field] == self.special_value:
+            self.special += 1
+
+    def consume(self, monsters: Iterable[Dict[str, Union[str, int]]]) -> "RosterStats":
+        """
+        This function adds every monster of an iterable, it can be a
+        list, a generator or a Roster, to the statistics.
+
+        Parameters
+        ----------
+        monsters:
+            The monsters to be added.
+
+        Returns
+        -------
+        self:
+            The same statistics, so the calls can be chained.
+        """
+        if isinstance(monsters, Roster):
+            self.stats.consume(monsters)
+            self.special += monsters.count(self.special_field, self.special_value)
+            return self
+
+        update = self.update
+        for monster in monsters:
+            update(monster)
+        return self
+
+    def max_of(self, stat: str) -> Optional[Dict[str, Union[str, int]]]:
+        """
+        This function returns the monster with the highest value
+        for the given stat, or None if no monster was added.
+        """
+        return self.stats.max_of(stat)
+
+    def min_of(self, stat: str) -> Optional[Dict[str, Union[str, int]]]:
+        """
+        This function returns the monster with the lowest value
+        for the given stat, or None if no monster was added.
+        """
+        return self.stats.min_of(stat)
@@ -13,6 +13,13 @@ class AnswersPokemonTrivia(TypedDict):
     spd_trivia_points: int
 
 
+class MonsterGroup(TypedDict):
+    group_name: str
+    total: str
+    strongest: str
+    attack: str
+
+
 class AnswersDigimonTrivia(TypedDict):
     total_trivia: int
     highest_atk_name: int
@@ -21,36 +28,8 @@ class AnswersDigimonTrivia(TypedDict):
     lowest_atk_name: str
     lowest_atk_stage: str
     lowest_atk_type: str
-    total_baby: int
-    total_rookie: int
-    total_champion: int
-    total_ultimate: int
-    total_mega: int
-    total_ultra: int
-    total_data: int
-    total_vaccine: int
-    total_virus: int
-    total_free: int
-    baby_strongest: str
-    baby_attack: int
-    rookie_strongest: str
-    rookie_attack: int
-    champion_strongest: str
-    champion_attack: int
-    ultimate_strongest: str
-    ultimate_attack: int
-    mega_strongest: str
-    mega_attack: int
-    ultra_strongest: str
-    ultra_attack: int
-    data_strongest: str
-    data_attack: int
-    vaccine_strongest: str
-    vaccine_attack: int
-    virus_strongest: str
-    virus_attack: int
-    free_strongest: str
-    free_attack: int
+    stage_groups: List[MonsterGroup]
+    type_groups: List[MonsterGroup]
     digimon_types: List[str]
     types_sum: int
     digimon_stages: List[str]
@@ -102,3 +81,21 @@ class AnswersResult(TypedDict):
     winner: str
     rounds: str
     loser_monster: str
+
+
+class TournamentStanding(TypedDict):
+    player: str
+    battles: int
+    wins: int
+    losses: int
+    rounds: int
+
+
+class AnswersCompare(TypedDict):
+    players: List[str]
+    totals: List[int]
+    distinct: List[int]
+    unique: List[int]
+    intersection: List[List[int]]
+    jaccard: List[List[float]]
+    name_frequency: Dict[str, int]
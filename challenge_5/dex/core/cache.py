@@ -0,0 +1,435 @@
+"""
+The cache keeps the rosters already read and decoded by iter_monsters,
+so the next runs with the same file don't need to parse it again.
+
+The entries are pickles, and loading a pickle can run any code, so
+DEX_CACHE_DIR is trusted input: it must be writable only by the user
+running the dex.
+"""
+import core
+import hashlib
+import json
+import os
+import pickle
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows, the index is updated without a lock.
+    fcntl = None  # type: ignore
+
+CACHE_DIR: str = os.environ.get("DEX_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "dex"))
+CACHE_MAX_SIZE: int = int(os.environ.get("DEX_CACHE_MAX_SIZE", 64 * 1024 * 1024))
+CACHE_INDEX: str = "index.json"
+CACHE_LOCK: str = "index.lock"
+CACHE_VERSION: int = 3
+
+# The rosters already loaded by this process, by full path and monster type, with the size
+# and mtime of the file when it was read. A long running process, like the daemon, gets them
+# back without reading the index or the pickle again, the least recently used are dropped.
+MEMORY_MAX_ROSTERS: int = int(os.environ.get("DEX_MEMORY_ROSTERS", 64))
+MEMORY_CACHE: Dict[Tuple[str, str], Tuple[int, int, core.Roster]] = {}
+
+
+def file_digest(filepath: str) -> str:
+    """
+    This function returns the sha256 of the file content.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    Returns
+    -------
+        The hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as source_data:
+        for chunk in iter(lambda: source_data.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_index() -> Dict[str, Dict[str, Union[str, int]]]:
+    """
+    This function reads the cache index, it maps each file path to
+    the size, mtime and digest seen the last time it was cached.
+
+    Returns
+    -------
+        The index, or an empty dict if it doesn't exist.
+    """
+    try:
+        with open(os.path.join(CACHE_DIR, CACHE_INDEX), "r") as source_data:
+            return json.load(source_data)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_index(index: Dict[str, Dict[str, Union[str, int]]]) -> None:
+    """
+    This function saves the cache index, writing a temporary file
+    first so a reader never finds it half written. It must be called
+    holding index_lock.
+
+    Parameters
+    ----------
+    index:
+        The index to be saved.
+    """
+    index_path = os.path.join(CACHE_DIR, CACHE_INDEX)
+    with open(f"{index_path}.{os.getpid()}.tmp", "w") as target:
+        json.dump(index, target)
+    os.replace(f"{index_path}.{os.getpid()}.tmp", index_path)
+
+
+@contextmanager
+def index_lock() -> Iterator[None]:
+    """
+    This function holds an exclusive lock of the cache index, so the
+    processes of load_many reading, changing and saving it at the
+    same time don't lose the entries of each other.
+    """
+    descriptor = os.open(os.path.join(CACHE_DIR, CACHE_LOCK), os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the file also releases the lock.
+        os.close(descriptor)
+
+
+def update_index(full_path: str, entry: Dict[str, Union[str, int]]) -> None:
+    """
+    This function saves the entry of one file in the cache index,
+    keeping the entries saved by the other processes.
+
+    Parameters
+    ----------
+    full_path:
+        The full path of the file.
+
+    entry:
+        The size, mtime and digest of the file.
+    """
+    with index_lock():
+        index = read_index()
+        index[full_path] = entry
+        write_index(index)
+
+
+def cache_key(filepath: str, monster_type: str) -> str:
+    """
+    This function returns the cache entry name of a file.
+
+    The file path, size and mtime are compared with the index first,
+    the content is hashed only when one of them changed.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    monster_type:
+        "pokemon" or "digimon".
+
+    Returns
+    -------
+        The entry name, made of the content digest and the monster type.
+    """
+    full_path = os.path.abspath(filepath)
+    file_stat = os.stat(full_path)
+    entry = read_index().get(full_path)
+
+    if entry and entry["size"] == file_stat.st_size and entry["mtime"] == file_stat.st_mtime_ns:
+        digest = str(entry["digest"])
+    else:
+        digest = file_digest(full_path)
+        update_index(full_path, dict(size=file_stat.st_size, mtime=file_stat.st_mtime_ns, digest=digest))
+
+    return f"{digest}_{monster_type}_v{CACHE_VERSION}.pickle"
+
+
+def cache_load(key: str) -> Optional[core.Roster]:
+    """
+    This function loads a cache entry, marking it as the most
+    recently used.
+
+    Parameters
+    ----------
+    key:
+        The entry name returned by cache_key.
+
+    Returns
+    -------
+        The roster, or None if the entry doesn't exist.
+    """
+    entry_path = os.path.join(CACHE_DIR, key)
+    try:
+        with open(entry_path, "rb") as source_data:
+            roster = pickle.load(source_data)
+        os.utime(entry_path)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError):
+        return None
+    return roster if isinstance(roster, core.Roster) else None
+
+
+def cache_store(key: str, roster: core.Roster) -> None:
+    """
+    This function saves the roster in a cache entry and evicts
+    the least recently used entries above CACHE_MAX_SIZE.
+
+    The roster columns are arrays, so the entry is close to the
+    size of the numbers and strings it has.
+
+    Parameters
+    ----------
+    key:
+        The entry name returned by cache_key.
+
+    roster:
+        The roster to be saved.
+    """
+    entry_path = os.path.join(CACHE_DIR, key)
+    with open(f"{entry_path}.{os.getpid()}.tmp", "wb") as target:
+        pickle.dump(roster, target, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{entry_path}.{os.getpid()}.tmp", entry_path)
+    cache_evict(CACHE_MAX_SIZE)
+
+
+def cache_evict(max_size: int) -> int:
+    """
+    This function removes the least recently used entries until
+    the cache is smaller than max_size.
+
+    Parameters
+    ----------
+    max_size:
+        The maximum size of the cache in bytes.
+
+    Returns
+    -------
+        How many entries were removed.
+    """
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".pickle"):
+            entry_stat = os.stat(os.path.join(CACHE_DIR, name))
+            entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, name))
+
+    total_size = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, name in sorted(entries):
+        if total_size <= max_size:
+            break
+        os.remove(os.path.join(CACHE_DIR, name))
+        total_size -= size
+        removed += 1
+    return removed
+
+
+def memory_roster(filepath: str, monster_type: str) -> Optional[core.Roster]:
+    """
+    This function returns the roster of a file kept in memory by this
+    process, only when the file size and mtime didn't change.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    monster_type:
+        "pokemon" or "digimon".
+
+    Returns
+    -------
+        The roster, or None if the file must be loaded.
+    """
+    key = (os.path.abspath(filepath), monster_type)
+    entry = MEMORY_CACHE.pop(key, None)
+    if entry is None:
+        return None
+
+    file_stat = os.stat(key[0])
+    if entry[0] != file_stat.st_size or entry[1] != file_stat.st_mtime_ns:
+        return None
+    # Added again at the end, the dict order is the use order.
+    MEMORY_CACHE[key] = entry
+    return entry[2]
+
+
+def remember_roster(filepath: str, monster_type: str, roster: core.Roster) -> None:
+    """
+    This function keeps the roster of a file in memory, with the size
+    and mtime the file has now.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    monster_type:
+        "pokemon" or "digimon".
+
+    roster:
+        The roster read from the file.
+    """
+    key = (os.path.abspath(filepath), monster_type)
+    file_stat = os.stat(key[0])
+    MEMORY_CACHE.pop(key, None)
+    MEMORY_CACHE[key] = (file_stat.st_size, file_stat.st_mtime_ns, roster)
+    while len(MEMORY_CACHE) > MEMORY_MAX_ROSTERS:
+        del MEMORY_CACHE[next(iter(MEMORY_CACHE))]
+
+
+def stale_rosters() -> List[Tuple[str, str]]:
+    """
+    This function drops the rosters in memory whose file changed or
+    was removed since it was read.
+
+    Returns
+    -------
+        The full path and monster type of each roster dropped whose
+        file still exists, so it can be loaded again.
+    """
+    stale = []
+    for key, (size, mtime, _) in list(MEMORY_CACHE.items()):
+        try:
+            file_stat = os.stat(key[0])
+        except OSError:
+            del MEMORY_CACHE[key]
+            continue
+        if size != file_stat.st_size or mtime != file_stat.st_mtime_ns:
+            del MEMORY_CACHE[key]
+            stale.append(key)
+    return stale
+
+
+def clear_cache(filepath: Optional[str] = None) -> int:
+    """
+    This function invalidates the cache, only for one file when
+    filepath is given, or everything otherwise.
+
+    Parameters
+    ----------
+    filepath:
+        The file to be invalidated, or None for the whole cache.
+
+    Returns
+    -------
+        How many entries were removed.
+    """
+    if filepath is None:
+        MEMORY_CACHE.clear()
+    else:
+        for key in [key for key in MEMORY_CACHE if key[0] == os.path.abspath(filepath)]:
+            del MEMORY_CACHE[key]
+
+    if not os.path.isdir(CACHE_DIR):
+        return 0
+
+    with index_lock():
+        index = read_index()
+        if filepath is None:
+            names = [name for name in os.listdir(CACHE_DIR) if name.endswith(".pickle")]
+            index = {}
+        else:
+            entry = index.pop(os.path.abspath(filepath), None)
+            digest = str(entry["digest"]) if entry else file_digest(filepath)
+            names = [name for name in os.listdir(CACHE_DIR) if name.startswith(f"{digest}_")]
+
+        for name in names:
+            os.remove(os.path.join(CACHE_DIR, name))
+        write_index(index)
+    return len(names)
+
+
+def load_monsters(filepath: str, monster_type: str) -> core.Roster:
+    """
+    This function returns the roster of a file already decoded by
+    iter_monsters, from the cache when the file didn't change.
+
+    Files bigger than a quarter of CACHE_MAX_SIZE are not cached,
+    they are streamed straight into the roster.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    monster_type:
+        "pokemon" or "digimon".
+
+    Returns
+    -------
+        The roster with the file monsters.
+    """
+    roster = cached_roster(filepath, monster_type)
+    if roster is not None:
+        return roster
+
+    roster = read_roster(filepath, monster_type)
+    remember_roster(filepath, monster_type, roster)
+    if os.path.getsize(filepath) <= CACHE_MAX_SIZE // 4:
+        try:
+            cache_store(cache_key(filepath, monster_type), roster)
+        except OSError:
+            pass
+    return roster
+
+
+def cached_roster(filepath: str, monster_type: str) -> Optional[core.Roster]:
+    """
+    This function returns the roster of a file only when it is
+    already in memory or in the cache, without reading the file.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    monster_type:
+        "pokemon" or "digimon".
+
+    Returns
+    -------
+        The cached roster, or None if the file must be read.
+    """
+    roster = memory_roster(filepath, monster_type)
+    if roster is not None:
+        return roster
+
+    if os.path.getsize(filepath) > CACHE_MAX_SIZE // 4:
+        return None
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        key = cache_key(filepath, monster_type)
+    except OSError:
+        return None
+    roster = cache_load(key)
+    if roster is not None:
+        remember_roster(filepath, monster_type, roster)
+    return roster
+
+
+def read_roster(filepath: str, monster_type: str) -> core.Roster:
+    """
+    This function reads a file one monster at a time into a roster.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    monster_type:
+        "pokemon" or "digimon".
+
+    Returns
+    -------
+        The roster with the file monsters.
+    """
+    return core.Roster.from_monsters(core.iter_monsters(filepath, monster_type), monster_type)
@@ -1,9 +1,45 @@
-from typing import List, Set, Union, Dict, SupportsIndex
+import core
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple, Union, Dict, SupportsIndex
 
 # TODO: Set is missing the internal data types (erro do mypy conferir)
 
-
-def cast_to_set(file_set_1: Dict) -> Set[Dict[str, Union[str, int]]]:
+# The key of each field in the files, its patterned keyname and its type.
+MONSTER_SCHEMAS: Dict[str, List[Tuple[str, str, str]]] = {
+    "pokemon": [
+        ("Id", "id", "int"),
+        ("Name", "name", "str"),
+        ("Type 1", "type1", "str"),
+        ("Type 2", "type2", "str"),
+        ("Total", "total", "int"),
+        ("HP", "hp", "int"),
+        ("Attack", "attack", "int"),
+        ("Defense", "defense", "int"),
+        ("Sp. Atk", "spatk", "int"),
+        ("Sp. Def", "spdef", "int"),
+        ("Speed", "speed", "int"),
+        ("Generation", "generation", "int"),
+        ("Legendary", "legendary", "bool"),
+    ],
+    "digimon": [
+        ("Id", "id", "int"),
+        ("Name", "name", "str"),
+        ("Stage", "stage", "str"),
+        ("Type", "type1", "str"),
+        ("Attribute", "attribute", "str"),
+        ("Memory", "memory", "int"),
+        ("Equip Slots", "equip", "int"),
+        ("HP", "hp", "int"),
+        ("SP", "sp", "int"),
+        ("Atk", "attack", "int"),
+        ("Def", "defense", "int"),
+        ("Int", "intelligence", "int"),
+        ("Spd", "speed", "int"),
+        ("Image link", "image", "str"),
+    ],
+}
+
+
+def cast_to_set(file_set_1: Dict) -> Set[str]:
     """
     This function converts a list to a set.
 
@@ -17,12 +53,38 @@ def cast_to_set(file_set_1: Dict) -> Set[Dict[str, Union[str, int]]]:
     pokemon_set:
         The data in a set type.
     """
+    if isinstance(file_set_1, core.Roster):
+        return file_set_1.distinct("name")
+
     monster_set: set = set()
     for monster in file_set_1:
         monster_set.add(monster["name"])
     return monster_set
 
 
+def cast_to_sketch(file_set_1: Dict, error: float) -> "core.NameSketch":
+    """
+    This function converts a list to a NameSketch, used instead of
+    cast_to_set when the rosters are too big to keep every name.
+
+    Parameters
+    ----------
+    file_set_1:
+        The data to be converted in sketch.
+
+    error:
+        The relative error of the sketch, it uses a constant memory.
+
+    Returns
+    -------
+    names:
+        The NameSketch of the monster names.
+    """
+    if isinstance(file_set_1, core.Roster):
+        return core.NameSketch(error).consume(file_set_1.distinct("name"))
+    return core.NameSketch(error).consume(str(monster["name"]) for monster in file_set_1)
+
+
 def cast_to_int(value: SupportsIndex) -> int:
     """
     This function converts a list to integers.
@@ -36,7 +98,7 @@ def cast_to_int(value: SupportsIndex) -> int:
     -------
         The data as integer type.
     """
-    return int(value) if value is not None else 0
+    return int(value) if value is not None and value != "" else 0
 
 
 def cast_to_bool(value: List[str]) -> bool:
@@ -52,64 +114,87 @@ def cast_to_bool(value: List[str]) -> bool:
     -------
         The data as bool type.
     """
-    return True if value == "True" else False
+    return True if value is True or value == "True" else False
 
 
-def cast_to_lower(value: List[str], monster_type: str) -> List[Dict[str, str]]:
+def cast_to_str(value: Union[str, int, None]) -> str:
     """
-    This function converts the list of variables
-    to lower case and put them in a patterned keynames.
+    This function converts a value to string, a json null becomes an
+    empty string, like an empty csv column or xml tag.
 
     Parameters
     ----------
     Value:
-        The list to be converted.
+        The value to be converted.
+
+    Returns
+    -------
+        The data as string type.
+    """
+    return "" if value is None else str(value)
+
+
+# The function that converts a value read from a file to each type of MONSTER_SCHEMAS.
+SCHEMA_TYPES: Dict[str, Callable[[Union[str, int, bool, None]], Union[str, int, bool]]] = {
+    "int": cast_to_int,
+    "str": cast_to_str,
+    "bool": cast_to_bool,
+}
+
+
+def monster_decoder(
+    monster_type: str, keys: Optional[Dict[str, Union[str, int]]] = None
+) -> Callable[[Dict[str, str]], Dict[str, Union[str, int, bool]]]:
+    """
+    This function returns a function that converts one monster read
+    from a file to the patterned keynames, with each value already in
+    the type of MONSTER_SCHEMAS, e.g. "99" becomes 99 and "False"
+    becomes False, both in the same dict.
+
+    Parameters
+    ----------
+    monster_type:
+        "pokemon" or "digimon".
+
+    keys:
+        Where each file key is found in the monster read, when it
+        isn't the key itself, e.g. the xml tag "Sp_Atk" for "Sp. Atk"
+        or the column position of a csv row.
+
+    Returns
+    -------
+        The function that converts one monster into a new dict.
+    """
+    keys = keys or {}
+    schema = [
+        (keys.get(source, source), field, SCHEMA_TYPES[kind]) for source, field, kind in MONSTER_SCHEMAS[monster_type]
+    ]
+
+    def decode_monster(monster: Dict[str, str]) -> Dict[str, Union[str, int, bool]]:
+        return {field: cast(monster[source]) for source, field, cast in schema}
+
+    return decode_monster
+
+
+def iter_decode_monsters(
+    value: Iterable[Dict[str, str]], monster_type: str
+) -> Iterator[Dict[str, Union[str, int, bool]]]:
+    """
+    This function converts one monster at a time while the list is
+    read, with the keys and types of MONSTER_SCHEMAS.
+
+    Parameters
+    ----------
+    Value:
+        The monsters to be converted, it can be a generator.
+
+    monster_type:
+        "pokemon" or "digimon".
 
     Returns
     -------
-        The data in a lower case on a new dict.
+        A generator of the monsters with the patterned keynames.
     """
-    change_dict = value
-    new_dict = []
-
-    if monster_type == "pokemon":
-        for key in change_dict:
-            new_dict += [
-                dict(
-                    id=key["Id"],
-                    name=key["Name"],
-                    type1=key["Type 1"],
-                    type2=key["Type 2"],
-                    total=key["Total"],
-                    hp=key["HP"],
-                    attack=key["Attack"],
-                    defense=key["Defense"],
-                    spatk=key["Sp. Atk"],
-                    spdef=key["Sp. Def"],
-                    speed=key["Speed"],
-                    generation=key["Generation"],
-                    legendary=key["Legendary"],
-                )
-            ]
-    elif monster_type == "digimon":
-        for key in change_dict:
-            new_dict += [
-                dict(
-                    id=key["Id"],
-                    name=key["Name"],
-                    stage=key["Stage"],
-                    type1=key["Type"],
-                    attribute=key["Attribute"],
-                    memory=key["Memory"],
-                    equip=key["Equip Slots"],
-                    hp=key["HP"],
-                    sp=key["SP"],
-                    attack=key["Atk"],
-                    defense=key["Def"],
-                    intelligence=key["Int"],
-                    speed=key["Spd"],
-                    image=key["Image link"],
-                )
-            ]
-
-    return new_dict
+    if monster_type not in MONSTER_SCHEMAS:
+        return
+    yield from map(monster_decoder(monster_type), value)
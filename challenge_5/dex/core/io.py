@@ -1,9 +1,11 @@
 import os
+from core import sink
+from core.report import REPORT_WIDTH, ReportSection, ReportTemplate
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Tuple, Union
 
 
-break_line: str = (" " * 80) + "\n"
+BLANK_LINE: Tuple[str, int] = ("", REPORT_WIDTH)
 
 
 def client_helper() -> str:
@@ -42,6 +44,14 @@ def client_helper() -> str:
     pokemon or digimon, where the first monster to fall decides
     the winner and we'll show you the battle results.
 
+    --serve
+
+    We'll keep the lists you already used in memory and answer the
+    commands you send with dex/client.py, which takes the same options,
+    so each command doesn't read the same files again. Use
+    --serve --socket <path> to choose the Unix socket of the daemon,
+    and DEX_SOCKET=<path> so the client finds it.
+
     """
     return helper_msg
 
@@ -70,6 +80,14 @@ def client_usage() -> str:
     --player2 ../data/pokemon/json/pokemons_2.json --id 1 --info
     > python3 dex/main.py --player1 ../data/digimon/json/digimons_1.json
     --player2 ../data/digimon/json/digimons_2.json --id 1 --info
+    > python3 dex/main.py --player1 ../data/pokemon/json/pokemons_1.json
+    --player2 ../data/pokemon/json/pokemons_2.json --info --approx 0.01
+
+    For huge files, --approx [ERROR] estimates the repeated and different
+    monsters with HyperLogLog and MinHash sketches instead of keeping
+    every name, the memory doesn't grow with the files. ERROR is the
+    relative error accepted, 0.02 by default. Rosters smaller than
+    about 1 / ERROR ** 2 names are still counted exactly.
 
     BATTLE
     > python3 dex/main.py --player1 ../data/pokemon/json/pokemons_1.json
@@ -77,9 +95,53 @@ def client_usage() -> str:
     > python3 dex/main.py --player1 ../data/digimon/json/digimons_1.json
     --player2 ../data/digimon/json/digimons_2.json --id 1 --battle
     
-    In the Battle option, you will be asked how many monster will participate 
-    in the battle, the archive size will be validated, if you informed a number
-    bigger than the amount of monsters in the list, it will return a error.
+    COMPARE
+    > python3 dex/main.py --compare ../data/pokemon/json ../data/pokemon/csv --id 1
+    > python3 dex/main.py --compare ../data/digimon/json/digimons_1.json
+    ../data/digimon/csv/digimons_2.csv ../data/digimon/xml --json compare.json
+
+    Like INFO, but for any number of rosters, a directory adds every
+    roster file in it. It shows the repeated monsters and the Jaccard
+    index of each pair of rosters, the monsters found only in each one,
+    and the monsters found in the most rosters. --json also saves the
+    whole comparison in a json file.
+
+    TOURNAMENT
+    > python3 dex/main.py --tournament ../data/pokemon/json --team-size 3 --id 1
+    > python3 dex/main.py --tournament ../data/digimon/json --workers 4
+
+    Every roster file in the directory battles every other roster twice,
+    once as each player, the standings are sorted by wins, then by the
+    fewest rounds to win. The battles are spread across --workers
+    processes, at least 1, one per CPU by default, the team size is 3
+    when --team-size is not informed.
+
+    CACHE
+    > python3 dex/main.py --clear-cache
+    > python3 dex/main.py --clear-cache ../data/pokemon/json/pokemons_1.json
+
+    The files read are cached in ~/.cache/dex (or DEX_CACHE_DIR), so the
+    next runs with the same file don't parse it again. The cache is
+    refreshed by itself when the file changes, --clear-cache removes it
+    for every file, or only for the file informed.
+
+    DAEMON
+    > python3 dex/main.py --serve
+    > python3 dex/main.py --serve --socket /tmp/dex.sock
+    > python3 dex/client.py --trivia ../data/pokemon/json/pokemons_1.json --id 1
+
+    --serve keeps the files read in memory and answers the commands sent
+    by dex/client.py on a Unix socket ($XDG_RUNTIME_DIR/dex-UID.sock, or
+    DEX_SOCKET), the client takes the same options as main.py. A file
+    changed on disk is read again. Without a daemon running, the client
+    runs the command by itself.
+
+    In the Battle option, --team-size sets how many monsters will participate
+    in the battle, 3 when it is not informed, e.g. --battle --team-size 5.
+    The archive size will be validated, if you informed a number bigger
+    than the amount of monsters in the list, it will return a error.
+    The team is made of the monsters with the highest attack, the ties
+    are broken by speed, then by total.
 
     ATTENTION:
 
@@ -104,27 +166,21 @@ def client_usage() -> str:
     unique, making it possible have multiple files with different data
     across them.
 
-    Before using the function you can choose what will be done with the
-    information generated, answering the question that will be displayed:
-
-    What do you prefer to do?
+    When the file already exists, --on-exists chooses what will be done
+    with the information generated, it never asks, so it can run in
+    scripts and many at the same time:
+    > python3 dex/main.py --trivia ../data/pokemon/json/pokemons_1.json --id 1 --on-exists append
 
-    [append|OVERWRITE]
+    overwrite -> The file is replaced by the new one, the report is
+    written in a temporary file first and renamed over it, so it is
+    never found half written. This is the default, or DEX_ON_EXISTS.
 
-    append -> This function will increment the file, keeping the
-    information that already exists on the file and simply add
-    the new one, to choose this type any of this:
+    append -> The new information is added to the end of the file,
+    keeping the information that already exists, many runs can append
+    to the same file at once without mixing their reports.
 
-    'a','A','Append','append','APPEND'
-
-    OVERWRITE -> This option will delete the existing file and
-    create a new one with the generated information, to choose
-    this type any of this:
-
-    'o','O','Overwrite','overwrite','OVERWRITE'.
-
-    WARNING: If you don't choose an option, and just hit enter
-    it will automatically use OVERWRITE option.
+    version -> The file is kept and the new one is saved with the next
+    free number, e.g. 1_battle.1.txt, 1_battle.2.txt.
     """
     return client_usage_msg
 
@@ -137,7 +193,8 @@ def data_saver(
 ) -> None:
     """
     This function creates a .txt file that stores the generated
-    information.
+    information, with the sink of core.sink, so it never asks what
+    to do with an existing file: --on-exists chooses it.
 
     Parameters
     ----------
@@ -153,37 +210,51 @@ def data_saver(
         it will be filled with 0.
 
     """
-
-    if os.path.exists(f"{id_number}_{monster_type}.txt"):
-        user_choice: str = input(
-            f"File {id_number}_{monster_type}.txt already exists, "
-            + "what do you prefer to do? [append|OVERWRITE] : "
-        )
-
-        if (
-            user_choice.lower() == "o"
-            or user_choice.lower() == "overwrite"
-            or user_choice == ""
-        ):
-            os.remove(f"{id_number}_{monster_type}.txt")
-
-            print("File Overwritten successfully!")
-
-            with open(f"{id_number}_{monster_type}.txt", "w") as target:
-                target.write(data_to_be_saved)
-
-        elif user_choice.lower() == "a" or user_choice.lower() == "append":
-            with open(f"{id_number}_{monster_type}.txt", "a") as target:
-                target.write(data_to_be_saved)
-                print("New entry added to the file successfully!")
-        else:
-            print(user_choice)
-            print(f"WARNING: Invalid Input.\n{client_usage()}")
-            quit()
-
-    else:
-        with open(f"{id_number}_{monster_type}.txt", "w") as target:
-            target.write(data_to_be_saved)
+    filepath = sink.report_path(monster_type, id_number)
+    report_sink = sink.report_sink()
+    existed = report_sink.writer is None and os.path.exists(filepath)
+    saved = report_sink.save(data_to_be_saved, filepath)
+
+    if existed and report_sink.on_exists == "overwrite":
+        print("File Overwritten successfully!")
+    elif existed and report_sink.on_exists == "append":
+        print("New entry added to the file successfully!")
+    elif existed:
+        print(f"File {filepath} already exists, the report was saved in {saved}.")
+
+
+# The first lines of every report.
+REPORT_HEADER = [BLANK_LINE, ("reported generated on: {date}", REPORT_WIDTH), BLANK_LINE]
+REPORT_RULE: str = " " + ("=" * 78) + " "
+
+POKEMON_TRIVIA_REPORT = ReportTemplate(
+    [
+        *REPORT_HEADER,
+        ("=" * 29) + " Welcome to the Dex! " + ("=" * 30),
+        BLANK_LINE,
+        "Here we have some useful information gathered from the list you provided us:    ",
+        BLANK_LINE,
+        ("1. How many pokemons there is in this list:", REPORT_WIDTH),
+        ("    > {total_trivia} pokemons", 40),
+        BLANK_LINE,
+        ("2. The pokemon with the highest HP point is:", REPORT_WIDTH),
+        ("    >{hp_trivia_name} with {hp_trivia_points} HP points", REPORT_WIDTH),
+        BLANK_LINE,
+        ("3. Which one has the strongest attack:", REPORT_WIDTH),
+        ("    >{atk_trivia_name} with {atk_trivia_points} attack points.", REPORT_WIDTH),
+        BLANK_LINE,
+        ("4. Which one has the strongest defense:", REPORT_WIDTH),
+        ("    >{def_trivia_name} with {def_trivia_points} defense points.", REPORT_WIDTH),
+        BLANK_LINE,
+        ("5. Which one is the fastest:", REPORT_WIDTH),
+        ("    >{spd_trivia_name} with {spd_trivia_points} speed points.", REPORT_WIDTH),
+        BLANK_LINE,
+        ("Thanks for using this Dex!", 76),
+        BLANK_LINE,
+        BLANK_LINE,
+        BLANK_LINE,
+    ]
+)
 
 
 def show_pokemon_trivia(pokemons_info: Dict[str, str], id_number: str) -> None:
@@ -201,106 +272,55 @@ def show_pokemon_trivia(pokemons_info: Dict[str, str], id_number: str) -> None:
         it will be filled with 0.
 
     """
-    datenow = datetime.now()
-    msg = break_line
-    msg += "reported generated on: " + datenow.isoformat() + (" " * 31) + "\n"
-    msg += break_line
-    msg += ("=" * 29) + " Welcome to the Dex! " + ("=" * 30) + "\n"
-    msg += break_line
-    msg += "Here we have some useful information gathered from the list you provided us:    \n"
-    msg += break_line
-    msg += "1. How many pokemons there is in this list:" + (" " * 37) + "\n"
-    msg += (
-        (" " * 4)
-        + "> "
-        + pokemons_info["total_trivia"]
-        + " pokemons"
-        + (" " * (25 - len(pokemons_info["total_trivia"])))
-        + "\n"
-    )
-    msg += break_line
-    msg += "2. The pokemon with the highest HP point is:" + (" " * 36) + "\n"
-    msg += (
-        (" " * 4)
-        + ">"
-        + pokemons_info["hp_trivia_name"]
-        + " with "
-        + pokemons_info["hp_trivia_points"]
-        + " HP points"
-        + (
-            " "
-            * (
-                (59 - len(pokemons_info["hp_trivia_name"]))
-                - len(pokemons_info["hp_trivia_points"])
-            )
-        )
-        + "\n"
-    )
-    msg += break_line
-    msg += "3. Which one has the strongest attack:" + (" " * 42) + "\n"
-    msg += (
-        (" " * 4)
-        + ">"
-        + pokemons_info["atk_trivia_name"]
-        + " with "
-        + pokemons_info["atk_trivia_points"]
-        + " attack points."
-        + (
-            " "
-            * (
-                (54 - len(pokemons_info["atk_trivia_name"]))
-                - len(pokemons_info["atk_trivia_points"])
-            )
-        )
-        + "\n"
-    )
-    msg += break_line
-    msg += "4. Which one has the strongest defense:" + (" " * 41) + "\n"
-    msg += (
-        (" " * 4)
-        + ">"
-        + pokemons_info["def_trivia_name"]
-        + " with "
-        + pokemons_info["def_trivia_points"]
-        + " defense points."
-        + (
-            " "
-            * (
-                (53 - len(pokemons_info["def_trivia_name"]))
-                - len(pokemons_info["def_trivia_points"])
-            )
-        )
-        + "\n"
-    )
-    msg += break_line
-    msg += "5. Which one is the fastest:" + (" " * 52) + "\n"
-    msg += (
-        (" " * 4)
-        + ">"
-        + pokemons_info["spd_trivia_name"]
-        + " with "
-        + pokemons_info["spd_trivia_points"]
-        + " speed points."
-        + (
-            " "
-            * (
-                (55 - len(pokemons_info["spd_trivia_name"]))
-                - len(pokemons_info["spd_trivia_points"])
-            )
-        )
-        + "\n"
-    )
-    msg += break_line
-    msg += "Thanks for using this Dex!" + (" " * 50) + "\n"
-    msg += break_line
-    msg += break_line
-    msg += break_line
+    msg = POKEMON_TRIVIA_REPORT.render(dict(pokemons_info, date=datetime.now().isoformat()))
 
-    print(msg.format(**pokemons_info))
+    print(msg)
 
     data_saver(msg, "pokemon-trivia", id_number)
 
 
+DIGIMON_TRIVIA_REPORT = ReportTemplate(
+    [
+        *REPORT_HEADER,
+        ("=" * 29) + " Welcome to the Dex! " + ("=" * 30),
+        BLANK_LINE,
+        "Here we have some useful information gathered from the list you provided us:    ",
+        BLANK_LINE,
+        ("1. How many Digimon there is in this list:", 79),
+        ("    > {total_trivia} digimon", 39),
+        BLANK_LINE,
+        ("2. How many different stages a digimon have?", REPORT_WIDTH),
+        "    > In this list we have {stages_sum} stages of digimon, they're {digimon_stages}",
+        BLANK_LINE,
+        ("3. How many digimon in each stage there are?", REPORT_WIDTH),
+        ReportSection("stage_groups", [("    > {group_name}: {total} digimon", REPORT_WIDTH)]),
+        BLANK_LINE,
+        ("4. The strongest digimon in each stage based on the Atk attribute is:", REPORT_WIDTH),
+        ReportSection("stage_groups", [("    > {group_name}: {strongest}, {attack}", REPORT_WIDTH)]),
+        BLANK_LINE,
+        ("5. How many different types of digimon there is?", REPORT_WIDTH),
+        "    > In this list we have {types_sum} types of digimon, they're {digimon_types}",
+        BLANK_LINE,
+        ("6. How many digimon in each type there is:", REPORT_WIDTH),
+        ReportSection("type_groups", [("    > {group_name}: {total}", REPORT_WIDTH)]),
+        BLANK_LINE,
+        ("7. The strongest digimon in each type based on the Atk attribute is:", 79),
+        ReportSection("type_groups", [("    > {group_name}: {strongest}, {attack}", REPORT_WIDTH)]),
+        BLANK_LINE,
+        ("8. Which is the weakest digimon of all, based on the Atk attribute is:", REPORT_WIDTH),
+        "    > {lowest_atk_name}, on {lowest_atk_stage} stage, {lowest_atk_type} type.",
+        BLANK_LINE,
+        ("9. Which is the strongest digimon of all, based on the Atk attribute is:", REPORT_WIDTH),
+        "    > {highest_atk_name}, on {highest_atk_stage} stage, {highest_atk_type} type.",
+        BLANK_LINE,
+        ("Thanks for using this Dex!", 76),
+        BLANK_LINE,
+        BLANK_LINE,
+        BLANK_LINE,
+    ]
+)
+
+
 def show_digimon_trivia(digimon_info: Dict[str, str], id_number: str) -> None:
     """
     This function will print a message about in the CLI.
@@ -316,361 +336,47 @@ def show_digimon_trivia(digimon_info: Dict[str, str], id_number: str) -> None:
         it will be filled with 0.
 
     """
-
-    datenow = datetime.now()
-    msg = break_line
-    msg += "reported generated on: " + datenow.isoformat() + (" " * 31) + "\n"
-    msg += break_line
-    msg += ("=" * 29) + " Welcome to the Dex! " + ("=" * 30) + "\n"
-    msg += break_line
-    msg += "Here we have some useful information gathered from the list you provided us:    \n"
-    msg += break_line
-    msg += "1. How many Digimon there is in this list:" + (" " * 37) + "\n"
-    msg += (
-        (" " * 4)
-        + "> "
-        + digimon_info["total_trivia"]
-        + " digimon"
-        + (" " * (25 - len(digimon_info["total_trivia"])))
-        + "\n"
-    )
-    msg += break_line
-    msg += "2. How many different stages a digimon have?" + (" " * 36) + "\n"
-    msg += (
-        (" " * 4)
-        + "> In this list we have "
-        + digimon_info["stages_sum"]
-        + " stages of digimon, they're "
-        + " ".join(digimon_info["digimon_stages"])
-        + "\n"
-    )
-    msg += break_line
-    msg += "3. How many digimon in each stage there are?" + (" " * 36) + "\n"
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Baby: "
-        + digimon_info["total_baby"]
-        + " digimon"
-        + (" " * (60 - len(digimon_info["total_baby"])))
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Rookie: "
-        + digimon_info["total_rookie"]
-        + " digimon"
-        + (" " * (58 - len(digimon_info["total_rookie"])))
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Champion: "
-        + digimon_info["total_champion"]
-        + " digimon"
-        + (" " * (56 - len(digimon_info["total_champion"])))
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Ultimate: "
-        + digimon_info["total_ultimate"]
-        + " digimon"
-        + (" " * (56 - len(digimon_info["total_ultimate"])))
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Mega: "
-        + digimon_info["total_mega"]
-        + " digimon"
-        + (" " * (60 - len(digimon_info["total_mega"])))
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Ultra: "
-        + digimon_info["total_ultra"]
-        + " digimon"
-        + (" " * (59 - len(digimon_info["total_ultra"])))
-        + "\n"
-    )
-    msg += break_line
-    msg += (
-        "4. The strongest digimon in each stage based on the Atk attribute is:"
-        + (" " * 11)
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Baby: "
-        + digimon_info["baby_strongest"]
-        + ", "
-        + digimon_info["baby_attack"]
-        + (
-            " "
-            * (
-                65
-                - len(digimon_info["baby_strongest"])
-                - len(digimon_info["baby_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Rookie: "
-        + digimon_info["rookie_strongest"]
-        + ", "
-        + digimon_info["rookie_attack"]
-        + (
-            " "
-            * (
-                63
-                - len(digimon_info["rookie_strongest"])
-                - len(digimon_info["rookie_attack"])
-            )
+    msg = DIGIMON_TRIVIA_REPORT.render(
+        dict(
+            digimon_info,
+            date=datetime.now().isoformat(),
+            digimon_stages=" ".join(digimon_info["digimon_stages"]),
+            digimon_types=" ".join(digimon_info["digimon_types"]),
         )
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Champion: "
-        + digimon_info["champion_strongest"]
-        + ", "
-        + digimon_info["champion_attack"]
-        + (
-            " "
-            * (
-                61
-                - len(digimon_info["champion_strongest"])
-                - len(digimon_info["champion_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Ultimate: "
-        + digimon_info["ultimate_strongest"]
-        + ", "
-        + digimon_info["ultimate_attack"]
-        + (
-            " "
-            * (
-                61
-                - len(digimon_info["ultimate_strongest"])
-                - len(digimon_info["ultimate_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Mega: "
-        + digimon_info["mega_strongest"]
-        + ", "
-        + digimon_info["mega_attack"]
-        + (
-            " "
-            * (
-                63
-                - len(digimon_info["mega_strongest"])
-                - len(digimon_info["mega_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Ultra: "
-        + digimon_info["ultra_strongest"]
-        + ", "
-        + digimon_info["ultra_attack"]
-        + (
-            " "
-            * (
-                64
-                - len(digimon_info["ultra_strongest"])
-                - len(digimon_info["ultra_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += break_line
-    msg += "5. How many different types of digimon there is?" + (" " * 32) + "\n"
-    msg += (
-        (" " * 4)
-        + "> In this list we have "
-        + digimon_info["types_sum"]
-        + " types of digimon, they're "
-        + " ".join(digimon_info["digimon_types"])
-        + "\n"
-    )
-    msg += break_line
-    msg += "6. How many digimon in each type there is:" + (" " * 38) + "\n"
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Data: "
-        + digimon_info["total_data"]
-        + (" " * (68 - len(digimon_info["total_data"])))
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Vaccine: "
-        + digimon_info["total_vaccine"]
-        + (" " * (65 - len(digimon_info["total_vaccine"])))
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Virus: "
-        + digimon_info["total_virus"]
-        + (" " * (67 - len(digimon_info["total_virus"])))
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Free: "
-        + digimon_info["total_free"]
-        + (" " * (68 - len(digimon_info["total_free"])))
-        + "\n"
-    )
-    msg += break_line
-    msg += (
-        "7. The strongest digimon in each type based on the Atk attribute is:"
-        + (" " * 11)
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Data: "
-        + digimon_info["data_strongest"]
-        + ", "
-        + digimon_info["data_attack"]
-        + (
-            " "
-            * (
-                65
-                - len(digimon_info["data_strongest"])
-                - len(digimon_info["data_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Vaccine: "
-        + digimon_info["vaccine_strongest"]
-        + ", "
-        + digimon_info["vaccine_attack"]
-        + (
-            " "
-            * (
-                63
-                - len(digimon_info["vaccine_strongest"])
-                - len(digimon_info["vaccine_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Virus: "
-        + digimon_info["virus_strongest"]
-        + ", "
-        + digimon_info["virus_attack"]
-        + (
-            " "
-            * (
-                61
-                - len(digimon_info["virus_strongest"])
-                - len(digimon_info["virus_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + "Free: "
-        + digimon_info["free_strongest"]
-        + ", "
-        + digimon_info["free_attack"]
-        + (
-            " "
-            * (
-                61
-                - len(digimon_info["free_strongest"])
-                - len(digimon_info["free_attack"])
-            )
-        )
-        + "\n"
-    )
-    msg += break_line
-    msg += (
-        "8. Which is the weakest digimon of all, based on the Atk attribute is:"
-        + (" " * 10)
-        + "\n"
     )
-    msg += (
-        (" " * 4)
-        + "> "
-        + digimon_info["lowest_atk_name"]
-        + ", on "
-        + digimon_info["lowest_atk_stage"]
-        + " stage, "
-        + digimon_info["lowest_atk_type"]
-        + " type."
-        + "\n"
-    )
-    msg += break_line
-    msg += (
-        "9. Which is the strongest digimon of all, based on the Atk attribute is:"
-        + (" " * 8)
-        + "\n"
-    )
-    msg += (
-        (" " * 4)
-        + "> "
-        + digimon_info["highest_atk_name"]
-        + ", on "
-        + digimon_info["highest_atk_stage"]
-        + " stage, "
-        + digimon_info["highest_atk_type"]
-        + " type."
-        + "\n"
-    )
-    msg += break_line
-    msg += "Thanks for using this Dex!" + (" " * 50) + "\n"
-    msg += break_line
-    msg += break_line
-    msg += break_line
 
-    print(msg.format(**digimon_info))
+    print(msg)
 
     data_saver(msg, "digimon-trivia", id_number)
 
 
+BATTLE_SEPARATOR: str = "|" + (" " * 25) + ("-" * 28) + (" " * 25) + "|"
+
+BATTLE_REPORT = ReportTemplate(
+    [
+        *REPORT_HEADER,
+        ("=" * 32) + " MONSTER BATTLE " + ("=" * 32),
+        BLANK_LINE,
+        REPORT_RULE,
+        "|" + (" " * 30) + "+++++ RESULT +++++" + (" " * 30) + "|",
+        REPORT_RULE,
+        BATTLE_SEPARATOR,
+        "|" + (" " * 34) + "--Winner--" + (" " * 34) + "|",
+        "|{winner:^78}|",
+        BATTLE_SEPARATOR,
+        "|" + (" " * 34) + "--Rounds--" + (" " * 34) + "|",
+        "|{rounds:^78}|",
+        BATTLE_SEPARATOR,
+        "|" + (" " * 26) + "--First monster to fall--" + (" " * 27) + "|",
+        "|{loser_monster:^78}|",
+        REPORT_RULE,
+        BLANK_LINE,
+        BLANK_LINE,
+        BLANK_LINE,
+    ]
+)
+
+
 def show_battle_winner(battle_result: Dict[str, str], id_number: str) -> None:
     """
     This function will print a message in the CLI.
@@ -687,48 +393,40 @@ def show_battle_winner(battle_result: Dict[str, str], id_number: str) -> None:
         it will be filled with 0.
 
     """
-    datenow = datetime.now()
-    battle_msg = break_line
-    battle_msg += "reported generated on: " + datenow.isoformat() + (" " * 31) + "\n"
-    battle_msg += break_line
-    battle_msg += "" + (("=" * 32) + " MONSTER BATTLE " + ("=" * 32) + "\n")
-    battle_msg += break_line
-    battle_msg += " " + ("=" * 78) + " \n"
-    battle_msg += "|" + (" " * 30) + "+++++ RESULT +++++" + (" " * 30) + "|\n"
-    battle_msg += " " + ("=" * 78) + " \n"
-    battle_msg += "|" + (" " * 25) + ("-" * 28) + (" " * 25) + "|\n"
-    battle_msg += "|" + (" " * 34) + "--Winner--" + (" " * 34) + "|\n"
-    battle_msg += (
-        "|" + (" " * 35) + "Player " + str(battle_result["winner"]) + (" " * 35) + "|\n"
+    battle_msg = BATTLE_REPORT.render(
+        dict(battle_result, date=datetime.now().isoformat(), winner="Player " + str(battle_result["winner"]))
     )
-    battle_msg += "|" + (" " * 25) + ("-" * 28) + (" " * 25) + "|\n"
-    battle_msg += "|" + (" " * 34) + "--Rounds--" + (" " * 34) + "|\n"
-    battle_msg += (
-        "|"
-        + (" " * (38 - (len(str(battle_result["rounds"])) // 2)))
-        + str(battle_result["rounds"])
-        + (" " * (39 - (len(str(battle_result["rounds"])) // 2)))
-        + "|\n"
-    )
-    battle_msg += "|" + (" " * 25) + ("-" * 28) + (" " * 25) + "|\n"
-    battle_msg += "|" + (" " * 26) + "--First monster to fall--" + (" " * 27) + "|\n"
-    battle_msg += (
-        "|"
-        + (" " * (38 - (len(battle_result["loser_monster"]) // 2)))
-        + battle_result["loser_monster"]
-        + (" " * (39 - (len(battle_result["loser_monster"]) // 2)))
-        + "|\n"
-    )
-    battle_msg += " " + ("=" * 78) + " \n"
-    battle_msg += break_line
-    battle_msg += break_line
-    battle_msg += break_line
 
-    print(battle_msg.format(**battle_result))
+    print(battle_msg)
 
     data_saver(battle_msg, "battle", id_number)
 
 
+def info_layout(title: str, monsters: str, strongest: str, special: str) -> List[Union[str, Tuple[str, int]]]:
+    """
+    This function returns the layout of the info report, the pokemon
+    and the digimon reports only change the row names.
+    """
+    return [
+        *REPORT_HEADER,
+        " " + ("=" * 32) + title + ("=" * 32) + " ",
+        "|" + (" " * 18) + "| PLAYER 1" + (" " * 20) + "| PLAYER 2" + (" " * 20) + "|",
+        "|" + ("-" * 18) + "|" + ("-" * 29) + "|" + ("-" * 29) + "|",
+        "|" + monsters.ljust(18) + "| {player1_total_monster_info:<28}| {player2_total_monster_info:<28}|",
+        "|" + strongest.ljust(18) + "| {strongest_monster_player1_info:<28}| {strongest_monster_player2_info:<28}|",
+        "|" + special.ljust(18) + "| {stg_or_legend_player1_info:<28}| {stg_or_legend_player2_info:<28}|",
+        "|Repeated " + monsters.ljust(9) + "| {repeated_monster_info:<58}|",
+        "|Different " + monsters.ljust(8) + "| {different_monster_info:<58}|",
+        "|" + ("-" * 18) + "|" + ("-" * 59) + "|",
+        REPORT_RULE,
+        BLANK_LINE,
+    ]
+
+
+POKEMON_INFO_REPORT = ReportTemplate(info_layout(" POKEMON INFO ", "Pokemons", "Strongest Pokémon", "Legendary"))
+DIGIMON_INFO_REPORT = ReportTemplate(info_layout(" DIGIMON INFO ", "Digimons", "Strongest Digimon", "Digimon Ultra"))
+
+
 def show_info_pokemon(
     monster_dict_p1: Dict[str, str],
     monster_dict_p2: Dict[str, str],
@@ -750,68 +448,9 @@ def show_info_pokemon(
         it will be filled with 0.
 
     """
-    total_monster = str(len(monster_dict_p1))
-    total_monster2 = str(len(monster_dict_p2))
-    datenow = datetime.now()
-    msg = break_line
-    msg += "reported generated on: " + datenow.isoformat() + (" " * 31) + "\n"
-    msg += break_line
-    msg += " " + (("=" * 32) + " POKEMON INFO " + ("=" * 32) + " \n")
-    msg += (
-        "|" + (" " * 18) + "| PLAYER 1" + (" " * 20) + "| PLAYER 2" + (" " * 20) + "|\n"
-    )
-    msg += "|" + ("-" * 18) + "|" + ("-" * 29) + "|" + ("-" * 29) + "|\n"
-    msg += (
-        "|Pokemons"
-        + (" " * 10)
-        + "| "
-        + total_monster
-        + (" " * (28 - len(total_monster)))
-        + "| "
-        + total_monster2
-        + (" " * (28 - len(total_monster2)))
-        + "|\n"
-    )
-    msg += (
-        "|Strongest Pokémon"
-        + " | "
-        + process_monster["strongest_monster_player1_info"]
-        + (" " * (28 - len(process_monster["strongest_monster_player1_info"])))
-        + "| "
-        + process_monster["strongest_monster_player2_info"]
-        + (" " * (28 - len(process_monster["strongest_monster_player2_info"])))
-        + "|\n"
-    )
-    msg += (
-        "|Legendary"
-        + (" " * 9)
-        + "| "
-        + process_monster["stg_or_legend_player1_info"]
-        + (" " * (28 - len(process_monster["stg_or_legend_player1_info"])))
-        + "| "
-        + process_monster["stg_or_legend_player2_info"]
-        + (" " * (28 - len(process_monster["stg_or_legend_player2_info"])))
-        + "|\n"
-    )
-    msg += (
-        "|Repeated Pokemons"
-        + " | "
-        + process_monster["repeated_monster_info"]
-        + (" " * (58 - len(process_monster["repeated_monster_info"])))
-        + "|\n"
-    )
-    msg += (
-        "|Different Pokemons"
-        + "| "
-        + process_monster["different_monster_info"]
-        + (" " * (58 - len(process_monster["different_monster_info"])))
-        + "|\n"
-    )
-    msg += "|" + ("-" * 18) + "|" + ("-" * 59) + "|\n"
-    msg += " " + (("=" * 78) + " \n")
-    msg += break_line
+    msg = POKEMON_INFO_REPORT.render(dict(process_monster, date=datetime.now().isoformat()))
 
-    print(msg.format(**process_monster))
+    print(msg)
 
     data_saver(msg, "info", id_number)
 
@@ -833,65 +472,173 @@ def show_info_digimon(
         it will be filled with 0.
 
     """
-    datenow = datetime.now()
-    msg = break_line
-    msg += "reported generated on: " + datenow.isoformat() + (" " * 31) + "\n"
-    msg += break_line
-    msg += " " + (("=" * 32) + " DIGIMON INFO " + ("=" * 32) + " \n")
-    msg += (
-        "|" + (" " * 18) + "| PLAYER 1" + (" " * 20) + "| PLAYER 2" + (" " * 20) + "|\n"
-    )
-    msg += "|" + ("-" * 18) + "|" + ("-" * 29) + "|" + ("-" * 29) + "|\n"
-    msg += (
-        "|Digimons"
-        + (" " * 10)
-        + "| "
-        + process_monster["player1_total_monster_info"]
-        + (" " * (28 - len(process_monster["player1_total_monster_info"])))
-        + "| "
-        + process_monster["player2_total_monster_info"]
-        + (" " * (28 - len(process_monster["player2_total_monster_info"])))
-        + "|\n"
-    )
-    msg += (
-        "|Strongest Digimon"
-        + " | "
-        + process_monster["strongest_monster_player1_info"]
-        + (" " * (28 - len(process_monster["strongest_monster_player1_info"])))
-        + "| "
-        + process_monster["strongest_monster_player2_info"]
-        + (" " * (28 - len(process_monster["strongest_monster_player2_info"])))
-        + "|\n"
-    )
-    msg += (
-        "|Digimon Ultra"
-        + (" " * 5)
-        + "| "
-        + process_monster["stg_or_legend_player1_info"]
-        + (" " * (28 - len(process_monster["stg_or_legend_player1_info"])))
-        + "| "
-        + process_monster["stg_or_legend_player2_info"]
-        + (" " * (28 - len(process_monster["stg_or_legend_player2_info"])))
-        + "|\n"
-    )
-    msg += (
-        "|Repeated Digimons"
-        + " | "
-        + process_monster["repeated_monster_info"]
-        + (" " * (58 - len(process_monster["repeated_monster_info"])))
-        + "|\n"
+    msg = DIGIMON_INFO_REPORT.render(dict(process_monster, date=datetime.now().isoformat()))
+
+    print(msg)
+
+    data_saver(msg, "info", id_number)
+
+
+TOURNAMENT_REPORT = ReportTemplate(
+    [
+        *REPORT_HEADER,
+        " " + ("=" * 30) + " TOURNAMENT STANDINGS " + ("=" * 26) + " ",
+        "|  #   | Player" + (" " * 25) + "| Battles | Wins    | Losses  | Rounds |",
+        "|" + ("-" * 6) + "|" + ("-" * 32) + "|" + "|".join(["-" * 9] * 3) + "|" + ("-" * 8) + "|",
+        ReportSection(
+            "standings", ["| {position:<5}| {player:<31.30}| {battles:<8}| {wins:<8}| {losses:<8}| {rounds:<7}|"]
+        ),
+        REPORT_RULE,
+        BLANK_LINE,
+    ]
+)
+
+
+def show_tournament_standings(standings: List[Dict[str, str]], id_number: str) -> None:
+    """
+    This function will print the tournament standings in the CLI.
+
+    Parameters
+    ----------
+    standings:
+        The players sorted by their position, with the battles,
+        wins, losses and rounds of each one.
+
+    id_number:
+        The id provided by the user, in case its not provided
+        it will be filled with 0.
+
+    """
+    msg = TOURNAMENT_REPORT.render(
+        dict(
+            date=datetime.now().isoformat(),
+            standings=[
+                dict(standing, position=position, player=str(standing["player"]))
+                for position, standing in enumerate(standings, start=1)
+            ],
+        )
     )
-    msg += (
-        "|Different Digimons"
-        + "| "
-        + process_monster["different_monster_info"]
-        + (" " * (58 - len(process_monster["different_monster_info"])))
-        + "|\n"
+
+    print(msg)
+
+    data_saver(msg, "tournament", id_number)
+
+
+def compare_matrix(title: str, matrix: List[List[Union[int, float]]]) -> Dict[str, Union[str, List[Dict[str, str]]]]:
+    """
+    This function formats one of the roster comparison matrices,
+    each row and column is a roster position in the standings.
+
+    Parameters
+    ----------
+    title:
+        The matrix title.
+
+    matrix:
+        The value of each pair of rosters.
+
+    Returns
+    -------
+        The values of the matrix section of COMPARE_REPORT.
+    """
+    return dict(
+        title=title,
+        columns="".join(("#" + str(position)).rjust(8) for position in range(1, len(matrix) + 1)),
+        rows=[
+            dict(
+                position="#" + str(position),
+                cells="".join(
+                    (f"{value:.4f}" if isinstance(value, float) else str(value)).rjust(8) for value in row
+                ),
+            )
+            for position, row in enumerate(matrix, start=1)
+        ],
+    )
+
+
+COMPARE_REPORT = ReportTemplate(
+    [
+        *REPORT_HEADER,
+        " " + ("=" * 31) + " ROSTER COMPARE " + ("=" * 31) + " ",
+        "|  #   | Player" + (" " * 25) + "| Monsters   | Distinct   | Unique     |",
+        "|" + ("-" * 6) + "|" + ("-" * 32) + "|" + "|".join(["-" * 12] * 3) + "|",
+        ReportSection("players", ["| {position:<5}| {player:<31.30}| {total:<11}| {distinct:<11}| {unique:<11}|"]),
+        REPORT_RULE,
+        BLANK_LINE,
+        ReportSection(
+            "matrices",
+            [
+                ("{title}", REPORT_WIDTH),
+                "|  #   |{columns} |",
+                ReportSection("rows", ["| {position:<5}|{cells} |"]),
+                BLANK_LINE,
+            ],
+        ),
+        ("The monsters found in the most rosters:", REPORT_WIDTH),
+        ReportSection("names", [("    > {name}: {frequency} rosters", REPORT_WIDTH)]),
+        BLANK_LINE,
+    ]
+)
+
+
+def show_compare(comparison: Dict[str, List], id_number: str) -> None:
+    """
+    This function will print the comparison of many rosters in the CLI.
+
+    Parameters
+    ----------
+    comparison:
+        The result of compare_rosters.
+
+    id_number:
+        The id provided by the user, in case its not provided
+        it will be filled with 0.
+
+    """
+    msg = COMPARE_REPORT.render(
+        dict(
+            date=datetime.now().isoformat(),
+            players=[
+                dict(
+                    position="#" + str(position + 1),
+                    player=player,
+                    total=comparison["totals"][position],
+                    distinct=comparison["distinct"][position],
+                    unique=comparison["unique"][position],
+                )
+                for position, player in enumerate(comparison["players"])
+            ],
+            matrices=[
+                compare_matrix("Repeated monsters between each pair of rosters:", comparison["intersection"]),
+                compare_matrix("Jaccard index between each pair of rosters:", comparison["jaccard"]),
+            ],
+            names=[
+                dict(name=name, frequency=frequency)
+                for name, frequency in list(comparison["name_frequency"].items())[:10]
+            ],
+        )
     )
-    msg += "|" + ("-" * 18) + "|" + ("-" * 59) + "|\n"
-    msg += " " + (("=" * 78) + " \n")
-    msg += break_line
 
-    print(msg.format(**process_monster))
+    print(msg)
 
-    data_saver(msg, "info", id_number)
+    data_saver(msg, "compare", id_number)
+
+
+def save_compare_json(comparison: Dict[str, List], filepath: str) -> None:
+    """
+    This function saves the comparison of many rosters as json, so
+    it can be read by other programs.
+
+    Parameters
+    ----------
+    comparison:
+        The result of compare_rosters.
+
+    filepath:
+        The json file path.
+
+    """
+    import json
+
+    with open(filepath, "w") as target:
+        json.dump(comparison, target, indent=2)
@@ -0,0 +1,56 @@
+import core
+import os
+from typing import List, Optional
+
+
+def load_many(filepaths: List[str], monster_types: List[str], workers: Optional[int] = None) -> List[core.Roster]:
+    """
+    This function returns the roster of each file, like load_monsters,
+    parsing the files that are not in the cache at the same time in a
+    process pool, so the load takes as long as the slowest file
+    instead of the sum of all of them.
+
+    The workers send back a Roster, its columns are arrays and each
+    string is pickled once, so it is cheap to move between processes.
+
+    Parameters
+    ----------
+    filepaths:
+        The file paths, they can be the full path or relative path.
+
+    monster_types:
+        The monster type of each file, "pokemon" or "digimon".
+
+    workers:
+        How many processes, the number of CPUs by default.
+
+    Returns
+    -------
+        The rosters, in the same order of the files.
+    """
+    rosters: List[Optional[core.Roster]] = [
+        core.cached_roster(filepath, monster_type) for filepath, monster_type in zip(filepaths, monster_types)
+    ]
+    missing = [position for position, roster in enumerate(rosters) if roster is None]
+    workers = min(len(missing), workers or os.cpu_count() or 1)
+
+    # Starting the processes costs more than parsing a single file.
+    if workers <= 1:
+        for position in missing:
+            rosters[position] = core.load_monsters(filepaths[position], monster_types[position])
+        return rosters
+
+    # The process pool is imported only here, a run with one file doesn't need it.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        loaded = executor.map(
+            core.load_monsters,
+            [filepaths[position] for position in missing],
+            [monster_types[position] for position in missing],
+        )
+        for position, roster in zip(missing, loaded):
+            # The workers kept it in their own memory, it is kept in this process too.
+            core.remember_roster(filepaths[position], monster_types[position], roster)
+            rosters[position] = roster
+    return rosters
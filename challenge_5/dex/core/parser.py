@@ -1,23 +1,449 @@
 import core
 import json
-import csv
-import xmltodict
-import yaml
-from typing import Dict, Union, List
+import os
+import re
+from typing import TYPE_CHECKING, Dict, Iterator, TextIO, Union, List
 
-# Os erros do mypy aqui estão acontecendo pq a variável file é usada em todos os tipos de arquivo
-# como se fosse a msm coisa sempre, então mudar pra xml_file, json_file etc
+# The csv, xml and yaml libraries are imported by the functions that read each format,
+# a run that reads only json files doesn't spend time importing them.
+if TYPE_CHECKING:
+    import yaml
 
+# The xml tags can't have spaces or dots, so the xml files use other
+# names for some keys, this maps them back to the names of the other formats.
+XML_KEYS: Dict[str, str] = {
+    "Type1": "Type 1",
+    "Type2": "Type 2",
+    "Sp_Atk": "Sp. Atk",
+    "Sp_Def": "Sp. Def",
+    "Equip_Slots": "Equip Slots",
+    "Image_link": "Image link",
+}
+XML_TAGS: Dict[str, str] = {key: tag for tag, key in XML_KEYS.items()}
 
-def read_file(filepath: str) -> List[Dict[str, Union[str, int]]]:
+XML_ID_TAG = re.compile(r"<(/?)id\d+>")
+
+
+# Smaller json files are read with json.load, it is faster when the whole file fits in memory.
+JSON_STREAM_MIN_SIZE: int = 1024 * 1024
+JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+JSON_NUMBER_CHARACTERS: str = "0123456789+-.eE"
+# A monster is a few hundred characters, a bigger piece of the file that still isn't a value is broken json.
+JSON_MAX_RECORD_SIZE: int = 1024 * 1024
+
+
+def xml_record(element: Dict[str, str]) -> Dict[str, str]:
     """
-    This function reads a file and acts according to its format
-    it will fit in one of the conditionals.
+    This function puts a xml monster in the same format of the other
+    files, renaming the keys in XML_KEYS and turning the empty tags
+    into empty strings, like the csv does.
+
+    Parameters
+    ----------
+    element:
+        The monster read from the xml file.
+
+    Returns
+    -------
+        The monster with the normalized keys.
+    """
+    return {XML_KEYS.get(key, key): ("" if value is None else value) for key, value in element.items()}
+
+
+def json_error(
+    message: str, buffer: str, position: int, offset: int, lines: int, line_start: int
+) -> json.JSONDecodeError:
+    """
+    This function returns the error of a json file read in chunks,
+    with the position in the whole file, like json.load shows it.
+
+    Parameters
+    ----------
+    message:
+        What was expected.
+
+    buffer:
+        The part of the file not decoded yet.
+
+    position:
+        Where the error is in the buffer.
+
+    offset:
+        How many characters of the file were before the buffer.
+
+    lines:
+        How many lines of the file were before the buffer.
+
+    line_start:
+        Where the last line before the buffer started in the file.
+
+    Returns
+    -------
+        The error, its doc is the buffer.
+    """
+    error = json.JSONDecodeError(message, buffer, position)
+    newline = buffer.rfind("\n", 0, position)
+    error.pos = offset + position
+    error.lineno = lines + buffer.count("\n", 0, position) + 1
+    error.colno = error.pos - (offset + newline + 1 if newline >= 0 else line_start) + 1
+    error.args = (f"{message}: line {error.lineno} column {error.colno} (char {error.pos})",)
+    return error
+
+
+def iter_json_records(
+    source_data: TextIO, chunk_size: int = 64 * 1024, max_record_size: int = JSON_MAX_RECORD_SIZE
+) -> Iterator[Dict[str, Union[str, int]]]:
+    """
+    This function reads a json file with a list of monsters and
+    yields each monster as soon as it is decoded, reading the file
+    in chunks instead of loading the whole list.
+
+    Parameters
+    ----------
+    source_data:
+        The opened json file.
+
+    chunk_size:
+        How many characters are read at a time.
+
+    max_record_size:
+        How many characters a monster can have, a broken one fails
+        here instead of reading the rest of the file.
+
+    Returns
+    -------
+        A generator of monsters.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    # The characters and lines of the file already decoded, and where its last line started.
+    offset = lines = line_start = 0
+    # What the file can have next, like json.load: "[" to open the list, a monster or "]" for an
+    # empty list, a monster after a comma, a comma or "]" after a monster, or nothing after "]".
+    expected = "["
+    end_of_file = False
+
+    while True:
+        position = JSON_WHITESPACE.match(buffer, position).end()
+        if position < len(buffer):
+            character = buffer[position]
+            if expected == "nothing":
+                raise json_error("Extra data", buffer, position, offset, lines, line_start)
+
+            if expected == "[":
+                if character != "[":
+                    raise json_error("Expecting '['", buffer, position, offset, lines, line_start)
+                expected = "monster or ]"
+                position += 1
+                continue
+
+            if character == "]" and expected in ("monster or ]", "comma or ]"):
+                expected = "nothing"
+                position += 1
+                continue
+
+            if expected == "comma or ]":
+                if character != ",":
+                    raise json_error("Expecting ',' delimiter", buffer, position, offset, lines, line_start)
+                expected = "monster"
+                position += 1
+                continue
+
+            try:
+                monster, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                # The monster can be split between two chunks, read more before giving up.
+                if end_of_file or len(buffer) - position > max_record_size:
+                    raise json_error(error.msg, buffer, error.pos, offset, lines, line_start) from None
+            else:
+                # A number ending with the buffer, or with a piece of a number like "1." or "1e",
+                # can go on in the next chunk, it is complete only when something else follows it.
+                if end_of_file or (end < len(buffer) and buffer[end] not in JSON_NUMBER_CHARACTERS):
+                    position = end
+                    expected = "comma or ]"
+                    yield monster
+                    continue
+
+        elif end_of_file:
+            if expected == "nothing":
+                return
+            raise json_error("Expecting ']'", buffer, position, offset, lines, line_start)
+
+        newline = buffer.rfind("\n", 0, position)
+        if newline >= 0:
+            lines += buffer.count("\n", 0, position)
+            line_start = offset + newline + 1
+        offset += position
+
+        chunk = source_data.read(chunk_size)
+        end_of_file = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def xml_chunks(source_data: TextIO, chunk_size: int = 64 * 1024) -> Iterator[str]:
+    """
+    This function reads a xml file in chunks, renaming the <idN>
+    monster tags to <id>.
+
+    The xml parser keeps every different tag name it finds, so with
+    one <idN> name per monster its memory would grow with the file.
+
+    Parameters
+    ----------
+    source_data:
+        The opened xml file.
+
+    chunk_size:
+        How many characters are read at a time.
+
+    Returns
+    -------
+        A generator of xml pieces, each one ending after a tag.
+    """
+    pending = ""
+    while True:
+        chunk = source_data.read(chunk_size)
+        if not chunk:
+            break
+        pending += chunk
+        # A tag can be split between two chunks, keep what comes after the last one.
+        cut = pending.rfind(">") + 1
+        yield XML_ID_TAG.sub(r"<\1id>", pending[:cut])
+        pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def iter_xml_elements(source_data: TextIO, chunk_size: int = 64 * 1024) -> Iterator[Dict[str, str]]:
+    """
+    This function reads a xml file incrementally with a pull parser,
+    and yields each <root> child, e.g. <id0> or <row>, as a dict of
+    its tags, with the xml tag names.
+
+    Each element is cleared after it is read, so only one monster
+    is kept in memory at a time, whatever is the size of the file.
+
+    Parameters
+    ----------
+    source_data:
+        The opened xml file.
+
+    chunk_size:
+        How many characters are read at a time.
+
+    Returns
+    -------
+        A generator of monsters with the xml tag names.
+    """
+    from xml.etree import ElementTree
+
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    depth = 0
+    root = None
+    for chunk in xml_chunks(source_data, chunk_size):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if event == "start":
+                depth += 1
+                if depth == 1:
+                    root = element
+                continue
+
+            depth -= 1
+            if depth == 1:
+                yield {field.tag: (field.text or "").strip() for field in element}
+                element.clear()
+                # The root keeps a reference to every child read, drop them as well.
+                root.clear()
+    parser.close()
+
+
+def iter_xml_records(source_data: TextIO) -> Iterator[Dict[str, str]]:
+    """
+    This function reads a xml file like iter_xml_elements, and yields
+    each monster with the keys of the other formats.
+
+    Parameters
+    ----------
+    source_data:
+        The opened xml file.
+
+    Returns
+    -------
+        A generator of monsters with the normalized keys.
+    """
+    return map(xml_record, iter_xml_elements(source_data))
+
+
+class YamlLayoutError(ValueError):
+    """
+    This exception is raised when a yaml file uses something the
+    streaming reader doesn't build, e.g. an anchor or a merge key.
+    """
+
+
+def yaml_loader() -> "type":
+    """
+    This function returns the yaml loader, the libyaml one is much
+    faster, the pure python one is used when pyyaml was built without
+    it.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def yaml_scalar(event: "yaml.ScalarEvent", constructor: "yaml.constructor.SafeConstructor") -> Union[str, int, bool]:
+    """
+    This function converts a yaml scalar to python, the same way
+    safe_load does, e.g. 12 is an int and 'False' is a string.
+
+    Parameters
+    ----------
+    event:
+        The scalar read by the yaml parser.
+
+    constructor:
+        The safe constructor that converts each yaml type.
+
+    Returns
+    -------
+        The python value.
+    """
+    from yaml.nodes import ScalarNode
+
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = constructor.resolver.resolve(ScalarNode, event.value, event.implicit)
+    if tag not in constructor.yaml_constructors:
+        # The merge keys and the unknown tags, safe_load gives them the right meaning or error.
+        raise YamlLayoutError(f"the tag {tag} is not streamed")
+    return constructor.yaml_constructors[tag](constructor, ScalarNode(tag, event.value, style=event.style))
+
+
+def iter_yaml_events(source_data: TextIO) -> Iterator[Dict[str, Union[str, int]]]:
+    """
+    This function builds each item of a yaml list straight from the
+    libyaml parser events, and yields it as soon as it ends.
+
+    The file is read in chunks by the parser, and the yaml nodes of
+    the whole document are never built, that is where safe_load
+    spends most of its time.
+
+    Parameters
+    ----------
+    source_data:
+        The opened yaml file.
+
+    Returns
+    -------
+        A generator of monsters.
+    """
+    import yaml
+
+    loader = yaml_loader()(source_data)
+    constructor = yaml.constructor.SafeConstructor()
+    constructor.resolver = yaml.resolver.Resolver()
+    # The same plain scalars, like the stats and types, repeat a lot in a roster.
+    plain_scalars: Dict[str, Union[str, int, bool]] = {}
+    # Each open mapping or list, for a mapping also the key waiting for its value.
+    stack: List[List] = []
+    try:
+        while loader.check_event():
+            event = loader.get_event()
+            if isinstance(event, (yaml.AliasEvent, yaml.NodeEvent)) and event.anchor is not None:
+                raise YamlLayoutError("anchors and aliases are not streamed")
+
+            if isinstance(event, yaml.ScalarEvent):
+                if event.tag is None and event.implicit[0]:
+                    value = plain_scalars.get(event.value, plain_scalars)
+                    if value is plain_scalars:
+                        value = yaml_scalar(event, constructor)
+                        if len(plain_scalars) < 10000:
+                            plain_scalars[event.value] = value
+                else:
+                    value = yaml_scalar(event, constructor)
+            elif isinstance(event, yaml.MappingStartEvent):
+                if not stack:
+                    raise YamlLayoutError("the document is a mapping, not a list")
+                stack.append([{}, None])
+                continue
+            elif isinstance(event, yaml.SequenceStartEvent):
+                stack.append([[], None])
+                continue
+            elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                value = stack.pop()[0]
+                if not stack:
+                    # The end of the list of monsters, they were all yielded.
+                    continue
+            else:
+                continue
+
+            if not stack:
+                raise YamlLayoutError("the document is a scalar, not a list")
+            parent = stack[-1]
+            if isinstance(parent[0], list):
+                if len(stack) == 1:
+                    yield value
+                else:
+                    parent[0].append(value)
+            elif parent[1] is None:
+                if isinstance(value, (dict, list)):
+                    raise YamlLayoutError("complex keys are not streamed")
+                parent[1] = (value,)
+            else:
+                parent[0][parent[1][0]] = value
+                parent[1] = None
+    finally:
+        loader.dispose()
+
+
+def iter_yaml_records(source_data: TextIO) -> Iterator[Dict[str, Union[str, int]]]:
+    """
+    This function reads a yaml file with a list of monsters and
+    yields one monster at a time, with the libyaml parser when it
+    is available.
+
+    The files that use something iter_yaml_events doesn't build are
+    loaded at once with the same loader, and the monsters already
+    yielded are skipped.
+
+    Parameters
+    ----------
+    source_data:
+        The opened yaml file.
+
+    Returns
+    -------
+        A generator of monsters.
+    """
+    yielded = 0
+    try:
+        for monster in iter_yaml_events(source_data):
+            yield monster
+            yielded += 1
+    except YamlLayoutError:
+        source_data.seek(0)
+        import yaml
 
-    If its a .json it uses load.
+        data = yaml.load(source_data, Loader=yaml_loader())
+        yield from (data[yielded:] if yielded else data) or []
+
+
+def iter_records(filepath: str) -> Iterator[Dict[str, Union[str, int]]]:
+    """
+    This function reads a file and yields one monster at a time,
+    acting according to its format.
+
+    If its a .json it uses load, or a streaming decoder for big files.
     If its a .csv it uses DictReader.
-    If its a .xml it uses xmltodict.
-    If its a .yaml it uses safe load.
+    If its a .xml it uses a pull parser.
+    If its a .yaml it uses the libyaml parser events.
+
+    Every format yields the monsters with the same keys, so the
+    caller doesn't need to know the file format.
 
     Parameters
     ----------
@@ -26,33 +452,100 @@ def read_file(filepath: str) -> List[Dict[str, Union[str, int]]]:
 
     Returns
     -------
-    data_read:
-        The file received will be returned in python data types.
+        A generator of monsters in python data types.
     """
     with open((filepath), "r") as source_data:
         if ".json" in filepath:
-            data_read = json.load(source_data)
+            if os.path.getsize(filepath) < JSON_STREAM_MIN_SIZE:
+                yield from json.load(source_data)
+            else:
+                yield from iter_json_records(source_data)
 
         elif ".csv" in filepath:
-            file = csv.DictReader(source_data, delimiter=",")
-            data_read = [row for row in file]
+            import csv
+
+            yield from csv.DictReader(source_data, delimiter=",")
 
         elif ".xml" in filepath:
-            file = source_data.read()
-            file_xml = xmltodict.parse(file)
-            dict_id = {key: value for key, value in file_xml["root"].items()}
-            data_read = []
-            for key, value in dict_id.items():
-                data_read += [
-                    {key_list: value_list for key_list, value_list in value.items()}
-                ]
+            yield from iter_xml_records(source_data)
 
         elif ".yaml" in filepath:
-            file = source_data.read()
-            data_read = yaml.safe_load(file)
+            yield from iter_yaml_records(source_data)
 
         else:
             print(f"Error: File format not supported!\n{core.client_usage()}")
             quit()
 
-    return data_read
+
+def iter_monsters(filepath: str, monster_type: str) -> Iterator[Dict[str, Union[str, int, bool]]]:
+    """
+    This function reads a file and yields one monster at a time, like
+    iter_records, but with the patterned keynames and each value
+    already converted to its MONSTER_SCHEMAS type, so the csv and xml
+    stats are numbers, as in the json and yaml files.
+
+    The csv rows and the xml tags are converted straight from what
+    the file parser returns, without a dict with the file keys.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    monster_type:
+        "pokemon" or "digimon".
+
+    Returns
+    -------
+        A generator of monsters in the patterned keynames.
+
+    Raises
+    ------
+    ValueError:
+        When a csv header misses a column, or a row is shorter than
+        the header, with the file name and line number.
+    """
+    if monster_type not in core.MONSTER_SCHEMAS:
+        return
+
+    if ".json" not in filepath and ".csv" in filepath:
+        import csv
+
+        with open((filepath), "r") as source_data:
+            rows = csv.reader(source_data, delimiter=",")
+            header = next(rows, [])
+            columns = {key: column for column, key in enumerate(header)}
+            missing = [source for source, _, _ in core.MONSTER_SCHEMAS[monster_type] if source not in columns]
+            if header and missing:
+                raise ValueError(f"{filepath}, line 1: the header has no column {', '.join(missing)}.")
+            decode_monster = core.monster_decoder(monster_type, columns)
+            try:
+                # DictReader skips the empty lines as well.
+                yield from map(decode_monster, filter(None, rows))
+            except IndexError:
+                raise ValueError(f"{filepath}, line {rows.line_num}: the row is shorter than the header.") from None
+
+    elif ".json" not in filepath and ".xml" in filepath:
+        with open((filepath), "r") as source_data:
+            yield from map(core.monster_decoder(monster_type, XML_TAGS), iter_xml_elements(source_data))
+
+    else:
+        yield from map(core.monster_decoder(monster_type), iter_records(filepath))
+
+
+def read_file(filepath: str) -> List[Dict[str, Union[str, int]]]:
+    """
+    This function reads a file and acts according to its format
+    it will fit in one of the conditionals.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    Returns
+    -------
+    data_read:
+        The file received will be returned in python data types.
+    """
+    return list(iter_records(filepath))
@@ -0,0 +1,159 @@
+import re
+from string import Formatter
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple, Union
+
+# The width of every report line.
+REPORT_WIDTH: int = 80
+
+# The format specs written as they are in the compiled code, without nested fields or quotes.
+PLAIN_SPEC = re.compile(r"[^{}'\"\\\n]*")
+
+
+class ReportSection:
+    """
+    This class is a part of a report layout repeated for each item of
+    a list, e.g. one line for each digimon stage.
+
+    Parameters
+    ----------
+    key:
+        The report value with the list, each item is a dict with the
+        fields of the section lines.
+
+    lines:
+        The section layout, in the same format of ReportTemplate.
+    """
+
+    def __init__(self, key: str, lines: Sequence[Union[str, Tuple[str, int], "ReportSection"]]) -> None:
+        self.key = key
+        self.lines = lines
+
+
+class ReportTemplate:
+    """
+    This class compiles a report layout once into a render function,
+    and renders it for many reports, all the pieces of a report joined
+    at once.
+
+    Each line of the layout is a str.format string, where each field
+    is replaced by a report value with its format spec, e.g. {name:<28}
+    fills 28 columns. The line becomes an f-string of the render
+    function, so the layout is never parsed again, and the values are
+    never read as a format string, so a name with braces is shown as
+    it is.
+
+    Parameters
+    ----------
+    lines:
+        The report layout, each line can be:
+        - a string, written as it is rendered.
+        - a (string, width) pair, filled with spaces up to the width.
+        - a ReportSection, rendered for each item of a list.
+    """
+
+    def __init__(self, lines: Sequence[Union[str, Tuple[str, int], ReportSection]]) -> None:
+        self.constants: List[str] = []
+        code = ["def render(values):", "    parts = []", "    append = parts.append"]
+        self.compile(lines, "values", 1, code)
+        code.append("    return ''.join(parts)")
+        self.source = "\n".join(code)
+
+        namespace: Dict[str, Any] = {f"text{idx}": text for idx, text in enumerate(self.constants)}
+        exec(compile(self.source, "<report template>", "exec"), namespace)
+        self.renderer: Callable[[Mapping[str, Any]], str] = namespace["render"]
+
+    def constant(self, text: str) -> str:
+        """
+        This function keeps a text of the layout for the render
+        function, so it isn't escaped in its code.
+
+        Returns
+        -------
+            The name of the text in the render function.
+        """
+        self.constants.append(text)
+        return f"text{len(self.constants) - 1}"
+
+    def compile(
+        self, lines: Sequence[Union[str, Tuple[str, int], ReportSection]], item: str, depth: int, code: List[str]
+    ) -> None:
+        """
+        This function writes the code that renders the lines.
+
+        The lines without fields are rendered here, and the ones in a
+        row are added at once. The fields are read from item, the
+        values of the report or the item of a section.
+
+        Parameters
+        ----------
+        lines:
+            The report layout.
+
+        item:
+            The name of the dict with the fields of the lines.
+
+        depth:
+            The indentation of the code.
+
+        code:
+            The lines of the render function, the new ones are added.
+        """
+        indent = "    " * depth
+        pending: List[str] = []
+
+        def flush() -> None:
+            if pending:
+                code.append(f"{indent}append({self.constant(''.join(pending))})")
+                pending.clear()
+
+        for line in lines:
+            if isinstance(line, ReportSection):
+                flush()
+                section_item = f"item{depth}"
+                code.append(f"{indent}for {section_item} in {item}[{line.key!r}]:")
+                size = len(code)
+                self.compile(line.lines, section_item, depth + 1, code)
+                if len(code) == size:
+                    code.append(f"{indent}    pass")
+                continue
+
+            text, width = (line, 0) if isinstance(line, str) else line
+            parsed = list(Formatter().parse(text))
+            if all(field is None for _, field, _, _ in parsed):
+                pending.append("".join(literal for literal, _, _, _ in parsed).ljust(width) + "\n")
+                continue
+
+            flush()
+            pieces: List[str] = []
+            for literal, field, spec, conversion in parsed:
+                if literal:
+                    pieces.append("{" + self.constant(literal) + "}")
+                if field is None:
+                    continue
+                if not field.isidentifier():
+                    raise ValueError(f"the report field {field!r} must be a name")
+                if not PLAIN_SPEC.fullmatch(spec or ""):
+                    raise ValueError(f"the format spec of the report field {field!r} can't have braces or quotes")
+                conversion = f"!{conversion}" if conversion else ""
+                spec = f":{spec}" if spec else ""
+                pieces.append("{" + f"{item}[{field!r}]{conversion}{spec}" + "}")
+
+            expression = 'f"' + "".join(pieces) + '"'
+            code.append(f"{indent}append({expression}.ljust({width}))" if width else f"{indent}append({expression})")
+            pending.append("\n")
+        flush()
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """
+        This function renders one report.
+
+        Parameters
+        ----------
+        values:
+            The value of each field of the layout.
+
+        Returns
+        -------
+            The report text.
+        """
+        return self.renderer(values)
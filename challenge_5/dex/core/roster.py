@@ -0,0 +1,238 @@
+from array import array
+from core.formatter import MONSTER_SCHEMAS
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Union
+
+# The patterned keys of each monster type and how each one is stored in the roster.
+ROSTER_FIELDS: Dict[str, List[Tuple[str, str]]] = {
+    monster_type: [(field, kind) for _, field, kind in schema] for monster_type, schema in MONSTER_SCHEMAS.items()
+}
+
+
+class StringTable:
+    """
+    This class keeps each different string only once, the roster
+    stores the string position in the table instead of the string.
+    """
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def __getstate__(self) -> List[str]:
+        # The codes can be rebuilt from the values, no need to pickle both.
+        return self.values
+
+    def __setstate__(self, values: List[str]) -> None:
+        self.values = values
+        self.codes = {value: code for code, value in enumerate(values)}
+
+    def code(self, value: str) -> int:
+        """
+        This function returns the position of the string in the
+        table, adding it when it is new.
+        """
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class Roster:
+    """
+    This class stores a list of monsters by columns: one array of
+    integers for each stat, one StringTable plus an array of codes
+    for each text field, and a bitset for each True/False field.
+
+    It costs a few dozen bytes per monster instead of a dict, and a
+    scan over one stat only touches that stat's array. It can still
+    be used as a list of monster dicts, e.g. roster[0] or a for loop,
+    the dicts are built when they are asked for.
+
+    Parameters
+    ----------
+    monster_type:
+        "pokemon" or "digimon".
+    """
+
+    def __init__(self, monster_type: str) -> None:
+        self.monster_type = monster_type
+        self.fields = ROSTER_FIELDS[monster_type]
+        self.size = 0
+        self.columns: Dict[str, Union[array, bytearray]] = {}
+        self.tables: Dict[str, StringTable] = {}
+        for field, kind in self.fields:
+            if kind == "int":
+                self.columns[field] = array("i")
+            elif kind == "str":
+                self.columns[field] = array("I")
+                self.tables[field] = StringTable()
+            else:
+                self.columns[field] = bytearray()
+
+    @classmethod
+    def from_monsters(cls, monsters: Iterable[Dict[str, Union[str, int]]], monster_type: str) -> "Roster":
+        """
+        This function builds a roster from the monsters returned by
+        iter_monsters, it can be a list or a generator.
+
+        Parameters
+        ----------
+        monsters:
+            The monsters to be stored.
+
+        monster_type:
+            "pokemon" or "digimon".
+
+        Returns
+        -------
+            The new roster.
+        """
+        roster = cls(monster_type)
+        append = roster.append
+        for monster in monsters:
+            append(monster)
+        return roster
+
+    def append(self, monster: Dict[str, Union[str, int]]) -> None:
+        """
+        This function adds one monster to the end of the roster.
+
+        Parameters
+        ----------
+        monster:
+            The monster with the patterned keys and types.
+        """
+        idx = self.size
+        for field, kind in self.fields:
+            column = self.columns[field]
+            if kind == "int":
+                column.append(monster[field])
+            elif kind == "str":
+                column.append(self.tables[field].code(monster[field]))
+            else:
+                if idx % 8 == 0:
+                    column.append(0)
+                if monster[field]:
+                    column[idx >> 3] |= 1 << (idx & 7)
+        self.size += 1
+
+    def value(self, field: str, idx: int) -> Union[str, int, bool]:
+        """
+        This function returns the value of one field of one monster.
+
+        Parameters
+        ----------
+        field:
+            The patterned key.
+
+        idx:
+            The monster position in the roster.
+
+        Returns
+        -------
+            The stored value, as int, str or bool.
+        """
+        column = self.columns[field]
+        table = self.tables.get(field)
+        if table is not None:
+            return table.values[column[idx]]
+        if isinstance(column, bytearray):
+            return bool(column[idx >> 3] & (1 << (idx & 7)))
+        return column[idx]
+
+    def column(self, field: str) -> Union[array, List[bool]]:
+        """
+        This function returns all the values of a stat, or the string
+        codes for a text field.
+
+        Parameters
+        ----------
+        field:
+            The patterned key.
+
+        Returns
+        -------
+            The column values by monster position.
+        """
+        column = self.columns[field]
+        if isinstance(column, bytearray):
+            return [bool(column[idx >> 3] & (1 << (idx & 7))) for idx in range(self.size)]
+        return column
+
+    def count(self, field: str, value: Union[str, bool] = True) -> int:
+        """
+        This function counts the monsters that have the given value
+        in a text or True/False field.
+
+        Parameters
+        ----------
+        field:
+            The patterned key.
+
+        value:
+            The value to be counted, True by default.
+
+        Returns
+        -------
+            How many monsters have the value.
+        """
+        column = self.columns[field]
+        table = self.tables.get(field)
+        if table is not None:
+            code = table.codes.get(str(value))
+            return 0 if code is None else column.count(code)
+        if isinstance(column, bytearray):
+            total = bin(int.from_bytes(column, "little")).count("1")
+            return total if value else self.size - total
+        return column.count(value)
+
+    def distinct(self, field: str) -> Set[str]:
+        """
+        This function returns the different values of a text field,
+        straight from its StringTable.
+
+        Parameters
+        ----------
+        field:
+            The patterned key, e.g. "name".
+
+        Returns
+        -------
+            The set of values.
+        """
+        return set(self.tables[field].values)
+
+    def group_indexes(self, field: str) -> Dict[str, List[int]]:
+        """
+        This function returns the monster positions for each value
+        of a text field, in the order the values were found.
+
+        Parameters
+        ----------
+        field:
+            The patterned key, e.g. "stage".
+
+        Returns
+        -------
+            The positions by field value.
+        """
+        table = self.tables[field]
+        indexes: List[List[int]] = [[] for _ in table.values]
+        for idx, code in enumerate(self.columns[field]):
+            indexes[code].append(idx)
+        return {name: indexes[code] for code, name in enumerate(table.values) if indexes[code]}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, idx: int) -> Dict[str, Union[str, int, bool]]:
+        if idx < 0:
+            idx += self.size
+        if not 0 <= idx < self.size:
+            raise IndexError("roster index out of range")
+        return {field: self.value(field, idx) for field, _ in self.fields}
+
+    def __iter__(self) -> Iterator[Dict[str, Union[str, int, bool]]]:
+        for idx in range(self.size):
+            yield self[idx]
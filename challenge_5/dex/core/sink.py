@@ -0,0 +1,404 @@
+import atexit
+import itertools
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+# The writer thread is started only with background=True, a single report doesn't import threading.
+if TYPE_CHECKING:
+    from queue import Queue
+    from threading import Thread
+
+try:
+    import fcntl
+except ImportError:  # Windows, the appends rely only on O_APPEND.
+    fcntl = None  # type: ignore
+
+# What is done when the report file already exists.
+ON_EXISTS_MODES: Tuple[str, ...] = ("append", "overwrite", "version")
+ON_EXISTS: str = os.environ.get("DEX_ON_EXISTS", "overwrite")
+
+# The temporary files of the atomic writes are unique to each process and write, next() of
+# the counter is atomic, so two threads never get the same number.
+TEMP_COUNTER = itertools.count()
+
+
+def report_path(monster_type: str, id_number: str) -> str:
+    """
+    This function returns the file name of a report.
+
+    Parameters
+    ----------
+    monster_type:
+        The kind of report, e.g. "battle" or "pokemon-trivia".
+
+    id_number:
+        The id provided by the user, 0 when it isn't provided.
+
+    Returns
+    -------
+        The report file name, e.g. 1_battle.txt.
+    """
+    return f"{id_number}_{monster_type}.txt"
+
+
+def write_all(descriptor: int, data: bytes) -> None:
+    """
+    This function writes the whole data to a file descriptor, os.write
+    can write only a part of it.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(descriptor, view):]
+
+
+def sync_directory(filepath: str) -> None:
+    """
+    This function saves the directory of a file to the disk, so a file
+    renamed into it is kept after a crash.
+    """
+    try:
+        descriptor = os.open(os.path.dirname(os.path.abspath(filepath)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def write_temp(filepath: str, data: bytes, sync: bool) -> str:
+    """
+    This function writes the data in a new temporary file next to the
+    report, with the permissions of a file created by open.
+
+    Returns
+    -------
+        The temporary file path.
+    """
+    temp_path = f"{filepath}.{os.getpid()}.{next(TEMP_COUNTER)}.tmp"
+    descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        write_all(descriptor, data)
+        if sync:
+            os.fsync(descriptor)
+    except BaseException:
+        os.close(descriptor)
+        os.remove(temp_path)
+        raise
+    os.close(descriptor)
+    return temp_path
+
+
+def write_atomic(filepath: str, data: bytes, sync: bool = True) -> str:
+    """
+    This function replaces the file content at once, the data is
+    written in a temporary file that is renamed over the file, so a
+    reader finds the old report or the new one, never half of it.
+
+    Parameters
+    ----------
+    filepath:
+        The report file.
+
+    data:
+        The new content.
+
+    sync:
+        Whether the data is saved to the disk before the rename.
+
+    Returns
+    -------
+        The file path.
+    """
+    temp_path = write_temp(filepath, data, sync)
+    try:
+        os.replace(temp_path, filepath)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    if sync:
+        sync_directory(filepath)
+    return filepath
+
+
+def write_version(filepath: str, data: bytes, sync: bool = True, versions: Optional[Dict[str, int]] = None) -> str:
+    """
+    This function saves the data in a new file, the report file when
+    it doesn't exist, otherwise the first free version of it, e.g.
+    1_battle.1.txt, 1_battle.2.txt.
+
+    The temporary file is linked to the new name, the link fails when
+    the name is taken, so two writers never get the same version.
+
+    Parameters
+    ----------
+    filepath:
+        The report file.
+
+    data:
+        The report.
+
+    sync:
+        Whether the data is saved to the disk.
+
+    versions:
+        The next free version of each file, the search starts there
+        and it is updated, so many versions of a file don't look for
+        a free one from the first every time.
+
+    Returns
+    -------
+        The file path written.
+    """
+    versions = {} if versions is None else versions
+    root, extension = os.path.splitext(filepath)
+    temp_path = write_temp(filepath, data, sync)
+    try:
+        for version in itertools.count(versions.get(filepath, 0)):
+            target = filepath if version == 0 else f"{root}.{version}{extension}"
+            try:
+                os.link(temp_path, target)
+                versions[filepath] = version + 1
+                break
+            except FileExistsError:
+                continue
+    finally:
+        os.remove(temp_path)
+    if sync:
+        sync_directory(target)
+    return target
+
+
+def append_locked(filepath: str, data: bytes, sync: bool = True) -> str:
+    """
+    This function adds the data to the end of the file in one write,
+    holding an exclusive lock of the file, so many processes can
+    append to the same report without mixing their lines.
+
+    Parameters
+    ----------
+    filepath:
+        The report file, it is created when it doesn't exist.
+
+    data:
+        The report.
+
+    sync:
+        Whether the data is saved to the disk before the lock is
+        released.
+
+    Returns
+    -------
+        The file path.
+    """
+    descriptor = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+    try:
+        if fcntl is not None:
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+        write_all(descriptor, data)
+        if sync:
+            os.fsync(descriptor)
+    finally:
+        # Closing the file also releases the lock.
+        os.close(descriptor)
+    return filepath
+
+
+class ReportSink:
+    """
+    This class saves the reports in their files, without asking
+    anything, with the same choice for every existing file.
+
+    Parameters
+    ----------
+    on_exists:
+        What is done when the report file already exists:
+        - "append": the report is added to the end of the file.
+        - "overwrite": the file is replaced by the report.
+        - "version": the report is saved in a new numbered file.
+
+    sync:
+        Whether each report is saved to the disk (fsync) before save
+        returns, or before its batch is done in the background.
+
+    background:
+        When True, save returns at once and a writer thread saves the
+        reports. The reports waiting at the same time are written
+        together: the appends to a file become one write and one
+        fsync, and only the last overwrite of a file is written.
+        flush waits for them, and they are flushed when Python exits.
+
+    batch_size:
+        The most reports written together by the writer thread.
+    """
+
+    def __init__(
+        self, on_exists: str = ON_EXISTS, sync: bool = True, background: bool = False, batch_size: int = 1024
+    ) -> None:
+        if on_exists not in ON_EXISTS_MODES:
+            raise ValueError(f"on_exists must be one of {', '.join(ON_EXISTS_MODES)}, not {on_exists!r}")
+        self.on_exists = on_exists
+        self.sync = sync
+        self.batch_size = batch_size
+        self.versions: Dict[str, int] = {}
+        self.error: Optional[BaseException] = None
+        self.pending: "Optional[Queue[Optional[Tuple[str, bytes]]]]" = None
+        self.writer: "Optional[Thread]" = None
+        if background:
+            import queue
+            import threading
+
+            self.pending = queue.Queue()
+            self.writer = threading.Thread(target=self.write_batches, name="dex-report-sink", daemon=True)
+            self.writer.start()
+            atexit.register(self.close)
+
+    def save(self, data: str, filepath: str) -> str:
+        """
+        This function saves one report.
+
+        Parameters
+        ----------
+        data:
+            The report.
+
+        filepath:
+            The report file.
+
+        Returns
+        -------
+            The file path written, with the background writer it is the
+            report file, a version is only chosen when it is written.
+        """
+        encoded = data.encode("utf-8")
+        if self.pending is None:
+            if self.on_exists == "append":
+                return append_locked(filepath, encoded, self.sync)
+            if self.on_exists == "overwrite":
+                return write_atomic(filepath, encoded, self.sync)
+            return write_version(filepath, encoded, self.sync, self.versions)
+
+        self.raise_error()
+        self.pending.put((filepath, encoded))
+        return filepath
+
+    def write_batches(self) -> None:
+        """
+        This function is the writer thread, it takes every report
+        waiting and writes them together, until close.
+        """
+        import queue
+
+        assert self.pending is not None
+        running = True
+        while running:
+            batch: List[Tuple[str, bytes]] = []
+            item = self.pending.get()
+            while item is not None:
+                batch.append(item)
+                if len(batch) == self.batch_size:
+                    break
+                try:
+                    item = self.pending.get_nowait()
+                except queue.Empty:
+                    break
+            running = item is not None
+
+            try:
+                self.write_batch(batch)
+            except BaseException as error:
+                self.error = self.error or error
+            finally:
+                for _ in range(len(batch) + (0 if running else 1)):
+                    self.pending.task_done()
+
+    def write_batch(self, batch: List[Tuple[str, bytes]]) -> None:
+        """
+        This function writes the reports of a batch, in their order,
+        with one fsync for each file.
+        """
+        if self.on_exists == "version":
+            for filepath, data in batch:
+                write_version(filepath, data, self.sync, self.versions)
+            return
+
+        files: Dict[str, List[bytes]] = {}
+        for filepath, data in batch:
+            files.setdefault(filepath, []).append(data)
+        for filepath, reports in files.items():
+            if self.on_exists == "append":
+                append_locked(filepath, b"".join(reports), self.sync)
+            else:
+                write_atomic(filepath, reports[-1], self.sync)
+
+    def flush(self) -> None:
+        """
+        This function waits for the background writer to save every
+        report, it raises the first error it found.
+        """
+        if self.pending is not None:
+            self.pending.join()
+        self.raise_error()
+
+    def close(self) -> None:
+        """
+        This function saves the reports left and stops the background
+        writer, a closed sink saves the next reports by itself.
+        """
+        if self.writer is not None and self.pending is not None:
+            self.pending.put(None)
+            self.writer.join()
+            self.writer = None
+            self.pending = None
+            atexit.unregister(self.close)
+        self.raise_error()
+
+    def raise_error(self) -> None:
+        """
+        This function raises the error found by the writer thread once.
+        """
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+
+# The sink of the reports shown by core.io, made on the first report with ON_EXISTS.
+REPORT_SINK: Optional[ReportSink] = None
+
+
+def configure_report_sink(on_exists: Optional[str] = None, sync: bool = True, background: bool = False) -> ReportSink:
+    """
+    This function replaces the sink of the reports, the reports left in
+    the previous one are saved first.
+
+    Parameters
+    ----------
+    on_exists:
+        "append", "overwrite" or "version", ON_EXISTS when it isn't
+        informed.
+
+    sync:
+        Whether each report is saved to the disk.
+
+    background:
+        Whether the reports are saved by a writer thread.
+
+    Returns
+    -------
+        The new sink.
+    """
+    global REPORT_SINK
+    if REPORT_SINK is not None:
+        REPORT_SINK.close()
+    REPORT_SINK = ReportSink(on_exists or ON_EXISTS, sync, background)
+    return REPORT_SINK
+
+
+def report_sink() -> ReportSink:
+    """
+    This function returns the sink of the reports, it is made with
+    ON_EXISTS the first time.
+    """
+    return REPORT_SINK if REPORT_SINK is not None else configure_report_sink()
@@ -0,0 +1,275 @@
+import core
+import hashlib
+import heapq
+import itertools
+import math
+from typing import Iterable, Iterator, List, Set, Tuple
+
+# The error used by --approx when no error is informed.
+DEFAULT_APPROX_ERROR: float = 0.02
+# How many names are hashed before the sketches are updated.
+SKETCH_BATCH_SIZE: int = 4096
+
+
+def name_hash(name: str) -> int:
+    """
+    This function returns a 64 bits hash of a monster name, the same
+    in every run, unlike the python hash of a string.
+
+    Parameters
+    ----------
+    name:
+        The monster name.
+
+    Returns
+    -------
+        The hash as a positive integer.
+    """
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "little")
+
+
+class HyperLogLog:
+    """
+    This class estimates how many different names were added, with
+    2 ** precision registers of one byte, whatever is the number of
+    names. The relative error is about 1.04 / sqrt(2 ** precision).
+
+    Parameters
+    ----------
+    precision:
+        How many bits of the hash choose the register, from 4 to 18.
+    """
+
+    def __init__(self, precision: int) -> None:
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def add(self, hashed: int) -> None:
+        """
+        This function adds one hashed name to the registers.
+
+        Parameters
+        ----------
+        hashed:
+            The name_hash of the name.
+        """
+        self.update((hashed,))
+
+    def update(self, hashes: Iterable[int]) -> None:
+        """
+        This function adds many hashed names to the registers.
+
+        Parameters
+        ----------
+        hashes:
+            The name_hash of each name.
+        """
+        registers = self.registers
+        shift = 64 - self.precision
+        rest_mask = (1 << shift) - 1
+        for hashed in hashes:
+            # The position of the first 1 bit, the rarer it is the more names were seen.
+            rank = shift - (hashed & rest_mask).bit_length() + 1
+            if rank > registers[hashed >> shift]:
+                registers[hashed >> shift] = rank
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        This function returns the HyperLogLog of the names added to
+        this one or to the other one.
+        """
+        merged = HyperLogLog(self.precision)
+        merged.registers = bytearray(map(max, self.registers, other.registers))
+        return merged
+
+    def count(self) -> int:
+        """
+        This function returns the estimated number of different names.
+        """
+        size = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        empty = self.registers.count(0)
+        # With few names most registers are empty, counting them is more precise.
+        if estimate <= 2.5 * size and empty:
+            estimate = size * math.log(size / empty)
+        return round(estimate)
+
+
+class MinHash:
+    """
+    This class keeps the size smallest hashes of the names added, a
+    one permutation MinHash, used to estimate how similar two groups
+    of names are. The error of the Jaccard index is about 1 / sqrt(size).
+
+    While fewer than size names were added it keeps every hash, so
+    the comparison of small rosters is exact.
+
+    Parameters
+    ----------
+    size:
+        How many hashes are kept.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        # A max heap of the smallest hashes, stored as negative numbers.
+        self.heap: List[int] = []
+        self.hashes: Set[int] = set()
+
+    def add(self, hashed: int) -> None:
+        """
+        This function adds one hashed name, keeping it only when it
+        is one of the size smallest.
+
+        Parameters
+        ----------
+        hashed:
+            The name_hash of the name.
+        """
+        self.update((hashed,))
+
+    def update(self, hashes: Iterable[int]) -> None:
+        """
+        This function adds many hashed names, keeping the size smallest.
+
+        Parameters
+        ----------
+        hashes:
+            The name_hash of each name.
+        """
+        heap = self.heap
+        kept = self.hashes
+        for hashed in hashes:
+            if len(heap) < self.size:
+                if hashed not in kept:
+                    heapq.heappush(heap, -hashed)
+                    kept.add(hashed)
+            # Once the heap is full most hashes are bigger than all the kept ones.
+            elif hashed < -heap[0] and hashed not in kept:
+                kept.discard(-heapq.heapreplace(heap, -hashed))
+                kept.add(hashed)
+
+    @property
+    def complete(self) -> bool:
+        """
+        This function tells if every hash added was kept.
+        """
+        return len(self.hashes) < self.size
+
+    def jaccard(self, other: "MinHash") -> float:
+        """
+        This function estimates the Jaccard index, the shared names
+        divided by all the names, between this MinHash and another.
+        """
+        smallest = heapq.nsmallest(min(self.size, other.size), self.hashes | other.hashes)
+        if not smallest:
+            return 1.0
+        shared = sum(1 for hashed in smallest if hashed in self.hashes and hashed in other.hashes)
+        return shared / len(smallest)
+
+
+class NameSketch:
+    """
+    This class replaces the set of names of a roster when the roster
+    is too big to keep every name, it uses a constant memory chosen
+    by the error accepted in the repeated and different counts.
+
+    Parameters
+    ----------
+    error:
+        The standard error of the sketches, e.g. 0.02 for 2%. The
+        error of the repeated count grows when the rosters share
+        few names, it is about error / sqrt(shared / all the names).
+    """
+
+    def __init__(self, error: float = DEFAULT_APPROX_ERROR) -> None:
+        self.error = error
+        precision = min(18, max(4, math.ceil(math.log2((1.04 / error) ** 2))))
+        self.cardinality = HyperLogLog(precision)
+        self.similarity = MinHash(math.ceil(1 / error**2))
+
+    def add(self, name: str) -> None:
+        """
+        This function adds one monster name to the sketch.
+        """
+        self.consume((name,))
+
+    def consume(self, names: Iterable[str]) -> "NameSketch":
+        """
+        This function adds every name of an iterable to the sketch.
+
+        Returns
+        -------
+        self:
+            The same sketch, so the calls can be chained.
+        """
+        names = iter(names)
+        # Hashed in batches, each sketch updates a whole batch in one call.
+        while True:
+            hashes = list(map(name_hash, itertools.islice(names, SKETCH_BATCH_SIZE)))
+            if not hashes:
+                return self
+            self.cardinality.update(hashes)
+            self.similarity.update(hashes)
+
+    def __len__(self) -> int:
+        if self.similarity.complete:
+            return len(self.similarity.hashes)
+        return self.cardinality.count()
+
+    def overlap(self, other: "NameSketch") -> Tuple[int, int]:
+        """
+        This function estimates how many names are in both sketches,
+        and how many are only in this one, the same numbers
+        intersection and difference give for two sets.
+
+        Parameters
+        ----------
+        other:
+            The sketch of the other roster.
+
+        Returns
+        -------
+            The repeated and the different names.
+        """
+        if self.similarity.complete and other.similarity.complete:
+            repeated = len(self.similarity.hashes & other.similarity.hashes)
+            return repeated, len(self.similarity.hashes) - repeated
+
+        union = self.cardinality.merge(other.cardinality).count()
+        repeated = min(round(self.similarity.jaccard(other.similarity) * union), len(self), len(other))
+        return repeated, max(0, len(self) - repeated)
+
+
+def sketch_roster(filepath: str, monster_type: str, error: float) -> Tuple[core.RosterStats, NameSketch]:
+    """
+    This function reads a file one monster at a time, gathering the
+    info statistics and the name sketch in the same pass, so the
+    memory doesn't grow with the file.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    monster_type:
+        "pokemon" or "digimon".
+
+    error:
+        The relative error accepted in the name sketch.
+
+    Returns
+    -------
+        The roster statistics and the name sketch.
+    """
+    roster_stats = core.RosterStats(monster_type, ["attack"])
+
+    def counted_names() -> Iterator[str]:
+        for monster in core.iter_monsters(filepath, monster_type):
+            roster_stats.update(monster)
+            yield monster["name"]
+
+    # The statistics are updated while the names are consumed, so the names are hashed in batches.
+    names = NameSketch(error).consume(counted_names())
+    return roster_stats, names
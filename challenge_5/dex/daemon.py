@@ -0,0 +1,245 @@
+import client
+import contextlib
+import core
+import io
+import json
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Callable, Dict, List, Optional, Union
+
+# How many seconds the daemon waits for a request before it looks for data files changed
+# on disk, and how long a client can take to send its request.
+RELOAD_INTERVAL: float = float(os.environ.get("DEX_RELOAD_INTERVAL", 1.0))
+REQUEST_TIMEOUT: float = 5.0
+
+
+def check_request(request: object) -> Dict:
+    """
+    This function checks that a request sent by a client has the
+    shape of the ones sent by client.send_request.
+
+    Parameters
+    ----------
+    request:
+        The json decoded request.
+
+    Returns
+    -------
+        The same request.
+
+    Raises
+    ------
+    ValueError:
+        When the request is not an object, args is not a list of
+        strings, cwd is not a string or env is not an object of strings.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("the request must be an object.")
+    arguments = request.get("args")
+    if not isinstance(arguments, list) or not all(isinstance(argument, str) for argument in arguments):
+        raise ValueError("args must be a list of strings.")
+    if not isinstance(request.get("cwd"), str):
+        raise ValueError("cwd must be a string.")
+    env = request.get("env", {})
+    if not isinstance(env, dict) or not all(isinstance(value, str) for value in env.values()):
+        raise ValueError("env must be an object of strings.")
+    return request
+
+
+def run_request(handler: Callable[[], None], request: Dict) -> Dict[str, Union[str, int]]:
+    """
+    This function runs the CLI with the arguments of a request, from
+    the directory of the client, and keeps what it prints.
+
+    The rosters loaded by the previous requests are still in memory,
+    so only the files never seen, or changed, are read again.
+
+    Parameters
+    ----------
+    handler:
+        The main function of the CLI, it reads sys.argv.
+
+    request:
+        The arguments, directory and environment sent by the client.
+
+    Returns
+    -------
+        The stdout, stderr and exit status of the run.
+
+    Raises
+    ------
+    ValueError:
+        When the request doesn't have the shape checked by check_request.
+    """
+    arguments: List[str] = list(check_request(request)["args"])
+    on_exists = request.get("env", {}).get("DEX_ON_EXISTS")
+    if on_exists is not None and "--on-exists" not in arguments:
+        arguments = ["--on-exists", on_exists] + arguments
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    status = 0
+    if "--serve" in arguments:
+        stdout.write("WARNING: The daemon is already running.\n")
+        return dict(stdout=stdout.getvalue(), stderr="", status=status)
+
+    directory = os.getcwd()
+    saved_argv, saved_stdin = sys.argv, sys.stdin
+    # Each request starts with the sink of the environment the daemon was started with.
+    core.configure_report_sink()
+    try:
+        os.chdir(request["cwd"])
+        sys.argv = ["main.py"] + arguments
+        # quit() closes stdin, and nothing can be typed in the daemon.
+        sys.stdin = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                handler()
+            except SystemExit as error:
+                # Like python, no code is a success and a message is printed as an error.
+                if isinstance(error.code, int):
+                    status = error.code
+                elif error.code is not None:
+                    print(error.code, file=sys.stderr)
+                    status = 1
+            except Exception:
+                traceback.print_exc()
+                status = 1
+    except OSError as error:
+        stdout.write(f"WARNING: {error}\n")
+        status = 1
+    finally:
+        sys.argv, sys.stdin = saved_argv, saved_stdin
+        os.chdir(directory)
+    return dict(stdout=stdout.getvalue(), stderr=stderr.getvalue(), status=status)
+
+
+def reload_stale() -> None:
+    """
+    This function loads again the rosters in memory whose file changed
+    on disk, so the next request finds them ready. A file that can't
+    be read now, e.g. half written, is left to the next request.
+    """
+    for filepath, monster_type in core.stale_rosters():
+        try:
+            core.load_monsters(filepath, monster_type)
+        except Exception as error:
+            print(f"WARNING: {filepath} could not be reloaded: {error}")
+            continue
+        print(f"{filepath} changed, reloaded.")
+
+
+def handle_connection(connection: socket.socket, handler: Callable[[], None]) -> None:
+    """
+    This function reads one request from a client, runs it, and sends
+    back the result.
+
+    Parameters
+    ----------
+    connection:
+        The socket accepted from the client.
+
+    handler:
+        The main function of the CLI.
+    """
+    connection.settimeout(REQUEST_TIMEOUT)
+    try:
+        request = check_request(json.loads(client.receive_all(connection).decode("utf-8")))
+    except OSError as error:
+        print(f"WARNING: The request could not be read: {error}")
+        return
+    except ValueError as error:
+        # The client gets an error status instead of a closed connection.
+        print(f"WARNING: Invalid request: {error}")
+        send_response(connection, dict(stdout="", stderr=f"WARNING: Invalid request: {error}\n", status=1))
+        return
+
+    start = time.perf_counter()
+    response = run_request(handler, request)
+    elapsed = time.perf_counter() - start
+    print(f"{elapsed * 1e6:.0f} us | status {response['status']} | {' '.join(request['args'])}")
+    send_response(connection, response)
+
+
+def send_response(connection: socket.socket, response: Dict[str, Union[str, int]]) -> None:
+    """
+    This function sends the result of a request back to the client.
+
+    Parameters
+    ----------
+    connection:
+        The socket accepted from the client.
+
+    response:
+        The stdout, stderr and exit status of the run.
+    """
+    try:
+        connection.sendall(json.dumps(response).encode("utf-8"))
+    except OSError as error:
+        print(f"WARNING: The client left before the result was sent: {error}")
+
+
+def serve(handler: Callable[[], None], socket_path: Optional[str] = None) -> None:
+    """
+    This function runs the daemon, it answers the requests of the
+    clients one at a time until it gets SIGTERM or SIGINT.
+
+    Parameters
+    ----------
+    handler:
+        The main function of the CLI, it runs each request.
+
+    socket_path:
+        The Unix socket to listen on, client.SOCKET_PATH by default.
+    """
+    socket_path = socket_path or client.SOCKET_PATH
+    if os.path.exists(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(socket_path)
+            running = True
+        except OSError:
+            running = False
+        if running:
+            print(f"WARNING: A daemon is already running on {socket_path}.")
+            quit()
+        # Left by a daemon that didn't stop cleanly.
+        os.unlink(socket_path)
+
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        # Only the user who started the daemon can connect to it.
+        umask = os.umask(0o177)
+        try:
+            server.bind(socket_path)
+        finally:
+            os.umask(umask)
+        server.listen(64)
+        server.settimeout(RELOAD_INTERVAL)
+        print(f"Monster Dex daemon listening on {socket_path}.")
+
+        reloaded_at = time.monotonic()
+        try:
+            while True:
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    connection = None
+                if connection is not None:
+                    with connection:
+                        try:
+                            handle_connection(connection, handler)
+                        except Exception:
+                            # One request never stops the daemon, nor removes its socket.
+                            traceback.print_exc()
+                if time.monotonic() - reloaded_at >= RELOAD_INTERVAL:
+                    reload_stale()
+                    reloaded_at = time.monotonic()
+        except KeyboardInterrupt:
+            print("Monster Dex daemon stopped.")
+        finally:
+            os.unlink(socket_path)
@@ -12,6 +12,18 @@ def main() -> None:
 
     id_number: int = 0
 
+    # --on-exists works with every command, it is taken out before them.
+    if "--on-exists" in sys.argv:
+        option = sys.argv.index("--on-exists")
+        if option + 1 == len(sys.argv) or sys.argv[option + 1] not in core.ON_EXISTS_MODES:
+            print(f"WARNING: --on-exists needs one of {', '.join(core.ON_EXISTS_MODES)}.\n{core.client_usage()}")
+            quit()
+        core.configure_report_sink(sys.argv[option + 1])
+        del sys.argv[option:option + 2]
+    elif core.ON_EXISTS not in core.ON_EXISTS_MODES:
+        print(f"WARNING: DEX_ON_EXISTS needs one of {', '.join(core.ON_EXISTS_MODES)}.\n{core.client_usage()}")
+        quit()
+
     command_1: str = sys.argv[1]
     if command_1 == "--help":
         if len(sys.argv) == 2:
@@ -46,34 +58,188 @@ def main() -> None:
             print(f"WARNING! Incorrect amount of arguments.\n{core.client_usage()}")
             quit()
 
-        data_arq1: Dict[str, Union[str, int]] = core.read_file(filepath_1)
         if "pokemon" in filepath_1:
-            data_1: Dict[str, Union[str, int]] = core.cast_to_lower(data_arq1, "pokemon")
-            info: Dict[str, Union[str, int]] = menu.pokemon_trivia(data_1)
+            info: Dict[str, Union[str, int]] = menu.pokemon_trivia(core.load_monsters(filepath_1, "pokemon"))
             core.show_pokemon_trivia(info, id_number)
             quit()
 
         elif "digimon" in filepath_1:
-            data_1 = core.cast_to_lower(data_arq1, "digimon")
-            info = menu.digimon_trivia(data_1)
+            info = menu.digimon_trivia(core.load_monsters(filepath_1, "digimon"))
             core.show_digimon_trivia(info, id_number)
             quit()
 
+    elif command_1 == "--clear-cache":
+        if len(sys.argv) == 2:
+            removed = core.clear_cache()
+        elif len(sys.argv) == 3:
+            filepath_1 = sys.argv[2]
+            if not os.path.exists(filepath_1):
+                print(f"WARNING: File {filepath_1} does not exist.")
+                quit()
+            removed = core.clear_cache(filepath_1)
+        else:
+            print(f"WARNING! Incorrect amount of arguments.\n{core.client_usage()}")
+            quit()
+        print(f"{removed} cache entries removed.")
+        quit()
+
+    elif command_1 == "--serve":
+        if len(sys.argv) == 2:
+            socket_path = None
+        elif len(sys.argv) == 4 and sys.argv[2] == "--socket":
+            socket_path = sys.argv[3]
+        else:
+            print(f"WARNING! Incorrect amount of arguments.\n{core.client_usage()}")
+            quit()
+
+        # The daemon is imported only here, the other commands don't need sockets.
+        import daemon
+
+        daemon.serve(main, socket_path)
+        quit()
+
+    elif command_1 == "--tournament":
+        if len(sys.argv) < 3 or len(sys.argv) % 2 == 0:
+            print(f"WARNING! Incorrect amount of arguments.\n{core.client_usage()}")
+            quit()
+
+        directory = sys.argv[2]
+        if not os.path.isdir(directory):
+            print(f"WARNING: Directory {directory} does not exist.")
+            quit()
+
+        team_size = 3
+        workers = None
+        for option, value in zip(sys.argv[3::2], sys.argv[4::2]):
+            if option == "--id":
+                id_number = int(value)
+            elif option == "--team-size":
+                team_size = int(value)
+                if team_size < 1:
+                    print("WARNING: Team size must be at least 1.\n")
+                    quit()
+            elif option == "--workers":
+                workers = int(value)
+                if workers < 1:
+                    print(f"WARNING: --workers needs at least 1 process.\n{core.client_usage()}")
+                    quit()
+            else:
+                print(f"WARNING: This command does not exist.\n{core.client_usage()}")
+                quit()
+
+        filepaths = menu.list_rosters(directory)
+        if len(filepaths) < 2:
+            print(f"WARNING: A tournament needs at least two rosters in {directory}.")
+            quit()
+
+        if all("pokemon" in os.path.basename(filepath) for filepath in filepaths):
+            monster_type = "pokemon"
+        elif all("digimon" in os.path.basename(filepath) for filepath in filepaths):
+            monster_type = "digimon"
+        else:
+            print(f"WARNING: Different type of monsters.\n{core.client_usage()}")
+            quit()
+
+        rosters: Dict[str, core.Roster] = {}
+        loaded = core.load_many(filepaths, [monster_type] * len(filepaths), workers)
+        for filepath, roster in zip(filepaths, loaded):
+            if team_size > len(roster):
+                print(f"WARNING: Team size bigger than the monster list of {filepath}.\n")
+                quit()
+            rosters[os.path.basename(filepath)] = roster
+
+        standings = menu.run_tournament(rosters, team_size, workers)
+        core.show_tournament_standings(standings, id_number)
+        quit()
+
+    elif command_1 == "--compare":
+        filepaths = []
+        json_path = None
+        arguments = iter(sys.argv[2:])
+        for argument in arguments:
+            if argument in ("--id", "--json"):
+                value = next(arguments, None)
+                if value is None:
+                    print(f"WARNING! Incorrect amount of arguments.\n{core.client_usage()}")
+                    quit()
+                if argument == "--id":
+                    id_number = int(value)
+                else:
+                    json_path = value
+            elif os.path.isdir(argument):
+                filepaths += menu.list_rosters(argument)
+            elif os.path.exists(argument):
+                filepaths.append(argument)
+            else:
+                print(f"WARNING: File {argument} does not exist.")
+                quit()
+
+        if len(filepaths) < 2:
+            print(f"WARNING: Compare needs at least two rosters.\n{core.client_usage()}")
+            quit()
+
+        if all("pokemon" in os.path.basename(filepath) for filepath in filepaths):
+            monster_type = "pokemon"
+        elif all("digimon" in os.path.basename(filepath) for filepath in filepaths):
+            monster_type = "digimon"
+        else:
+            print(f"WARNING: Different type of monsters.\n{core.client_usage()}")
+            quit()
+
+        rosters = {}
+        for filepath, roster in zip(filepaths, core.load_many(filepaths, [monster_type] * len(filepaths))):
+            player = os.path.basename(filepath)
+            # Two directories can have a file with the same name.
+            if player in rosters:
+                player = filepath
+            rosters[player] = roster
+
+        comparison = menu.compare_rosters(rosters)
+        core.show_compare(comparison, id_number)
+        if json_path is not None:
+            core.save_compare_json(comparison, json_path)
+        quit()
+
     elif command_1 == "--player1":
-        if len(sys.argv) <= 5:
+        arguments = sys.argv
+        team_size = 3
+        if "--team-size" in arguments:
+            option = arguments.index("--team-size")
+            if option + 1 == len(arguments) or not arguments[option + 1].isdigit():
+                print(f"WARNING: --team-size needs a number.\n{core.client_usage()}")
+                quit()
+            team_size = int(arguments[option + 1])
+            arguments = arguments[:option] + arguments[option + 2:]
+
+        approx_error = None
+        if "--approx" in arguments:
+            option = arguments.index("--approx")
+            approx_error = core.DEFAULT_APPROX_ERROR
+            arguments = arguments[:option] + arguments[option + 1:]
+            if option < len(arguments) and not arguments[option].startswith("--"):
+                try:
+                    approx_error = float(arguments[option])
+                except ValueError:
+                    approx_error = 0.0
+                if not 0 < approx_error < 1:
+                    print(f"WARNING: --approx needs an error between 0 and 1.\n{core.client_usage()}")
+                    quit()
+                arguments = arguments[:option] + arguments[option + 1:]
+
+        if len(arguments) <= 5:
             print(f"WARNING! Incorrect amount of arguments.\n{core.client_usage()}")
             quit()
 
-        filepath_1 = sys.argv[2]
+        filepath_1 = arguments[2]
         if not os.path.exists(filepath_1):
             print(f"WARNING: File {filepath_1} does not exist.")
             quit()
 
-        command_2 = sys.argv[3]
+        command_2 = arguments[3]
 
         if command_2 == "--player2":
-            if len(sys.argv) >= 6:
-                filepath_2 = sys.argv[4]
+            if len(arguments) >= 6:
+                filepath_2 = arguments[4]
                 if not os.path.exists(filepath_2):
                     print(f"WARNING: File {filepath_2} does not exist.")
                     quit()
@@ -82,13 +248,13 @@ def main() -> None:
             print(f"WARNING: This command does not exist.\n{core.client_usage()}")
             quit()
 
-        command_3 = sys.argv[5]
+        command_3 = arguments[5]
         command_4 = "0"
         print(command_3)
         if command_3 == "--id":
-            if len(sys.argv) == 8:
-                id_number = int(sys.argv[6])
-                command_4 = sys.argv[7]
+            if len(arguments) == 8:
+                id_number = int(arguments[6])
+                command_4 = arguments[7]
 
             else:
                 print(f"WARNING! Incorrect amount of arguments.\n{core.client_usage()}")
@@ -113,10 +279,21 @@ def main() -> None:
             elif "digimon" in filepath_2:
                 monster_type2 = "digimon"
 
-        data_arq1 = core.read_file(filepath_1)
-        data_arq2 = core.read_file(filepath_2)
-        data_1 = core.cast_to_lower(data_arq1, monster_type1)
-        data_2 = core.cast_to_lower(data_arq2, monster_type2)
+        if (command_3 == "--info" or command_4 == "--info") and approx_error is not None:
+            # The files are streamed into sketches, they are never kept in memory.
+            roster_stats_1, dataset_1 = core.sketch_roster(filepath_1, monster_type1, approx_error)
+            roster_stats_2, dataset_2 = core.sketch_roster(filepath_2, monster_type2, approx_error)
+            info = menu.process_info(
+                [], [], dataset_1, dataset_2, monster_type1, monster_type2, roster_stats_1, roster_stats_2
+            )
+            if monster_type1 == "pokemon":
+                core.show_info_pokemon([], [], info, id_number, monster_type1)
+                quit()
+            if monster_type1 == "digimon":
+                core.show_info_digimon(info, id_number, monster_type1)
+                quit()
+
+        data_1, data_2 = core.load_many([filepath_1, filepath_2], [monster_type1, monster_type2])
 
         if command_3 == "--info" or command_4 == "--info":
             dataset_1 = core.cast_to_set(data_1)
@@ -131,10 +308,14 @@ def main() -> None:
                 core.show_info_digimon(info, id_number, monster_type1)
                 quit()
         elif command_3 == "--battle" or command_4 == "--battle":
-            team_size = int(
-                input("How many monsters will participate the battle? ")
-            )
-            battle = menu.select_battle_team(data_1, data_2, team_size)
+            if team_size < 1:
+                print("WARNING: Team size must be at least 1.\n")
+                quit()
+            try:
+                battle = menu.select_battle_team(data_1, data_2, team_size)
+            except ValueError as error:
+                print(f"WARNING: {error}\n")
+                quit()
             result = menu.start_battle(battle, team_size)
             core.show_battle_winner(result, id_number)
             quit()
@@ -1,3 +1,28 @@
-from menu.battle import select_battle_team, start_battle  # noqa: F401
-from menu.info import process_info  # noqa: F401
-from menu.trivia import pokemon_trivia, digimon_trivia  # noqa: F401
+from importlib import import_module
+from typing import Any, Dict, List
+
+# The names exported by menu, by module, imported the first time one of them is used like in core.
+MODULE_EXPORTS: Dict[str, List[str]] = {
+    "menu.battle": ["select_battle_team", "select_team", "start_battle", "team_rank"],
+    "menu.info": ["process_info"],
+    "menu.compare": ["compare_rosters"],
+    "menu.trivia": ["pokemon_trivia", "digimon_trivia"],
+    "menu.tournament": ["list_rosters", "run_tournament"],
+}
+EXPORTS: Dict[str, str] = {name: module for module, names in MODULE_EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    """
+    This function imports the module of an exported name the first
+    time it is used, and keeps the name in menu for the next uses.
+    """
+    if name not in EXPORTS:
+        raise AttributeError(f"module 'menu' has no attribute {name!r}")
+    value = getattr(import_module(EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(EXPORTS))
@@ -1,5 +1,66 @@
 import core
-from typing import Dict, Union, List
+import heapq
+import math
+from typing import Dict, Iterable, Sequence, Tuple, Union, List
+
+# The stats used to pick the team, the next one breaks the ties of the previous.
+TEAM_RANKING: Tuple[str, ...] = ("attack", "speed", "total")
+
+
+def team_rank(monster: Dict[str, Union[str, int]], ranking: Sequence[str] = TEAM_RANKING) -> Tuple[int, ...]:
+    """
+        This function returns the values used to rank a monster,
+        the stats missing in the monster count as 0.
+
+    Parameters
+    ----------
+    monster:
+        The monster dict.
+    ranking:
+        The stats compared, in order, e.g. attack then speed.
+
+    Returns
+    -------
+    Tuple:
+        The monster value for each ranking stat.
+
+    """
+    return tuple(monster.get(stat, 0) for stat in ranking)
+
+
+def select_team(
+    monsters: Iterable[Dict[str, Union[str, int]]], team_size: int, ranking: Sequence[str] = TEAM_RANKING
+) -> List[Dict[str, Union[str, int]]]:
+    """
+        This function picks the strongest monsters of one player,
+        ranked by attack, then by speed, then by total.
+
+        Only the team_size best monsters are kept in a heap while
+        the list is read, so the list is never fully sorted.
+
+    Parameters
+    ----------
+    monsters:
+        The player list of monsters, or a Roster.
+    team_size:
+        How many monsters will be in the team.
+    ranking:
+        The stats compared, in order.
+
+    Returns
+    -------
+    List:
+        The team_size strongest monsters, the first one in the list
+        wins a tie, the same as a stable sort.
+
+    """
+    if isinstance(monsters, core.Roster):
+        columns = [monsters.column(stat) for stat in ranking if stat in monsters.columns]
+        # The negative position is the last value compared, so the first monster wins a tie.
+        ranked = zip(*columns, range(0, -len(monsters), -1))
+        return [monsters[-rank[-1]] for rank in heapq.nlargest(team_size, ranked)]
+
+    return heapq.nlargest(team_size, monsters, key=lambda monster: team_rank(monster, ranking))
 
 
 def select_battle_team(
@@ -15,31 +76,49 @@ def select_battle_team(
     player_2_battle:
         the player 2 dict of monsters.
 
+    team_size:
+        How many monsters will be in each team.
+
     Returns
     -------
     AnswerBattle:
-        team_player1 = The three strongest monsters from player_1_battle.
-        team_player2 = The three strongest monsters from player_2_battle.
+        team_player1 = The team_size strongest monsters from player_1_battle.
+        team_player2 = The team_size strongest monsters from player_2_battle.
+
+    Raises
+    ------
+    ValueError:
+        When team_size is bigger than one of the monster lists.
 
     """
-    if team_size <= len(player_1_battle) or team_size <= len(player_2_battle):
-        team_player1 = []
-        team_player2 = []
-
-        attack_sorted_p1: List[str] = sorted(
-            player_1_battle, key=lambda strongest_mon: strongest_mon["attack"], reverse=True
-        )
-        attack_sorted_p2: List[str] = sorted(
-            player_2_battle, key=lambda strongest_mon: strongest_mon["attack"], reverse=True
-        )
-        for idx in range(team_size):
-            team_player1.append(attack_sorted_p1[idx])
-            team_player2.append(attack_sorted_p2[idx])
+    if team_size <= len(player_1_battle) and team_size <= len(player_2_battle):
+        team_player1 = select_team(player_1_battle, team_size)
+        team_player2 = select_team(player_2_battle, team_size)
 
         return core.AnswersBattle(p1_player=team_player1, p2_player=team_player2)
     else:
-        print("WARNING: Team size bigger than the monster list.\n")
-        quit()
+        raise ValueError("Team size bigger than the monster list.")
+
+
+def rounds_to_fall(hp: int, damage: float) -> int:
+    """
+        This function returns in which round a monster falls,
+        losing the same damage every round.
+
+    Parameters
+    ----------
+    hp:
+        The monster hp.
+    damage:
+        The damage taken in each round.
+
+    Returns
+    -------
+    int:
+        The round where the hp reaches zero, at least 1.
+
+    """
+    return max(1, math.ceil(hp / damage))
 
 
 def start_battle(monster_team: core.AnswersBattle, team_size) -> core.AnswersResult:
@@ -49,6 +128,11 @@ def start_battle(monster_team: core.AnswersBattle, team_size) -> core.AnswersRes
         simulate a battle between them to find the
         strongest team.
 
+        The damage is the same every round, so the round where each
+        monster falls is found with one division instead of playing
+        every round, and the first monster to fall is the one with
+        the lowest round, the first position wins a tie.
+
     Parameters
     ----------
     start_battle:
@@ -62,46 +146,28 @@ def start_battle(monster_team: core.AnswersBattle, team_size) -> core.AnswersRes
         of the battle.
 
     """
-    team_player1 = monster_team["p1_player"]
-    team_player2 = monster_team["p2_player"]
-    lowest_round = 9999
-
-    for position in range(team_size):
-        round_counter = 0
-        p1_monster_hp = team_player1[position]["hp"]
-        p2_monster_hp = team_player2[position]["hp"]
-        damage_player1_monster = (
-            0.5
-            * (team_player1[position]["attack"])
-            / (team_player2[position]["defense"])
-            + 1
-        )
-        damage_player2_monster = (
-            0.5
-            * (team_player2[position]["attack"])
-            / (team_player2[position]["defense"])
-            + 1
-        )
-
-        while True:
-            round_counter += 1
-
-            p1_monster_hp -= damage_player1_monster
-            p2_monster_hp -= damage_player2_monster
-
-            if p1_monster_hp <= 0:
-                if round_counter < lowest_round:
-                    first_mon_dead = team_player1[position]["name"]
-                    victorious_player = "2"
-                    lowest_round = round_counter
-                break
-            elif p2_monster_hp <= 0:
-                if round_counter < lowest_round:
-                    first_mon_dead = team_player2[position]["name"]
-                    victorious_player = "1"
-                    lowest_round = round_counter
-                break
-        print(round_counter)
+    team_player1 = monster_team["p1_player"][:team_size]
+    team_player2 = monster_team["p2_player"][:team_size]
+
+    p1_rounds = [
+        rounds_to_fall(p1_monster["hp"], 0.5 * p1_monster["attack"] / p2_monster["defense"] + 1)
+        for p1_monster, p2_monster in zip(team_player1, team_player2)
+    ]
+    p2_rounds = [
+        rounds_to_fall(p2_monster["hp"], 0.5 * p2_monster["attack"] / p2_monster["defense"] + 1)
+        for p2_monster in team_player2
+    ]
+    # On the same round the player 1 monster is checked first, so it falls first.
+    fall_rounds = [min(p1_round, p2_round) for p1_round, p2_round in zip(p1_rounds, p2_rounds)]
+    position = min(range(len(fall_rounds)), key=fall_rounds.__getitem__)
+
+    if p1_rounds[position] <= p2_rounds[position]:
+        first_mon_dead = team_player1[position]["name"]
+        victorious_player = "2"
+    else:
+        first_mon_dead = team_player2[position]["name"]
+        victorious_player = "1"
+
     return core.AnswersResult(
-        winner=victorious_player, rounds=lowest_round, loser_monster=first_mon_dead
+        winner=victorious_player, rounds=fall_rounds[position], loser_monster=first_mon_dead
     )
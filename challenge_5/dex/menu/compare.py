@@ -0,0 +1,83 @@
+import core
+from itertools import combinations
+from operator import itemgetter
+from typing import Dict, Iterable, Union
+
+
+def compare_rosters(rosters: Dict[str, Iterable[Dict[str, Union[str, int]]]]) -> core.AnswersCompare:
+    """
+        This function compares many rosters at once, by the monster
+        names, the same way process_info compares two players.
+
+        Each name is read once into an index that gives it a number,
+        and each roster keeps a bitset of the name numbers it has, so
+        the shared names of a pair of rosters are counted with a
+        bitwise and, instead of intersecting two sets of strings.
+
+    Parameters
+    ----------
+    rosters:
+        The monsters of each player, by player name, each one can be
+        a Roster or a list of monsters.
+
+    Returns
+    -------
+    AnswersCompare:
+        The totals of each roster, the names found only in it, the
+        shared names and the Jaccard index of each pair of rosters,
+        and how many rosters have each name.
+
+    """
+    players = list(rosters)
+    totals = []
+    distinct = []
+    name_counts = []
+    # The index gives each name a number, and each roster keeps a bitset
+    # where the bit of a name number is set when the roster has it.
+    name_index: Dict[str, int] = {}
+    bitsets = []
+    for player in players:
+        names = core.cast_to_set(rosters[player])
+        totals.append(len(rosters[player]))
+        distinct.append(len(names))
+        # The new names of this roster get the codes after the ones already given.
+        bitset = bytearray((len(name_index) + len(names)) // 8 + 1)
+        for name in names:
+            code = name_index.get(name)
+            if code is None:
+                code = name_index[name] = len(name_index)
+                name_counts.append(0)
+            name_counts[code] += 1
+            bitset[code >> 3] |= 1 << (code & 7)
+        bitsets.append(int.from_bytes(bitset, "little"))
+
+    # The names seen in more than one roster, so the unique ones are the others.
+    seen_once = seen_more = 0
+    for bitset in bitsets:
+        seen_more |= seen_once & bitset
+        seen_once = (seen_once | bitset) & ~seen_more
+    unique = [bin(bitset & seen_once).count("1") for bitset in bitsets]
+
+    intersection = [[0] * len(players) for _ in players]
+    jaccard = [[0.0] * len(players) for _ in players]
+    for position in range(len(players)):
+        intersection[position][position] = distinct[position]
+        jaccard[position][position] = 1.0
+    for player1, player2 in combinations(range(len(players)), 2):
+        total_shared = bin(bitsets[player1] & bitsets[player2]).count("1")
+        union = distinct[player1] + distinct[player2] - total_shared
+        intersection[player1][player2] = intersection[player2][player1] = total_shared
+        jaccard[player1][player2] = jaccard[player2][player1] = round(total_shared / union, 4) if union else 1.0
+
+    # Sorted by name first, the stable sort by frequency keeps the names in order on ties.
+    name_frequency = dict(sorted(sorted(zip(name_index, name_counts)), key=itemgetter(1), reverse=True))
+
+    return core.AnswersCompare(
+        players=players,
+        totals=totals,
+        distinct=distinct,
+        unique=unique,
+        intersection=intersection,
+        jaccard=jaccard,
+        name_frequency=name_frequency,
+    )
@@ -1,5 +1,5 @@
 import core
-from typing import Dict, Set
+from typing import Dict, Iterable, Optional, Set, Union
 
 
 # TODO: monster_set_1 and monster_set_2 should be set type 
@@ -7,18 +7,23 @@ from typing import Dict, Set
 # só pra set, então tem q mudar pra set pra ele aceitar (já mudei só falta testar)
 
 def process_info(
-    process_monster1: Dict[str, int],
-    process_monster2: Dict[str, int],
-    monster_set_1: Set[str, int],
-    monster_set_2: Set[str, int],
+    process_monster1: Iterable[Dict[str, Union[str, int]]],
+    process_monster2: Iterable[Dict[str, Union[str, int]]],
+    monster_set_1: Union[Set[str], core.NameSketch],
+    monster_set_2: Union[Set[str], core.NameSketch],
     monster_type1: str,
     monster_type2: str,
+    roster_stats_1: Optional[core.RosterStats] = None,
+    roster_stats_2: Optional[core.RosterStats] = None,
 ) -> core.AnswersInfo:
     # TODO: create a function for each question
     """
         This function will process some validations using data, to find
         some specific information and answer the given questions.
 
+        Each list is visited only once, through a RosterStats, and
+        the statistics already gathered can be passed instead.
+
     Parameters
     ----------
     process_monster1:
@@ -26,9 +31,13 @@ def process_info(
     process_monster2:
         the player 2 list of monsters
     monster_set_1:
-        The player 1 list converted in a set
+        The player 1 list converted in a set, or a NameSketch
     monster_set_2:
-        The player 2 list converted in a set
+        The player 2 list converted in a set, or a NameSketch
+    roster_stats_1:
+        The player 1 statistics, if they were already gathered.
+    roster_stats_2:
+        The player 2 statistics, if they were already gathered.
     Returns
     -------
     AnswerTrivia:
@@ -37,63 +46,24 @@ def process_info(
         to the user.
 
     """
+    if roster_stats_1 is None:
+        roster_stats_1 = core.RosterStats(monster_type1, ["attack"]).consume(process_monster1)
+    if roster_stats_2 is None:
+        roster_stats_2 = core.RosterStats(monster_type2, ["attack"]).consume(process_monster2)
 
-    strongest_monster_player1 = {"index": 0, "value": 0}
-    strongest_monster_player2 = {"index": 0, "value": 0}
-    total_stg_or_legend_player1 = 0
-    total_stg_or_legend_player2 = 0
-    intersec_monster = monster_set_1.intersection(monster_set_2)
-    diff_monster = monster_set_1.difference(monster_set_2)
-    monster_dict = []
-    monster_dict2 = []
-
-    for index, monster in enumerate(process_monster1):
-        player1_total_monster = len(process_monster1)
-        monster_dict += [
-            {key_list: value_list for key_list, value_list in monster.items()}
-        ]
-
-        if monster_dict:
-            monster_attack = sorted(
-                monster_dict, key=lambda highest: highest["attack"], reverse=True
-            )
-            strongest_monster_player1 = monster_attack[0]
-
-        if monster_type1 == "pokemon":
-            if core.cast_to_bool(monster["legendary"]):
-                total_stg_or_legend_player1 += 1
-
-        elif monster_type1 == "digimon":
-            if monster["stage"] == "Ultra":
-                total_stg_or_legend_player1 += 1
-
-    for index, monster in enumerate(process_monster2):
-        player2_total_monster = len(process_monster2)
-        monster_dict2 += [
-            {key_list: value_list for key_list, value_list in monster.items()}
-        ]
-
-        if monster_dict2:
-            monster_attack2 = sorted(
-                monster_dict2, key=lambda highest: highest["attack"], reverse=True
-            )
-            strongest_monster_player2 = monster_attack2[0]
-
-        if monster_type2 == "pokemon":
-            if core.cast_to_bool(monster["legendary"]):
-                total_stg_or_legend_player2 += 1
-
-        elif monster_type2 == "digimon":
-            if monster["stage"] == "Ultra":
-                total_stg_or_legend_player2 += 1
+    if isinstance(monster_set_1, core.NameSketch):
+        repeated_monster, different_monster = monster_set_1.overlap(monster_set_2)
+    else:
+        repeated_monster = len(monster_set_1.intersection(monster_set_2))
+        different_monster = len(monster_set_1.difference(monster_set_2))
 
     return core.AnswersInfo(
-        player1_total_monster_info=str(player1_total_monster),
-        player2_total_monster_info=str(player2_total_monster),
-        strongest_monster_player1_info=strongest_monster_player1["name"],
-        strongest_monster_player2_info=strongest_monster_player2["name"],
-        stg_or_legend_player1_info=str(total_stg_or_legend_player1),
-        stg_or_legend_player2_info=str(total_stg_or_legend_player2),
-        repeated_monster_info=str(len(intersec_monster)),
-        different_monster_info=str(len(diff_monster)),
+        player1_total_monster_info=str(roster_stats_1.total),
+        player2_total_monster_info=str(roster_stats_2.total),
+        strongest_monster_player1_info=roster_stats_1.max_of("attack")["name"],
+        strongest_monster_player2_info=roster_stats_2.max_of("attack")["name"],
+        stg_or_legend_player1_info=str(roster_stats_1.special),
+        stg_or_legend_player2_info=str(roster_stats_2.special),
+        repeated_monster_info=str(repeated_monster),
+        different_monster_info=str(different_monster),
     )
@@ -0,0 +1,167 @@
+import core
+import os
+from itertools import permutations
+from menu.battle import select_team, start_battle
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# The teams of the tournament, each worker process receives them once when it starts.
+TOURNAMENT_TEAMS: List[List[Dict[str, Union[str, int]]]] = []
+TOURNAMENT_TEAM_SIZE: int = 3
+
+ROSTER_FORMATS: Tuple[str, ...] = (".json", ".csv", ".xml", ".yaml")
+
+
+def list_rosters(directory: str) -> List[str]:
+    """
+        This function lists the roster files of a directory, the
+        files in a format the dex can't read are ignored.
+
+    Parameters
+    ----------
+    directory:
+        The directory with one roster file per player.
+
+    Returns
+    -------
+    List[str]:
+        The roster file paths, sorted by name.
+
+    """
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if os.path.splitext(name)[1] in ROSTER_FORMATS
+    )
+
+
+def init_tournament(teams: List[List[Dict[str, Union[str, int]]]], team_size: int) -> None:
+    """
+        This function keeps the tournament teams in the worker
+        process, so the battles only need the team positions.
+
+    Parameters
+    ----------
+    teams:
+        The team of each player.
+    team_size:
+        How many monsters will participate in each battle.
+
+    """
+    global TOURNAMENT_TEAMS, TOURNAMENT_TEAM_SIZE
+    TOURNAMENT_TEAMS = teams
+    TOURNAMENT_TEAM_SIZE = team_size
+
+
+def battle_pairs(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int, str, int]]:
+    """
+        This function plays the battle of each pair of teams.
+
+    Parameters
+    ----------
+    pairs:
+        The positions of the two teams of each battle.
+
+    Returns
+    -------
+    List:
+        For each pair, the two positions, the winner ("1" or "2")
+        and the battle rounds.
+
+    """
+    results = []
+    for player1, player2 in pairs:
+        battle = core.AnswersBattle(p1_player=TOURNAMENT_TEAMS[player1], p2_player=TOURNAMENT_TEAMS[player2])
+        result = start_battle(battle, TOURNAMENT_TEAM_SIZE)
+        results.append((player1, player2, result["winner"], result["rounds"]))
+    return results
+
+
+def chunked(pairs: Iterator[Tuple[int, int]], chunk_size: int) -> Iterator[List[Tuple[int, int]]]:
+    """
+        This function splits the pairs in lists of chunk_size pairs.
+    """
+    chunk = []
+    for pair in pairs:
+        chunk.append(pair)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_tournament(
+    rosters: Dict[str, core.Roster],
+    team_size: int,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> List[core.TournamentStanding]:
+    """
+        This function plays a round-robin tournament, every player
+        battles every other player twice, once as player 1 and once
+        as player 2, with the team_size strongest monsters of each
+        roster. start_battle is not the same for both sides on a tie,
+        so playing each side once keeps the standings from depending
+        on the player names.
+
+        The battles are sent to a process pool in chunks of pairs,
+        with workers=1 they are played in this process.
+
+    Parameters
+    ----------
+    rosters:
+        The monsters of each player, by player name.
+    team_size:
+        How many monsters will participate in each battle.
+    workers:
+        How many processes, at least 1, the number of CPUs by default.
+    chunk_size:
+        How many battles are sent to a process at a time.
+
+    Returns
+    -------
+    List[TournamentStanding]:
+        The standings, sorted by wins, then by the lowest rounds
+        to win, then by the player name.
+
+    """
+    players = list(rosters)
+    teams = [select_team(rosters[player], team_size) for player in players]
+    total_battles = len(players) * (len(players) - 1)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("The tournament needs at least 1 worker.")
+    if chunk_size is None:
+        # A few chunks per worker keeps them all busy without paying the IPC for every battle.
+        chunk_size = max(1, -(-total_battles // (workers * 4)))
+
+    standings = {
+        player: core.TournamentStanding(player=player, battles=0, wins=0, losses=0, rounds=0)
+        for player in players
+    }
+
+    if workers == 1:
+        init_tournament(teams, team_size)
+        batches = [battle_pairs(list(permutations(range(len(players)), 2)))]
+        init_tournament([], team_size)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=init_tournament, initargs=(teams, team_size)
+        ) as executor:
+            batches = list(executor.map(battle_pairs, chunked(permutations(range(len(players)), 2), chunk_size)))
+
+    for batch in batches:
+        for player1, player2, winner, rounds in batch:
+            winner_name, loser_name = players[player1], players[player2]
+            if winner == "2":
+                winner_name, loser_name = loser_name, winner_name
+            standings[winner_name]["wins"] += 1
+            standings[winner_name]["rounds"] += rounds
+            standings[loser_name]["losses"] += 1
+            standings[winner_name]["battles"] += 1
+            standings[loser_name]["battles"] += 1
+
+    return sorted(standings.values(), key=lambda standing: (-standing["wins"], standing["rounds"], standing["player"]))
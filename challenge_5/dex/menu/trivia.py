@@ -1,17 +1,28 @@
 import core
-from typing import Dict, Union
+from typing import Dict, Iterable, List, Optional, Union
 
+# The order used to show the stages and types that we already know,
+# any other stage or type found in the file is shown after them.
+DIGIMON_STAGES: List[str] = ["Baby", "In-Training", "Rookie", "Champion", "Ultimate", "Mega", "Ultra", "Armor"]
+DIGIMON_TYPES: List[str] = ["Data", "Vaccine", "Virus", "Free"]
 
-def pokemon_trivia(pokemons_data: Dict[str, Union[str, int]]) -> Dict[str, str]:
+
+def pokemon_trivia(
+    pokemons_data: Iterable[Dict[str, Union[str, int]]], roster_stats: Optional[core.RosterStats] = None
+) -> Dict[str, str]:
     """
         This function will process some validations in a pokemon
         list, to find some specific information and answer the
         given questions.
 
+        The list is visited only once, so it can also be a generator.
+
     Parameters
     ----------
     pokemons_data:
         The pokemon list as a dict type.
+    roster_stats:
+        The list statistics, if they were already gathered.
 
     Returns
     -------
@@ -20,40 +31,15 @@ def pokemon_trivia(pokemons_data: Dict[str, Union[str, int]]) -> Dict[str, str]:
         then in variables.
 
     """
-    highest_hp_trivia = {"index": 0, "value": 0}
-    highest_attack_trivia = {"index": 0, "value": 0}
-    highest_defense_trivia = {"index": 0, "value": 0}
-    highest_speed_trivia = {"index": 0, "value": 0}
-    pokemon_dict = []
+    pokemon_stats = roster_stats or core.RosterStats("pokemon").consume(pokemons_data)
 
-    for index, pokemon in enumerate(pokemons_data):
-        pokemon_dict += [
-            {key_list: value_list for key_list, value_list in pokemon.items()}
-        ]
-
-        if pokemon_dict:
-            pokemon_hp = sorted(
-                pokemon_dict, key=lambda highest: highest["hp"], reverse=True
-            )
-            highest_hp_trivia = pokemon_hp[0]
-
-            pokemon_attack = sorted(
-                pokemon_dict, key=lambda highest: highest["attack"], reverse=True
-            )
-            highest_attack_trivia = pokemon_attack[0]
-
-            pokemon_defense = sorted(
-                pokemon_dict, key=lambda highest: highest["defense"], reverse=True
-            )
-            highest_defense_trivia = pokemon_defense[0]
-
-            pokemon_speed = sorted(
-                pokemon_dict, key=lambda highest: highest["speed"], reverse=True
-            )
-            highest_speed_trivia = pokemon_speed[0]
+    highest_hp_trivia = pokemon_stats.max_of("hp")
+    highest_attack_trivia = pokemon_stats.max_of("attack")
+    highest_defense_trivia = pokemon_stats.max_of("defense")
+    highest_speed_trivia = pokemon_stats.max_of("speed")
 
     return core.AnswersPokemonTrivia(
-        total_trivia=str(len(pokemons_data)),
+        total_trivia=str(pokemon_stats.total),
         hp_trivia_name=highest_hp_trivia["name"],
         hp_trivia_points=str(highest_hp_trivia["hp"]),
         atk_trivia_name=highest_attack_trivia["name"],
@@ -65,16 +51,56 @@ def pokemon_trivia(pokemons_data: Dict[str, Union[str, int]]) -> Dict[str, str]:
     )
 
 
-def digimon_trivia(digimon_data: Dict[str, Union[str, int]]) -> Dict[str, str]:
+def digimon_groups(groups: core.GroupAggregator, known_order: List[str]) -> List[core.MonsterGroup]:
+    """
+        This function converts the grouped digimon into the
+        group list shown in the trivia.
+
+    Parameters
+    ----------
+    groups:
+        The digimon grouped by stage or type.
+    known_order:
+        The order to show the known groups, new groups come after.
+
+    Returns
+    -------
+    List[MonsterGroup]:
+        One entry per group with its total and strongest digimon.
+
+    """
+    digimon_group_list = []
+    for group_name in groups.ordered(known_order):
+        group = groups.groups[group_name]
+        strongest = group.max_of("attack")
+        digimon_group_list.append(
+            core.MonsterGroup(
+                group_name=group_name,
+                total=str(group.total),
+                strongest=strongest["name"],
+                attack=str(strongest["attack"]),
+            )
+        )
+    return digimon_group_list
+
+
+def digimon_trivia(
+    digimon_data: Iterable[Dict[str, Union[str, int]]], roster_stats: Optional[core.RosterStats] = None
+) -> Dict[str, str]:
     """
         This function will process some validations in a digimon
         list, to find some specific information and answer the
         given questions.
 
+        The list is visited only once, so it can also be a generator,
+        and the stages and types are found while reading it.
+
     Parameters
     ----------
     digimon_data:
         The digimon list as a dict type.
+    roster_stats:
+        The list statistics, if they were already gathered.
 
     Returns
     -------
@@ -83,230 +109,39 @@ def digimon_trivia(digimon_data: Dict[str, Union[str, int]]) -> Dict[str, str]:
         then in variables.
 
     """
-    highest_attack_trivia = {"index": 0, "value": 0}
-    lowest_attack_trivia = {"index": 0, "value": 1000}
-    baby_dict = []
-    rookie_dict = []
-    champion_dict = []
-    ultimate_dict = []
-    mega_dict = []
-    ultra_dict = []
-    data_dict = []
-    vaccine_dict = []
-    virus_dict = []
-    free_dict = []
-    baby_digimon = 0
-    rookie_digimon = 0
-    champion_digimon = 0
-    ultimate_digimon = 0
-    mega_digimon = 0
-    ultra_digimon = 0
-    data_type = 0
-    vaccine_type = 0
-    virus_type = 0
-    free_type = 0
-    baby_strongest = {"index": 0, "value": 0}
-    rookie_strongest = {"index": 0, "value": 0}
-    champion_strongest = {"index": 0, "value": 0}
-    ultimate_strongest = {"index": 0, "value": 0}
-    mega_strongest = {"index": 0, "value": 0}
-    ultra_strongest = {"index": 0, "value": 0}
-    data_strongest = {"index": 0, "value": 0}
-    vaccine_strongest = {"index": 0, "value": 0}
-    virus_strongest = {"index": 0, "value": 0}
-    free_strongest = {"index": 0, "value": 0}
-    digimon_types = []
-    digimon_stages = []
-    digimon_dict = []
-
-    for index, digimon in enumerate(digimon_data):
-        digimon_dict += [
-            {key_list: value_list for key_list, value_list in digimon.items()}
-        ]
-
-        if digimon_dict:
-            digimon_highest_attack = sorted(
-                digimon_dict, key=lambda highest: highest["attack"], reverse=True
-            )
-            highest_attack_trivia = digimon_highest_attack[0]
-
-            digimon_lowest_attack = sorted(
-                digimon_dict, key=lambda lowest: lowest["attack"]
-            )
-            lowest_attack_trivia = digimon_lowest_attack[0]
-
-        if digimon["stage"] == "Baby":
-            baby_digimon += 1
-            baby_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["stage"] not in digimon_stages:
-                digimon_stages.append(digimon["stage"])
-
-        elif digimon["stage"] == "Rookie":
-            rookie_digimon += 1
-            rookie_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["stage"] not in digimon_stages:
-                digimon_stages.append(digimon["stage"])
-
-        elif digimon["stage"] == "Champion":
-            champion_digimon += 1
-            champion_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["stage"] not in digimon_stages:
-                digimon_stages.append(digimon["stage"])
-
-        elif digimon["stage"] == "Ultimate":
-            ultimate_digimon += 1
-            ultimate_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["stage"] not in digimon_stages:
-                digimon_stages.append(digimon["stage"])
-
-        elif digimon["stage"] == "Mega":
-            mega_digimon += 1
-            mega_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["stage"] not in digimon_stages:
-                digimon_stages.append(digimon["stage"])
-
-        elif digimon["stage"] == "Ultra":
-            ultra_digimon += 1
-            ultra_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["stage"] not in digimon_stages:
-                digimon_stages.append(digimon["stage"])
-
-        if digimon["type1"] == "Data":
-            data_type += 1
-            data_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["type1"] not in digimon_types:
-                digimon_types.append(digimon["type1"])
-
-        elif digimon["type1"] == "Vaccine":
-            vaccine_type += 1
-            vaccine_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["type1"] not in digimon_types:
-                digimon_types.append(digimon["type1"])
-
-        elif digimon["type1"] == "Virus":
-            virus_type += 1
-            virus_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["type1"] not in digimon_types:
-                digimon_types.append(digimon["type1"])
-
-        elif digimon["type1"] == "Free":
-            free_type += 1
-            free_dict += [
-                {key_list: value_list for key_list, value_list in digimon.items()}
-            ]
-            if digimon["type1"] not in digimon_types:
-                digimon_types.append(digimon["type1"])
-
-    if baby_dict:
-        baby_sorted = sorted(
-            baby_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        baby_strongest = baby_sorted[0]
-    if rookie_dict:
-        rookie_sorted = sorted(
-            rookie_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        rookie_strongest = rookie_sorted[0]
-    if champion_dict:
-        champion_sorted = sorted(
-            champion_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        champion_strongest = champion_sorted[0]
-    if ultimate_dict:
-        ultimate_sorted = sorted(
-            ultimate_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        ultimate_strongest = ultimate_sorted[0]
-    if mega_dict:
-        mega_sorted = sorted(
-            mega_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        mega_strongest = mega_sorted[0]
-    if ultra_dict:
-        ultra_sorted = sorted(
-            ultra_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        ultra_strongest = ultra_sorted[0]
-
-    if data_dict:
-        data_sorted = sorted(
-            data_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        data_strongest = data_sorted[0]
-    if vaccine_dict:
-        vaccine_sorted = sorted(
-            vaccine_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        vaccine_strongest = vaccine_sorted[0]
-    if virus_dict:
-        virus_sorted = sorted(
-            virus_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        virus_strongest = virus_sorted[0]
-    if free_dict:
-        free_sorted = sorted(
-            free_dict, key=lambda strongest: strongest["attack"], reverse=True
-        )
-        free_strongest = free_sorted[0]
+    digimon_stats = roster_stats or core.RosterStats("digimon")
+    stage_groups = core.GroupAggregator("stage", ["attack"])
+    type_groups = core.GroupAggregator("type1", ["attack"])
+
+    if isinstance(digimon_data, core.Roster):
+        if roster_stats is None:
+            digimon_stats.consume(digimon_data)
+        stage_groups.consume(digimon_data)
+        type_groups.consume(digimon_data)
+    else:
+        for digimon in digimon_data:
+            if roster_stats is None:
+                digimon_stats.update(digimon)
+            stage_groups.update(digimon)
+            type_groups.update(digimon)
+
+    highest_attack_trivia = digimon_stats.max_of("attack")
+    lowest_attack_trivia = digimon_stats.min_of("attack")
+    digimon_stages = sorted(stage_groups.groups)
+    digimon_types = sorted(type_groups.groups)
 
     return core.AnswersDigimonTrivia(
-        total_trivia=str(len(digimon_data)),
+        total_trivia=str(digimon_stats.total),
         highest_atk_name=highest_attack_trivia["name"],
         highest_atk_stage=highest_attack_trivia["stage"],
         highest_atk_type=highest_attack_trivia["type1"],
         lowest_atk_name=lowest_attack_trivia["name"],
         lowest_atk_stage=lowest_attack_trivia["stage"],
         lowest_atk_type=lowest_attack_trivia["type1"],
-        total_baby=str(baby_digimon),
-        total_rookie=str(rookie_digimon),
-        total_champion=str(champion_digimon),
-        total_ultimate=str(ultimate_digimon),
-        total_mega=str(mega_digimon),
-        total_ultra=str(ultra_digimon),
-        total_data=str(data_type),
-        total_vaccine=str(vaccine_type),
-        total_virus=str(virus_type),
-        total_free=str(free_type),
-        baby_strongest=baby_strongest["name"],
-        baby_attack=str(baby_strongest["attack"]),
-        rookie_strongest=rookie_strongest["name"],
-        rookie_attack=str(rookie_strongest["attack"]),
-        champion_strongest=champion_strongest["name"],
-        champion_attack=str(champion_strongest["attack"]),
-        ultimate_strongest=ultimate_strongest["name"],
-        ultimate_attack=str(ultimate_strongest["attack"]),
-        mega_strongest=mega_strongest["name"],
-        mega_attack=str(mega_strongest["attack"]),
-        ultra_strongest=ultra_strongest["name"],
-        ultra_attack=str(ultra_strongest["attack"]),
-        data_strongest=data_strongest["name"],
-        data_attack=str(data_strongest["attack"]),
-        vaccine_strongest=vaccine_strongest["name"],
-        vaccine_attack=str(vaccine_strongest["attack"]),
-        virus_strongest=virus_strongest["name"],
-        virus_attack=str(virus_strongest["attack"]),
-        free_strongest=free_strongest["name"],
-        free_attack=str(free_strongest["attack"]),
-        digimon_types=sorted(digimon_types),
+        stage_groups=digimon_groups(stage_groups, DIGIMON_STAGES),
+        type_groups=digimon_groups(type_groups, DIGIMON_TYPES),
+        digimon_types=digimon_types,
         types_sum=str(len(digimon_types)),
-        digimon_stages=sorted(digimon_stages),
+        digimon_stages=digimon_stages,
         stages_sum=str(len(digimon_stages)),
     )
@@ -0,0 +1,238 @@
+import asyncio
+import core
+import json
+import menu
+import os
+from concurrent.futures import Executor
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+# The answers of the web API, computed by the same core and menu functions of the CLI. A roster
+# ID is the path of a roster file inside DATA_DIR, e.g. "pokemon/json/pokemons_1.json".
+DATA_DIR: str = os.environ.get(
+    "DEX_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+)
+API_WORKERS: int = int(os.environ.get("DEX_API_WORKERS", os.cpu_count() or 1))
+RESULT_CACHE_SIZE: int = int(os.environ.get("DEX_RESULT_CACHE_SIZE", 1024))
+MAX_TEAM_SIZE: int = int(os.environ.get("DEX_MAX_TEAM_SIZE", 100))
+
+# The sha256 of each roster file, with the size and mtime it had when it was hashed.
+CONTENT_HASHES: Dict[str, Tuple[int, int, str]] = {}
+
+
+def resolve_rosters(roster_ids: List[str]) -> Tuple[List[str], str]:
+    """
+    This function returns the file of each roster ID and the monster
+    type, which must be the same for all of them.
+
+    Parameters
+    ----------
+    roster_ids:
+        The roster IDs, paths relative to DATA_DIR.
+
+    Returns
+    -------
+        The full path of each roster, and "pokemon" or "digimon".
+
+    Raises
+    ------
+    FileNotFoundError:
+        When a roster ID is not a file inside DATA_DIR.
+
+    ValueError:
+        When the monster type is unknown, or not the same for all.
+    """
+    data_dir = os.path.realpath(DATA_DIR)
+    filepaths = []
+    for roster_id in roster_ids:
+        filepath = os.path.realpath(os.path.join(data_dir, roster_id))
+        if os.path.commonpath([data_dir, filepath]) != data_dir or not os.path.isfile(filepath):
+            raise FileNotFoundError(f"Roster {roster_id} does not exist.")
+        filepaths.append(filepath)
+
+    if all("pokemon" in os.path.basename(filepath) for filepath in filepaths):
+        return filepaths, "pokemon"
+    if all("digimon" in os.path.basename(filepath) for filepath in filepaths):
+        return filepaths, "digimon"
+    raise ValueError("Different type of monsters.")
+
+
+def known_hash(filepath: str) -> Optional[str]:
+    """
+    This function returns the content hash of a file already hashed,
+    when its size and mtime didn't change since.
+
+    Parameters
+    ----------
+    filepath:
+        The full path of the file.
+
+    Returns
+    -------
+        The hexadecimal sha256, or None if the file must be hashed.
+    """
+    entry = CONTENT_HASHES.get(filepath)
+    file_stat = os.stat(filepath)
+    if entry and entry[0] == file_stat.st_size and entry[1] == file_stat.st_mtime_ns:
+        return entry[2]
+    return None
+
+
+def hash_file(filepath: str) -> str:
+    """
+    This function hashes the file content and keeps the hash with the
+    size and mtime the file had before it was read.
+
+    Parameters
+    ----------
+    filepath:
+        The full path of the file.
+
+    Returns
+    -------
+        The hexadecimal sha256.
+    """
+    file_stat = os.stat(filepath)
+    digest = core.file_digest(filepath)
+    CONTENT_HASHES[filepath] = (file_stat.st_size, file_stat.st_mtime_ns, digest)
+    return digest
+
+
+async def content_hash(filepath: str) -> str:
+    """
+    This function returns the content hash of a file, a file never
+    seen or changed is hashed in a thread, away from the event loop.
+
+    Parameters
+    ----------
+    filepath:
+        The full path of the file.
+
+    Returns
+    -------
+        The hexadecimal sha256.
+    """
+    digest = known_hash(filepath)
+    if digest is None:
+        digest = await asyncio.get_running_loop().run_in_executor(None, hash_file, filepath)
+    return digest
+
+
+def roster_size(filepath: str, monster_type: str) -> Dict[str, int]:
+    """
+    This function returns how many monsters a roster has, so a team
+    size bigger than it is refused before the battle runs.
+    """
+    return dict(size=len(core.load_monsters(filepath, monster_type)))
+
+
+def trivia_answers(filepath: str, monster_type: str) -> Union[core.AnswersPokemonTrivia, core.AnswersDigimonTrivia]:
+    """
+    This function returns the trivia of a roster, like --trivia.
+    """
+    roster = core.load_monsters(filepath, monster_type)
+    if monster_type == "pokemon":
+        return menu.pokemon_trivia(roster)
+    return menu.digimon_trivia(roster)
+
+
+def info_answers(filepath_1: str, filepath_2: str, monster_type: str) -> core.AnswersInfo:
+    """
+    This function returns the comparison of two rosters, like --info.
+    """
+    data_1, data_2 = core.load_many([filepath_1, filepath_2], [monster_type, monster_type], workers=1)
+    return menu.process_info(
+        data_1, data_2, core.cast_to_set(data_1), core.cast_to_set(data_2), monster_type, monster_type
+    )
+
+
+def battle_answers(filepath_1: str, filepath_2: str, monster_type: str, team_size: int) -> core.AnswersResult:
+    """
+    This function returns the battle of two rosters, like --battle, or
+    raises ValueError when team_size is bigger than one of them.
+    """
+    data_1, data_2 = core.load_many([filepath_1, filepath_2], [monster_type, monster_type], workers=1)
+    return menu.start_battle(menu.select_battle_team(data_1, data_2, team_size), team_size)
+
+
+def encoded_answers(function: Callable[..., Dict], *args) -> bytes:
+    """
+    This function runs one of the *_answers functions and returns the
+    answers as json, so the worker encodes them instead of the event
+    loop, and the cache keeps the body ready to be sent.
+
+    The CLI functions quit() on a roster they can't read, the
+    SystemExit is raised again as a ValueError, so it reaches the
+    request instead of stopping the event loop.
+    """
+    try:
+        answers = function(*args)
+    except SystemExit:
+        raise ValueError("The roster could not be read.") from None
+    return json.dumps(answers).encode("utf-8")
+
+
+class ResultCache:
+    """
+    This class keeps the json answers of the last requests, the least
+    recently used are dropped first.
+
+    The key has the content hash of the rosters, so a roster changed
+    on disk gets new answers, and the same roster in two files shares
+    them. Many requests of the same answers at once wait for a single
+    run. It is used only from the event loop, it needs no lock.
+    """
+
+    def __init__(self, max_size: int = RESULT_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.results: Dict[Tuple, bytes] = {}
+        self.pending: Dict[Tuple, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: Tuple, executor: Executor, function: Callable[..., Dict], *args) -> bytes:
+        """
+        This method returns the json answers of the key, from the cache,
+        or from the function run in the executor.
+
+        Parameters
+        ----------
+        key:
+            The endpoint, the content hash of each roster and the options.
+
+        executor:
+            The executor of the CPU bound work, a process pool.
+
+        function:
+            The *_answers function, it gets args.
+
+        Returns
+        -------
+            The answers encoded as json.
+        """
+        result = self.results.pop(key, None)
+        if result is not None:
+            # Added again at the end, the dict order is the use order.
+            self.results[key] = result
+            self.hits += 1
+            return result
+
+        future = self.pending.get(key)
+        if future is None:
+            self.misses += 1
+            future = asyncio.get_running_loop().run_in_executor(executor, encoded_answers, function, *args)
+            self.pending[key] = future
+            future.add_done_callback(lambda done: self.finish(key, done))
+        # A request cancelled while waiting doesn't cancel the run the others wait for.
+        return await asyncio.shield(future)
+
+    def finish(self, key: Tuple, future: asyncio.Future) -> None:
+        """
+        This method keeps the answers of a run that ended, the errors
+        are not kept, the next request runs it again.
+        """
+        del self.pending[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self.results[key] = future.result()
+        while len(self.results) > self.max_size:
+            del self.results[next(iter(self.results))]
@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+# The tests import the dex modules like main.py does, with dex in the path.
+DEX_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex")
+sys.path.insert(0, DEX_DIR)
+
+from core import cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_run(tmp_path, monkeypatch):
+    """
+    This fixture runs each test in its own directory, with its own
+    roster cache, so the reports and the cache never touch the repo or
+    ~/.cache/dex, and no test finds the rosters of another one.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(cache, "CACHE_DIR", str(tmp_path / "cache"))
+    cache.MEMORY_CACHE.clear()
+    yield
+    cache.MEMORY_CACHE.clear()
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+import core
+from core.aggregator import ROSTER_STATS, SPECIAL_MONSTERS
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+ROSTERS = [
+    ("pokemon", os.path.join(DATA_DIR, "pokemon", "json", "pokemons_1.json")),
+    ("pokemon", os.path.join(DATA_DIR, "pokemon", "csv", "pokemons_2.csv")),
+    ("digimon", os.path.join(DATA_DIR, "digimon", "yaml", "digimons_1.yaml")),
+    ("digimon", os.path.join(DATA_DIR, "digimon", "xml", "digimons_2.xml")),
+]
+
+
+def sorted_ends(monsters, stat):
+    """
+    This function returns the highest and lowest monster of a stat
+    with a stable sort, the first one seen wins a tie.
+    """
+    highest = sorted(monsters, key=lambda monster: -monster[stat])[0]
+    return highest, sorted(monsters, key=lambda monster: monster[stat])[0]
+
+
+@pytest.mark.parametrize("monster_type, filepath", ROSTERS, ids=os.path.basename)
+def test_stat_aggregator_matches_a_stable_sort(monster_type, filepath):
+    roster = core.load_monsters(filepath, monster_type)
+    monsters = list(roster)
+    stats = ROSTER_STATS[monster_type]
+    from_list = core.StatAggregator(stats).consume(iter(monsters))
+    from_roster = core.StatAggregator(stats).consume(roster)
+    assert from_list.total == from_roster.total == len(monsters)
+    for stat in stats:
+        highest, lowest = sorted_ends(monsters, stat)
+        assert from_list.max_of(stat) == from_roster.max_of(stat) == highest
+        assert from_list.min_of(stat) == from_roster.min_of(stat) == lowest
+
+
+def test_stat_aggregator_keeps_the_first_of_a_tie():
+    monsters = [dict(name="a", attack=5), dict(name="b", attack=9), dict(name="c", attack=9), dict(name="d", attack=5)]
+    aggregator = core.StatAggregator(["attack"]).consume(monsters)
+    assert aggregator.max_of("attack")["name"] == "b"
+    assert aggregator.min_of("attack")["name"] == "a"
+    assert core.StatAggregator(["attack"]).max_of("attack") is None
+
+
+@pytest.mark.parametrize("key", ["type1", "stage"])
+def test_group_aggregator_matches_each_group(key):
+    monster_type = "pokemon" if key == "type1" else "digimon"
+    filepath = next(filepath for kind, filepath in ROSTERS if kind == monster_type)
+    roster = core.load_monsters(filepath, monster_type)
+    monsters = list(roster)
+    from_list = core.GroupAggregator(key, ["attack"]).consume(monsters)
+    from_roster = core.GroupAggregator(key, ["attack"]).consume(roster)
+    assert set(from_list.groups) == set(from_roster.groups) == {str(monster[key]) for monster in monsters}
+    for group_name, group in from_list.groups.items():
+        members = [monster for monster in monsters if str(monster[key]) == group_name]
+        assert group.total == from_roster.groups[group_name].total == len(members)
+        highest, lowest = sorted_ends(members, "attack")
+        assert group.max_of("attack") == from_roster.groups[group_name].max_of("attack") == highest
+        assert group.min_of("attack") == from_roster.groups[group_name].min_of("attack") == lowest
+
+
+def test_group_order_puts_the_known_names_first():
+    groups = core.GroupAggregator("stage", ["attack"]).consume(
+        dict(stage=stage, attack=1) for stage in ["Zeta", "Mega", "Alpha", "Rookie"]
+    )
+    assert groups.ordered(["Rookie", "Champion", "Mega"]) == ["Rookie", "Mega", "Alpha", "Zeta"]
+
+
+@pytest.mark.parametrize("monster_type, filepath", ROSTERS, ids=os.path.basename)
+def test_roster_stats_counts_the_special_monsters(monster_type, filepath):
+    roster = core.load_monsters(filepath, monster_type)
+    field, value = SPECIAL_MONSTERS[monster_type]
+    expected = sum(1 for monster in roster if monster[field] == value)
+    assert core.RosterStats(monster_type).consume(roster).special == expected
+    assert core.RosterStats(monster_type).consume(list(roster)).special == expected
+    assert core.RosterStats(monster_type).consume(roster).total == len(roster)
@@ -0,0 +1,118 @@
+import json
+import os
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+import service
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+CSV_HEADER = "Id,Name,Type 1,Type 2,Total,HP,Attack,Defense,Sp. Atk,Sp. Def,Speed,Generation,Legendary"
+CSV_ROWS = [
+    "1,Bulbasaur,Grass,Poison,318,45,49,49,65,65,45,1,False",
+    "4,Charmander,Fire,,309,39,52,43,60,50,65,1,False",
+]
+POKEMON_PLAYERS = dict(player1="pokemon/json/pokemons_1.json", player2="pokemon/json/pokemons_2.json")
+
+
+@pytest.fixture
+def api_client(tmp_path, monkeypatch):
+    """
+    This fixture serves the API on a data directory with two big
+    rosters of each monster, a small one and two broken ones.
+    """
+    data_dir = tmp_path / "data"
+    for monster in ("pokemon", "digimon"):
+        shutil.copytree(os.path.join(DATA_DIR, monster, "json"), data_dir / monster / "json")
+    (data_dir / "pokemon" / "csv").mkdir()
+    (data_dir / "pokemon" / "csv" / "pokemons_small.csv").write_text("\n".join([CSV_HEADER, *CSV_ROWS]) + "\n")
+    (data_dir / "pokemon" / "csv" / "pokemons_short.csv").write_text(f"{CSV_HEADER}\n{CSV_ROWS[0]}\n1,Ivysaur\n")
+    (data_dir / "pokemon" / "pokemons.txt").write_text(CSV_HEADER)
+    monkeypatch.setattr(service, "DATA_DIR", str(data_dir))
+    monkeypatch.setattr(service, "API_WORKERS", 1)
+    monkeypatch.setattr(service, "CONTENT_HASHES", {})
+    # As a context manager the lifespan starts the process pool.
+    with TestClient(api.app) as test_client:
+        yield test_client, data_dir
+
+
+def expected(answers):
+    """
+    This function returns the answers as they are decoded from json.
+    """
+    return json.loads(json.dumps(answers))
+
+
+def test_trivia(api_client):
+    test_client, data_dir = api_client
+    response = test_client.get("/trivia", params=dict(roster="pokemon/json/pokemons_1.json"))
+    assert response.status_code == 200
+    filepath = str(data_dir / "pokemon" / "json" / "pokemons_1.json")
+    assert response.json() == expected(service.trivia_answers(filepath, "pokemon"))
+
+
+def test_info(api_client):
+    test_client, data_dir = api_client
+    params = dict(player1="digimon/json/digimons_1.json", player2="digimon/json/digimons_2.json")
+    response = test_client.get("/info", params=params)
+    assert response.status_code == 200
+    filepaths = [str(data_dir / "digimon" / "json" / name) for name in ("digimons_1.json", "digimons_2.json")]
+    assert response.json() == expected(service.info_answers(*filepaths, "digimon"))
+
+
+def test_battle_is_the_same_every_time(api_client):
+    test_client, data_dir = api_client
+    params = dict(player1="pokemon/json/pokemons_1.json", player2="pokemon/csv/pokemons_small.csv", team_size=2)
+    first = test_client.get("/battle", params=params)
+    assert first.status_code == 200
+    assert test_client.get("/battle", params=params).json() == first.json()
+    assert api.app.state.results.hits >= 1
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/trivia", dict(roster="pokemon/json/pokemons_3.json")),
+        ("/trivia", dict(roster="../../etc/passwd")),
+        ("/info", dict(player1="pokemon/json/pokemons_1.json", player2="pokemon/xml/pokemons_1.xml")),
+        ("/battle", dict(player1="digimon/json/missing.json", player2="digimon/json/digimons_2.json")),
+    ],
+)
+def test_unknown_roster_is_404(api_client, path, params):
+    test_client, _ = api_client
+    assert test_client.get(path, params=params).status_code == 404
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/info", dict(player1="pokemon/json/pokemons_1.json", player2="digimon/json/digimons_1.json")),
+        ("/battle", dict(player1="pokemon/json/pokemons_1.json", player2="digimon/json/digimons_1.json")),
+        ("/battle", dict(POKEMON_PLAYERS, team_size=0)),
+        ("/battle", dict(POKEMON_PLAYERS, team_size=10**6)),
+        ("/battle", dict(POKEMON_PLAYERS, player2="pokemon/csv/pokemons_small.csv", team_size=3)),
+        ("/trivia", dict(roster="pokemon/csv/pokemons_short.csv")),
+        ("/trivia", dict(roster="pokemon/pokemons.txt")),
+    ],
+)
+def test_bad_request_is_422(api_client, path, params):
+    test_client, _ = api_client
+    response = test_client.get(path, params=params)
+    assert response.status_code == 422
+    # The server keeps answering after the error.
+    assert test_client.get("/trivia", params=dict(roster="pokemon/csv/pokemons_small.csv")).status_code == 200
+
+
+def test_team_too_big_never_reaches_the_battle(api_client, monkeypatch):
+    test_client, _ = api_client
+
+    def no_battle(*args):
+        raise AssertionError("the battle ran")
+
+    monkeypatch.setattr(service, "battle_answers", no_battle)
+    params = dict(player1="pokemon/csv/pokemons_small.csv", player2="pokemon/json/pokemons_2.json", team_size=3)
+    response = test_client.get("/battle", params=params)
+    assert response.status_code == 422
+    assert "pokemon/csv/pokemons_small.csv" in response.json()["detail"]
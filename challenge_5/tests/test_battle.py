@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import menu
+
+DEX_MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex", "main.py")
+CSV_HEADER = "Id,Name,Type 1,Type 2,Total,HP,Attack,Defense,Sp. Atk,Sp. Def,Speed,Generation,Legendary"
+CSV_ROWS = [
+    "1,Bulbasaur,Grass,Poison,318,45,49,49,65,65,45,1,False",
+    "4,Charmander,Fire,,309,39,52,43,60,50,65,1,False",
+    "7,Squirtle,Water,,314,44,48,65,50,64,43,1,False",
+]
+
+
+def roster(*attacks):
+    """
+    This function returns a roster with one monster of each attack.
+    """
+    return [dict(name=f"monster-{attack}", attack=attack, speed=1, total=1) for attack in attacks]
+
+
+def test_team_of_the_strongest():
+    battle = menu.select_battle_team(roster(5, 9, 7), roster(1, 2), 2)
+    assert [monster["attack"] for monster in battle["p1_player"]] == [9, 7]
+    assert [monster["attack"] for monster in battle["p2_player"]] == [2, 1]
+
+
+@pytest.mark.parametrize("team_size", [3, 4])
+def test_team_bigger_than_a_roster_is_rejected(team_size):
+    with pytest.raises(ValueError, match="Team size bigger than the monster list."):
+        menu.select_battle_team(roster(5, 9, 7), roster(1, 2), team_size)
+
+
+def test_cli_warns_when_the_team_is_too_big(tmp_path):
+    (tmp_path / "pokemons_1.csv").write_text("\n".join([CSV_HEADER, *CSV_ROWS]) + "\n")
+    (tmp_path / "pokemons_2.csv").write_text("\n".join([CSV_HEADER, *CSV_ROWS[:2]]) + "\n")
+    arguments = ["--player1", "pokemons_1.csv", "--player2", "pokemons_2.csv", "--battle", "--team-size", "3"]
+    result = subprocess.run(
+        [sys.executable, DEX_MAIN, *arguments],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=dict(os.environ, DEX_CACHE_DIR=str(tmp_path / "cache")),
+    )
+    assert "WARNING: Team size bigger than the monster list." in result.stdout
+    assert "Traceback" not in result.stderr
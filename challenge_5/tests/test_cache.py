@@ -0,0 +1,88 @@
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+from core import cache
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+POKEMON_CSV = os.path.join(DATA_DIR, "pokemon", "csv", "pokemons_1.csv")
+
+
+def roster_copy(directory, name="pokemons_1.csv", lines=None):
+    """
+    This function copies the pokemon csv into the directory, only the
+    first lines when they are given, and returns its path.
+    """
+    filepath = os.path.join(directory, name)
+    if lines is None:
+        shutil.copy(POKEMON_CSV, filepath)
+    else:
+        with open(POKEMON_CSV) as source_data, open(filepath, "w") as target:
+            target.writelines(source_data.readlines()[:lines])
+    return filepath
+
+
+def test_cached_roster_is_the_roster_read(tmp_path):
+    filepath = roster_copy(tmp_path)
+    fresh = list(cache.read_roster(filepath, "pokemon"))
+    assert list(cache.load_monsters(filepath, "pokemon")) == fresh
+
+    cache.MEMORY_CACHE.clear()
+    cached = cache.cached_roster(filepath, "pokemon")
+    assert cached is not None
+    assert list(cached) == fresh
+
+
+def test_changed_file_is_read_again(tmp_path):
+    filepath = roster_copy(tmp_path)
+    assert len(cache.load_monsters(filepath, "pokemon")) == 300
+
+    roster_copy(tmp_path, lines=11)
+    os.utime(filepath, ns=(0, 0))
+    assert cache.cached_roster(filepath, "pokemon") is None
+    assert len(cache.load_monsters(filepath, "pokemon")) == 10
+
+
+def test_stale_rosters_are_dropped_from_memory(tmp_path):
+    changed = roster_copy(tmp_path, "pokemons_1.csv")
+    removed = roster_copy(tmp_path, "pokemons_2.csv")
+    kept = roster_copy(tmp_path, "pokemons_3.csv")
+    for filepath in (changed, removed, kept):
+        cache.load_monsters(filepath, "pokemon")
+
+    roster_copy(tmp_path, "pokemons_1.csv", lines=5)
+    os.utime(changed, ns=(0, 0))
+    os.remove(removed)
+
+    assert cache.stale_rosters() == [(os.path.abspath(changed), "pokemon")]
+    assert list(cache.MEMORY_CACHE) == [(os.path.abspath(kept), "pokemon")]
+
+
+def test_memory_keeps_the_most_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "MEMORY_MAX_ROSTERS", 2)
+    filepaths = [roster_copy(tmp_path, f"pokemons_{idx}.csv", lines=3) for idx in range(3)]
+    cache.load_monsters(filepaths[0], "pokemon")
+    cache.load_monsters(filepaths[1], "pokemon")
+    cache.load_monsters(filepaths[0], "pokemon")
+    cache.load_monsters(filepaths[2], "pokemon")
+    assert [key[0] for key in cache.MEMORY_CACHE] == [os.path.abspath(filepaths[0]), os.path.abspath(filepaths[2])]
+
+
+def test_concurrent_misses_keep_every_index_entry(tmp_path):
+    os.makedirs(cache.CACHE_DIR)
+    filepaths = [roster_copy(tmp_path, f"pokemons_{idx}.csv", lines=idx + 2) for idx in range(40)]
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(cache.cache_key, filepaths, ["pokemon"] * len(filepaths)))
+    assert sorted(cache.read_index()) == sorted(os.path.abspath(filepath) for filepath in filepaths)
+
+
+def test_clear_cache_of_one_file(tmp_path):
+    first = roster_copy(tmp_path, "pokemons_1.csv", lines=4)
+    second = roster_copy(tmp_path, "pokemons_2.csv", lines=6)
+    cache.load_monsters(first, "pokemon")
+    cache.load_monsters(second, "pokemon")
+
+    assert cache.clear_cache(first) == 1
+    assert sorted(cache.read_index()) == [os.path.abspath(second)]
+    assert cache.clear_cache() == 1
+    assert cache.read_index() == {}
@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+from itertools import combinations
+
+import pytest
+
+import menu
+
+DEX_MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex", "main.py")
+
+
+def roster(*names):
+    """
+    This function returns a roster with one monster of each name.
+    """
+    return [{"name": name} for name in names]
+
+
+def expected_comparison(rosters):
+    """
+    This function compares the rosters with sets of names.
+    """
+    sets = [{monster["name"] for monster in monsters} for monsters in rosters.values()]
+    intersection = {
+        (first, second): len(sets[first] & sets[second]) for first, second in combinations(range(len(sets)), 2)
+    }
+    unique = [len(names - set().union(*(other for other in sets if other is not names))) for names in sets]
+    return intersection, unique
+
+
+@pytest.mark.parametrize("sizes", [(7, 7), (7, 5, 13), (1, 9, 3, 17), (8, 8)])
+def test_disjoint_rosters(sizes):
+    rosters = {}
+    start = 0
+    for player, size in enumerate(sizes):
+        rosters[f"player_{player}"] = roster(*(f"monster_{idx}" for idx in range(start, start + size)))
+        start += size
+
+    comparison = menu.compare_rosters(rosters)
+    assert comparison["distinct"] == list(sizes)
+    assert comparison["unique"] == list(sizes)
+    assert all(comparison["intersection"][first][second] == 0 for first, second in combinations(range(len(sizes)), 2))
+
+
+def test_overlapping_rosters_match_sets():
+    rosters = {
+        "a": roster(*"abcdefg"),
+        "b": roster(*"efghijklm"),
+        "c": roster(*"amnopqrstuvwxyz", "a"),
+    }
+    comparison = menu.compare_rosters(rosters)
+    intersection, unique = expected_comparison(rosters)
+    for (first, second), shared in intersection.items():
+        assert comparison["intersection"][first][second] == shared
+    assert comparison["unique"] == unique
+    assert comparison["totals"] == [7, 9, 16]
+    assert comparison["name_frequency"]["a"] == 2
+
+
+def test_cli_compares_disjoint_directory(tmp_path):
+    header = "Id,Name,Type 1,Type 2,Total,HP,Attack,Defense,Sp. Atk,Sp. Def,Speed,Generation,Legendary\n"
+    rosters = tmp_path / "rosters"
+    rosters.mkdir()
+    for player in (1, 2):
+        with open(rosters / f"pokemons_{player}.csv", "w") as target:
+            target.write(header)
+            for idx in range(7):
+                target.write(f"{idx},Mon{player}_{idx},Grass,,300,50,50,50,50,50,50,1,False\n")
+
+    result = subprocess.run(
+        [sys.executable, DEX_MAIN, "--compare", str(rosters)],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=dict(os.environ, DEX_CACHE_DIR=str(tmp_path / "cache")),
+    )
+    assert result.returncode == 0, result.stderr
+    assert "WARNING" not in result.stdout
@@ -0,0 +1,114 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+import client
+import daemon
+
+DEX_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex")
+
+
+def echo_handler():
+    """
+    This function is a CLI that prints its arguments and directory.
+    """
+    print(" ".join(sys.argv[1:]), os.getcwd())
+
+
+def exchange(handler, message):
+    """
+    This function sends a raw message to handle_connection and
+    returns the decoded response.
+    """
+    server_end, client_end = socket.socketpair()
+    with server_end, client_end:
+        client_end.sendall(message)
+        client_end.shutdown(socket.SHUT_WR)
+        daemon.handle_connection(server_end, handler)
+        server_end.close()
+        return json.loads(client.receive_all(client_end).decode("utf-8"))
+
+
+@pytest.mark.parametrize(
+    "request_body",
+    [
+        {},
+        [],
+        {"args": "--help", "cwd": "/"},
+        {"args": ["--help", 1], "cwd": "/"},
+        {"args": ["--help"]},
+        {"args": ["--help"], "cwd": 1},
+        {"args": ["--help"], "cwd": "/", "env": {"DEX_ON_EXISTS": 1}},
+    ],
+)
+def test_bad_requests_are_rejected(request_body):
+    with pytest.raises(ValueError):
+        daemon.check_request(request_body)
+    with pytest.raises(ValueError):
+        daemon.run_request(echo_handler, request_body)
+    response = exchange(echo_handler, json.dumps(request_body).encode("utf-8"))
+    assert response["status"] == 1
+    assert "Invalid request" in response["stderr"]
+
+
+def test_invalid_json_gets_an_error_status():
+    response = exchange(echo_handler, b"{not json")
+    assert response["status"] == 1
+    assert "Invalid request" in response["stderr"]
+
+
+def test_request_runs_in_the_client_directory(tmp_path):
+    request_body = {"args": ["--trivia", "x.json"], "cwd": str(tmp_path), "env": {"DEX_ON_EXISTS": "append"}}
+    response = exchange(echo_handler, json.dumps(request_body).encode("utf-8"))
+    assert response == {
+        "stdout": f"--on-exists append --trivia x.json {os.path.realpath(tmp_path)}\n",
+        "stderr": "",
+        "status": 0,
+    }
+
+
+def test_exit_status_is_kept():
+    def failing_handler():
+        sys.exit(3)
+
+    assert daemon.run_request(failing_handler, {"args": [], "cwd": "/"})["status"] == 3
+
+
+def test_daemon_survives_bad_requests(tmp_path):
+    socket_path = str(tmp_path / "dex.sock")
+    script = textwrap.dedent(
+        f"""
+        import sys
+        sys.path.insert(0, {DEX_DIR!r})
+        import daemon
+        daemon.serve(lambda: print(" ".join(sys.argv[1:])), {socket_path!r})
+        """
+    )
+    process = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.DEVNULL, cwd=tmp_path)
+    try:
+        for _ in range(100):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+        for message in (b"{}", b"[1]", b"not json", b'{"args": null, "cwd": "/"}'):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.connect(socket_path)
+                connection.sendall(message)
+                connection.shutdown(socket.SHUT_WR)
+                assert json.loads(client.receive_all(connection).decode("utf-8"))["status"] == 1
+
+        response = client.send_request(["--trivia", "x.json"], socket_path)
+        assert response["status"] == 0
+        assert response["stdout"] == "--trivia x.json\n"
+        assert process.poll() is None
+        assert os.path.exists(socket_path)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    assert not os.path.exists(socket_path)
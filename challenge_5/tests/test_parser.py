@@ -0,0 +1,241 @@
+import glob
+import io
+import json
+import os
+import re
+import tracemalloc
+
+import pytest
+import yaml
+
+from core import parser
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+JSON_FILES = sorted(glob.glob(os.path.join(DATA_DIR, "*", "json", "*.json")))
+
+
+@pytest.mark.parametrize("filepath", JSON_FILES, ids=os.path.basename)
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_streamed_json_matches_json_load(filepath, chunk_size):
+    with open(filepath) as source_data:
+        expected = json.load(source_data)
+    with open(filepath) as source_data:
+        assert list(parser.iter_json_records(source_data, chunk_size)) == expected
+
+
+@pytest.mark.parametrize("filepath", JSON_FILES, ids=os.path.basename)
+def test_iter_records_streams_when_forced(filepath, monkeypatch):
+    monkeypatch.setattr(parser, "JSON_STREAM_MIN_SIZE", 0)
+    with open(filepath) as source_data:
+        assert list(parser.iter_records(filepath)) == json.load(source_data)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[12345]",
+        "[1.5e3, -0.25E-2, 7]",
+        ' [ {"a": [1, 2]} , "x", true, null ] \n',
+        "[]",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3])
+def test_values_split_between_chunks(text, chunk_size):
+    assert list(parser.iter_json_records(io.StringIO(text), chunk_size)) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["[1,,2]", "[,1]", "[1,]", "[1] x", "[1 2]", "[1", "[]]", "{}", "[1.]"])
+@pytest.mark.parametrize("chunk_size", [1, 64])
+def test_invalid_json_is_rejected_like_json_load(text, chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        list(parser.iter_json_records(io.StringIO(text), chunk_size))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '[\n  {"a": 1},\n  {"a": 2}\n  {"a": 3}\n]',
+        '[\n  {"a": 1},\n  {"a": 2},\n  {"a" 3}\n]',
+        '[{"a": 1}, {"a": 2}, {"a": 3}] x',
+        '[\n{"a": 1},\n{"a": "two\nlines"}\n',
+        '[\n{"a": 1},\n{"a": tru}]',
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 4, 64])
+def test_error_position_is_the_one_of_json_load(text, chunk_size):
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError) as error:
+        list(parser.iter_json_records(io.StringIO(text), chunk_size))
+    assert (error.value.msg, error.value.pos, error.value.lineno, error.value.colno) == (
+        expected.value.msg,
+        expected.value.pos,
+        expected.value.lineno,
+        expected.value.colno,
+    )
+    assert str(error.value) == str(expected.value)
+
+
+def test_broken_monster_fails_before_the_end_of_the_file():
+    class Source(io.StringIO):
+        read_size = 0
+
+        def read(self, size=-1):
+            chunk = super().read(size)
+            self.read_size += len(chunk)
+            return chunk
+
+    source_data = Source('[{"a": 1}, {"a": 1 "b": 2}' + ', {"a": 1}' * 100_000 + "]")
+    with pytest.raises(json.JSONDecodeError):
+        list(parser.iter_json_records(source_data, 1024, max_record_size=10_000))
+    assert source_data.read_size < 20_000
+
+
+CSV_HEADER = "Id,Name,Type 1,Type 2,Total,HP,Attack,Defense,Sp. Atk,Sp. Def,Speed,Generation,Legendary"
+CSV_ROW = "1,Bulbasaur,Grass,Poison,318,45,49,49,65,65,45,1,False"
+
+
+def test_csv_rows_are_decoded(tmp_path):
+    filepath = tmp_path / "pokemons.csv"
+    filepath.write_text(f"{CSV_HEADER}\n{CSV_ROW}\n\n{CSV_ROW}\n")
+    monsters = list(parser.iter_monsters(str(filepath), "pokemon"))
+    assert len(monsters) == 2
+    assert monsters[0]["name"] == "Bulbasaur" and monsters[0]["attack"] == 49 and monsters[0]["legendary"] is False
+
+
+@pytest.mark.parametrize("short_row", ["1,Bulbasaur,Grass", CSV_ROW.rsplit(",", 1)[0]])
+def test_short_csv_row_is_reported_with_its_line(tmp_path, short_row):
+    filepath = tmp_path / "pokemons.csv"
+    filepath.write_text(f"{CSV_HEADER}\n{CSV_ROW}\n{CSV_ROW}\n{short_row}\n")
+    with pytest.raises(ValueError, match=re.escape(f"{filepath}, line 4:")):
+        list(parser.iter_monsters(str(filepath), "pokemon"))
+
+
+def test_csv_header_without_a_column_is_reported(tmp_path):
+    filepath = tmp_path / "pokemons.csv"
+    filepath.write_text(f"{CSV_HEADER.replace('Id,', '#,')}\n{CSV_ROW}\n")
+    with pytest.raises(ValueError, match="no column Id"):
+        list(parser.iter_monsters(str(filepath), "pokemon"))
+
+
+def test_json_null_is_an_empty_string_like_an_empty_csv_column(tmp_path):
+    monster = dict(zip(CSV_HEADER.split(","), CSV_ROW.split(",")), **{"Type 2": None, "Legendary": None})
+    json_path = tmp_path / "pokemons.json"
+    json_path.write_text(json.dumps([monster]))
+    csv_path = tmp_path / "pokemons.csv"
+    csv_path.write_text(f"{CSV_HEADER}\n{CSV_ROW.replace('Poison', '').replace('False', '')}\n")
+    (decoded,) = parser.iter_monsters(str(json_path), "pokemon")
+    assert decoded == next(parser.iter_monsters(str(csv_path), "pokemon"))
+    assert "None" not in decoded.values()
+
+
+def test_empty_csv_has_no_monsters(tmp_path):
+    filepath = tmp_path / "pokemons.csv"
+    filepath.write_text("")
+    assert list(parser.iter_monsters(str(filepath), "pokemon")) == []
+
+
+YAML_FILES = sorted(glob.glob(os.path.join(DATA_DIR, "*", "yaml", "*.yaml")))
+YAML_MONSTERS = [
+    "- Name: Bulbasaur\n  HP: 45\n  Legendary: False\n  Type 2: \n",
+    "- Name: Ivysaur\n  HP: 60\n  Legendary: false\n  Type 2: Poison\n  Stats: [1, 2.5, null]\n",
+]
+
+
+@pytest.mark.parametrize("filepath", YAML_FILES, ids=os.path.basename)
+def test_streamed_yaml_matches_safe_load(filepath):
+    with open(filepath) as source_data:
+        expected = yaml.safe_load(source_data)
+    with open(filepath) as source_data:
+        assert list(parser.iter_yaml_events(source_data)) == expected
+    with open(filepath) as source_data:
+        assert list(parser.iter_yaml_records(source_data)) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "".join(YAML_MONSTERS),
+        "[]\n",
+        "- {Name: Mew, HP: 100}\n- {Name: Mew, 'HP': '100'}\n",
+    ],
+)
+def test_plain_yaml_lists_are_streamed(text):
+    assert list(parser.iter_yaml_events(io.StringIO(text))) == yaml.safe_load(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # An anchor and its alias, after two monsters already yielded.
+        "".join(YAML_MONSTERS) + "- &mew {Name: Mew, HP: 100}\n- *mew\n",
+        # A merge key, with an anchor and inline.
+        "".join(YAML_MONSTERS) + "- &base {HP: 1, Legendary: false}\n- <<: *base\n  Name: Mewtwo\n",
+        "".join(YAML_MONSTERS) + "- <<: {HP: 1}\n  Name: Mewtwo\n",
+        # A mapping with the monsters inside it, and a scalar document.
+        "monsters:\n" + "".join("  " + line + "\n" for monster in YAML_MONSTERS for line in monster.splitlines()),
+        "Bulbasaur\n",
+    ],
+)
+def test_yaml_layout_fallback_matches_safe_load(text):
+    with pytest.raises(parser.YamlLayoutError):
+        list(parser.iter_yaml_events(io.StringIO(text)))
+    expected = yaml.safe_load(text)
+    assert list(parser.iter_yaml_records(io.StringIO(text))) == list(expected)
+
+
+def test_yaml_error_after_the_fallback_is_the_one_of_safe_load():
+    text = "".join(YAML_MONSTERS) + "- ? [Name, HP]\n  : Mew\n"
+    records = parser.iter_yaml_records(io.StringIO(text))
+    assert [next(records), next(records)] == yaml.safe_load("".join(YAML_MONSTERS))
+    with pytest.raises(yaml.constructor.ConstructorError, match="unhashable key"):
+        next(records)
+
+
+XML_FILES = sorted(glob.glob(os.path.join(DATA_DIR, "*", "xml", "*.xml")))
+
+
+def xmltodict_monsters(text):
+    """
+    This function reads the monsters the way read_file did before the
+    incremental reader, with xmltodict, an empty tag was None there.
+    The <row> tags repeated in the digimon files come as one list.
+    """
+    xmltodict = pytest.importorskip("xmltodict")
+    monsters = []
+    for value in xmltodict.parse(text)["root"].values():
+        monsters.extend(value if isinstance(value, list) else [value])
+    return [{tag: value or "" for tag, value in monster.items()} for monster in monsters]
+
+
+@pytest.mark.parametrize("filepath", XML_FILES, ids=os.path.basename)
+@pytest.mark.parametrize("chunk_size", [5, 64 * 1024])
+def test_incremental_xml_matches_xmltodict(filepath, chunk_size):
+    with open(filepath) as source_data:
+        expected = xmltodict_monsters(source_data.read())
+    with open(filepath) as source_data:
+        assert list(parser.iter_xml_elements(source_data, chunk_size)) == expected
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 12))
+def test_id_tags_split_between_chunks_are_renamed(chunk_size):
+    text = "<root><id12><Name>Mew</Name></id12><id345><Name>Mewtwo</Name></id345></root>"
+    chunks = list(parser.xml_chunks(io.StringIO(text), chunk_size))
+    assert "".join(chunks) == "<root><id><Name>Mew</Name></id><id><Name>Mewtwo</Name></id></root>"
+    records = parser.iter_xml_elements(io.StringIO(text), chunk_size)
+    assert list(records) == [{"Name": "Mew"}, {"Name": "Mewtwo"}]
+
+
+def test_xml_elements_are_cleared():
+    monster = "<Name>Mew</Name><HP>100</HP><Attack>100</Attack><Defense>100</Defense><Speed>100</Speed>"
+    text = "<root>" + "".join(f"<id{idx}>{monster}</id{idx}>" for idx in range(20000)) + "</root>"
+    source_data = io.StringIO(text)
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in parser.iter_xml_elements(source_data))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert count == 20000
+    # Every element kept would take tens of MB, a cleared one is dropped after it is read.
+    assert peak < 2 * 1024 * 1024
@@ -0,0 +1,94 @@
+import glob
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+import core
+from core import io
+from core.report import ReportSection, ReportTemplate
+
+# Each case has the arguments of a show_* function, taken from the sample rosters, and the report the
+# renderer wrote for them before the templates.
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports")
+REPORT_CASES = sorted(os.path.basename(filepath)[:-5] for filepath in glob.glob(os.path.join(REPORTS_DIR, "*.json")))
+
+
+class FixedDate(datetime):
+    """
+    This class is a datetime whose now is the date of the saved reports.
+    """
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2020, 1, 2, 3, 4, 5, 60708)
+
+
+@pytest.fixture
+def fixed_date(monkeypatch):
+    """
+    This fixture makes the reports dated like the saved ones.
+    """
+    monkeypatch.setattr(io, "datetime", FixedDate)
+
+
+def saved_report():
+    """
+    This function returns the one report written in the current
+    directory.
+    """
+    (filepath,) = glob.glob("*.txt")
+    with open(filepath) as report:
+        return report.read()
+
+
+@pytest.mark.parametrize("values", ["{", "}", "{}", "{name}", "{0}", "%s", "100%", "%(name)s", "{{%}}"])
+def test_values_are_rendered_as_they_are(values):
+    template = ReportTemplate(["> {name} and {other:<10}|", ("{name}", 12), ReportSection("rows", ["- {name}"])])
+    rendered = template.render(dict(name=values, other=values, rows=[dict(name=values)]))
+    assert rendered.splitlines() == [
+        f"> {values} and {values:<10}|",
+        f"{values:<12}",
+        f"- {values}",
+    ]
+
+
+@pytest.mark.parametrize("field", ["0", "", "name.attr", "name[0]", "two words", "name-1", "1st"])
+def test_field_must_be_a_name(field):
+    with pytest.raises(ValueError, match="must be a name"):
+        ReportTemplate(["{" + field + "}"])
+
+
+@pytest.mark.parametrize("spec", ["{width}", "'>10", '"', "\\", "<10\n"])
+def test_format_spec_without_braces_or_quotes(spec):
+    with pytest.raises(ValueError):
+        ReportTemplate(["{name:" + spec + "}"])
+
+
+def test_plain_text_keeps_percent_and_doubled_braces():
+    template = ReportTemplate(["100% {{done}}"])
+    assert template.render({}) == "100% {done}\n"
+
+
+@pytest.mark.parametrize("case", REPORT_CASES)
+def test_reports_are_the_same_as_before(case, fixed_date):
+    with open(os.path.join(REPORTS_DIR, case + ".json")) as source:
+        call = json.load(source)
+    with open(os.path.join(REPORTS_DIR, case + ".txt")) as source:
+        expected = source.read()
+
+    getattr(core, call["function"])(*call["args"])
+    assert saved_report() == expected
+
+
+@pytest.mark.parametrize("rounds, loser", [(10, "DeoxysAttack Forme"), (356, "Chaosmon VA"), (7, "Mew")])
+def test_battle_lines_are_centered(fixed_date, rounds, loser):
+    core.show_battle_winner(dict(winner="2", rounds=rounds, loser_monster=loser), 0)
+    lines = saved_report().splitlines()
+    assert {len(line) for line in lines} == {80}
+    for value in (str(rounds), loser):
+        (line,) = [line for line in lines if line.strip("| ") == value]
+        left, right = line.index(value) - 1, 78 - len(value) - (line.index(value) - 1)
+        assert left == (78 - len(value)) // 2
+        assert right - left in (0, 1)
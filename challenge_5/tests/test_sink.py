@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from core import sink
+
+
+def read(filepath):
+    """
+    This function returns the content of a file.
+    """
+    with open(filepath, encoding="utf-8") as source_data:
+        return source_data.read()
+
+
+def leftovers(tmp_path):
+    """
+    This function returns the temporary files left in a directory.
+    """
+    return [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def append_lines(filepath, writer, lines):
+    """
+    This function appends lines to a file, one write for each line.
+    """
+    for idx in range(lines):
+        sink.append_locked(filepath, f"{writer}-{idx}\n".encode("utf-8"), sync=False)
+
+
+def test_write_atomic_replaces_the_file(tmp_path):
+    filepath = str(tmp_path / "1_battle.txt")
+    sink.write_atomic(filepath, b"first")
+    sink.write_atomic(filepath, b"second")
+    assert read(filepath) == "second"
+    assert not leftovers(tmp_path)
+
+
+def test_write_version_never_overwrites(tmp_path):
+    filepath = str(tmp_path / "1_battle.txt")
+    versions = {}
+    written = [sink.write_version(filepath, f"report {idx}".encode(), versions=versions) for idx in range(3)]
+    assert written == [filepath, str(tmp_path / "1_battle.1.txt"), str(tmp_path / "1_battle.2.txt")]
+    assert [read(path) for path in written] == ["report 0", "report 1", "report 2"]
+    # A new writer, without the versions already found, still finds the next free one.
+    assert sink.write_version(filepath, b"report 3") == str(tmp_path / "1_battle.3.txt")
+    assert not leftovers(tmp_path)
+
+
+def test_append_locked_from_many_processes(tmp_path):
+    filepath = str(tmp_path / "1_battle.txt")
+    with ProcessPoolExecutor(4) as executor:
+        list(executor.map(append_lines, [filepath] * 4, range(4), [200] * 4))
+    lines = read(filepath).splitlines()
+    assert sorted(lines) == sorted(f"{writer}-{idx}" for writer in range(4) for idx in range(200))
+
+
+@pytest.mark.parametrize("background", [False, True])
+@pytest.mark.parametrize(
+    "on_exists, expected",
+    [
+        ("append", {"1_battle.txt": "ab"}),
+        ("overwrite", {"1_battle.txt": "b"}),
+        ("version", {"1_battle.txt": "a", "1_battle.1.txt": "b"}),
+    ],
+)
+def test_report_sink_modes(tmp_path, background, on_exists, expected):
+    report_sink = sink.ReportSink(on_exists, sync=False, background=background)
+    filepath = str(tmp_path / "1_battle.txt")
+    report_sink.save("a", filepath)
+    report_sink.save("b", filepath)
+    report_sink.close()
+    assert {name: read(tmp_path / name) for name in os.listdir(tmp_path)} == expected
+
+
+def test_background_error_is_raised_by_flush(tmp_path):
+    report_sink = sink.ReportSink("overwrite", sync=False, background=True)
+    report_sink.save("a", str(tmp_path / "missing" / "1_battle.txt"))
+    with pytest.raises(FileNotFoundError):
+        report_sink.flush()
+    # The error is raised once, the sink keeps saving.
+    report_sink.save("b", str(tmp_path / "1_battle.txt"))
+    report_sink.close()
+    assert read(tmp_path / "1_battle.txt") == "b"
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        sink.ReportSink("ask")
@@ -0,0 +1,64 @@
+import pytest
+
+import core
+
+
+def names(start, stop):
+    """
+    This function returns the names of a synthetic roster.
+    """
+    return [f"monster-{idx}" for idx in range(start, stop)]
+
+
+def test_small_rosters_are_exact():
+    sketch_1 = core.NameSketch().consume(names(0, 100))
+    sketch_2 = core.NameSketch().consume(names(60, 150))
+    assert len(sketch_1) == 100
+    assert sketch_1.overlap(sketch_2) == (40, 60)
+    assert sketch_2.overlap(sketch_1) == (40, 50)
+
+
+@pytest.mark.parametrize("error", [0.05, 0.02])
+def test_big_rosters_within_error(error):
+    sketch_1 = core.NameSketch(error).consume(names(0, 200_000))
+    sketch_2 = core.NameSketch(error).consume(names(100_000, 300_000))
+    repeated, different = sketch_1.overlap(sketch_2)
+    assert not sketch_1.similarity.complete
+    assert abs(len(sketch_1) - 200_000) / 200_000 < 4 * error
+    assert abs(repeated - 100_000) / 100_000 < 4 * error
+    assert abs(different - 100_000) / 100_000 < 4 * error
+
+
+def test_consume_is_the_same_as_add():
+    consumed = core.NameSketch(0.05).consume(names(0, 5000) + names(0, 100))
+    added = core.NameSketch(0.05)
+    for name in names(0, 5000) + names(0, 100):
+        added.add(name)
+    assert consumed.cardinality.registers == added.cardinality.registers
+    assert consumed.similarity.hashes == added.similarity.hashes
+    assert sorted(consumed.similarity.heap) == sorted(added.similarity.heap)
+
+
+def test_cast_to_set_and_cast_to_sketch():
+    roster = [{"name": name} for name in names(0, 10) + names(5, 10)]
+    assert core.cast_to_set(roster) == set(names(0, 10))
+    sketch = core.cast_to_sketch(roster, 0.02)
+    assert isinstance(sketch, core.NameSketch)
+    assert len(sketch) == 10
+
+
+def test_sketch_roster_hashes_the_names_in_batches(monkeypatch):
+    monsters = [
+        {"name": name, "attack": idx % 97, "legendary": idx % 10 == 0}
+        for idx, name in enumerate(names(0, 10_000) + names(0, 50))
+    ]
+    expected = core.NameSketch(0.05).consume(monster["name"] for monster in monsters)
+    monkeypatch.setattr(core, "iter_monsters", lambda filepath, monster_type: iter(monsters))
+    monkeypatch.setattr(core.NameSketch, "add", None)
+
+    roster_stats, sketch = core.sketch_roster("pokemons.json", "pokemon", 0.05)
+    assert roster_stats.total == 10_050
+    assert roster_stats.special == 1005
+    assert roster_stats.max_of("attack")["attack"] == 96
+    assert sketch.cardinality.registers == expected.cardinality.registers
+    assert sketch.similarity.hashes == expected.similarity.hashes
@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import core
+import menu
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+DEX_MAIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex", "main.py")
+
+
+def pokemon_rosters(*names):
+    """
+    This function returns the two pokemon csv rosters under the names.
+    """
+    filepaths = [os.path.join(DATA_DIR, "pokemon", "csv", f"pokemons_{idx}.csv") for idx in (1, 2)]
+    return dict(zip(names, core.load_many(filepaths, ["pokemon", "pokemon"], workers=1)))
+
+
+def test_every_pair_plays_both_sides():
+    rosters = pokemon_rosters("a.csv", "b.csv")
+    rosters["c.csv"] = rosters["a.csv"]
+    standings = menu.run_tournament(rosters, 3, workers=1)
+    assert [standing["battles"] for standing in standings] == [4, 4, 4]
+    assert sum(standing["wins"] for standing in standings) == 6
+
+
+def test_a_tie_does_not_depend_on_the_names():
+    # The same team on both sides, each player wins the battle where it is player 2.
+    roster = pokemon_rosters("a.csv", "b.csv")["a.csv"]
+    for names in (("a.csv", "z.csv"), ("z.csv", "a.csv")):
+        standings = menu.run_tournament({name: roster for name in names}, 3, workers=1)
+        assert [(standing["wins"], standing["losses"]) for standing in standings] == [(1, 1), (1, 1)]
+
+
+def test_standings_do_not_depend_on_the_names():
+    first = menu.run_tournament(pokemon_rosters("a.csv", "b.csv"), 3, workers=1)
+    second = menu.run_tournament(pokemon_rosters("z.csv", "b.csv"), 3, workers=1)
+    assert [(standing["wins"], standing["rounds"]) for standing in first] == [
+        (standing["wins"], standing["rounds"]) for standing in second
+    ]
+
+
+def test_process_pool_gives_the_same_standings():
+    rosters = pokemon_rosters("a.csv", "b.csv")
+    assert menu.run_tournament(rosters, 3, workers=2, chunk_size=1) == menu.run_tournament(rosters, 3, workers=1)
+
+
+def test_run_tournament_rejects_no_workers():
+    with pytest.raises(ValueError):
+        menu.run_tournament(pokemon_rosters("a.csv", "b.csv"), 3, workers=0)
+
+
+@pytest.mark.parametrize("workers", ["0", "-2"])
+def test_cli_rejects_workers_below_one(workers, tmp_path):
+    result = subprocess.run(
+        [sys.executable, DEX_MAIN, "--tournament", os.path.join(DATA_DIR, "pokemon", "csv"), "--workers", workers],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env=dict(os.environ, DEX_CACHE_DIR=str(tmp_path / "cache")),
+    )
+    assert result.stdout.startswith("WARNING: --workers needs at least 1 process.")
+    assert not os.path.exists(tmp_path / "0_tournament.txt")
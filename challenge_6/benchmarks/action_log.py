@@ -0,0 +1,74 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import interface  # noqa: E402
+
+# Usage: python benchmarks/action_log.py [events]
+# Logs many trivia actions with a small rotation size, then builds the session report by
+# streaming the compressed and current logs, and by loading every event in a list first.
+
+
+def measured(function: Callable, *args) -> Tuple[float, int, object]:
+    """
+    This function returns how many seconds a call takes, its peak
+    traced memory in bytes and its result.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def loaded_report(log_file: str) -> str:
+    """
+    This function builds the report from a list of every event, as a
+    report reading the whole log at once would.
+    """
+    return interface.session_report(list(interface.iter_log_events(log_file)))
+
+
+def main() -> None:
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    directory = tempfile.mkdtemp()
+    log_file = os.path.join(directory, "dex-actions.jsonl")
+    trivia = interface.Trivia(interface.read_file(os.path.join(interface.DATA_DIR, "digimon", "csv", "digimons_1.csv")))
+    files = {f"/data/digimons_{idx}.csv": {"sha256": f"{idx:064x}", "size": 1000 + idx} for idx in range(20)}
+
+    action_log = interface.ActionLog(log_file, max_bytes=4 * 1024 * 1024)
+    start = time.perf_counter()
+    for idx in range(events):
+        filepath = f"/data/digimons_{idx % 20}.csv"
+        action_log.record("trivia", {"option": "2", "file": filepath}, {filepath: files[filepath]}, 0.001,
+                          trivia.summary())
+    elapsed = time.perf_counter() - start
+
+    segments = interface.log_segments(log_file)
+    size = sum(os.path.getsize(segment) for segment in segments)
+    plain = len(json.dumps(trivia.summary())) * events
+    print(f"{events} events logged in {elapsed:.2f}s, {events / elapsed:.0f} events/s")
+    print(f"{len(segments)} log files, {size / 2**20:.1f} MiB on disk, about {plain / 2**20:.0f} MiB of json")
+
+    print("\nsession report, tracemalloc peak")
+    for name, function in (
+        ("streamed", lambda: interface.session_report(interface.iter_log_events(log_file))),
+        ("loaded", lambda: loaded_report(log_file)),
+    ):
+        elapsed, peak, _ = measured(function)
+        print(f"{name:>10} | {peak / 2**20:>8.1f} MiB | {elapsed:.2f}s")
+
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import csv
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "dex"))
+
+import interface  # noqa: E402
+
+# Usage: python benchmarks/monster_memory.py [rows]
+# Compares the Monster classes with a __dict__ per instance, as they were before the slots,
+# with the slotted ones: the size of one instance, the memory of many, and read_file of a csv.
+
+POKEMON_HEADER = ["Id", "Name", "Type 1", "Type 2", "Total", "HP", "Attack", "Defense",
+                  "Sp. Atk", "Sp. Def", "Speed", "Generation", "Legendary"]
+
+
+class DictMonster:
+    def __init__(self, category, id, name, stage, type, type2, generation, legendary, hp, attack, defense, speed,
+                 cur_hp):
+        self.category = category
+        self.monster_id = id
+        self.name = name
+        self.stage = stage
+        self.type = type
+        self.type2 = type2
+        self.generation = generation
+        self.legendary = legendary
+        self.hp = hp
+        self.attack = attack
+        self.defense = defense
+        self.speed = speed
+        self.current_hp = cur_hp
+
+
+class DictTeamMonster(DictMonster):
+    def __init__(self, *args):
+        super().__init__(*args[:13])
+        self.team_id, self.team_name = args[13:15]
+
+
+class DictPlayer(DictTeamMonster):
+    def __init__(self, *args):
+        super().__init__(*args[:15])
+        self.player_id, self.player_name = args[15:17]
+
+
+def instance_size(instance: object) -> int:
+    """
+    This function returns the bytes of one instance, with its
+    __dict__ when it has one.
+    """
+    return sys.getsizeof(instance) + (sys.getsizeof(instance.__dict__) if hasattr(instance, "__dict__") else 0)
+
+
+def measured(function: Callable, *args) -> Tuple[float, int, object]:
+    """
+    This function returns how many seconds a call takes, its peak
+    traced memory in bytes and its result.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def write_csv(rows: int) -> str:
+    """
+    This function writes a pokemon csv file with the given amount
+    of rows and returns its path.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as target:
+        writer = csv.writer(target)
+        writer.writerow(POKEMON_HEADER)
+        for idx in range(rows):
+            writer.writerow([idx, f"Mon{idx}", "Dragon", "", 410, 68, 90, 65, 50, 55, 82, 4, "False"])
+    return target.name
+
+
+def dict_read_file(filepath: str) -> List[DictMonster]:
+    """
+    This function is the csv branch of read_file before the slots,
+    a DictReader dict per row and then a Monster with a __dict__.
+    """
+    with open(filepath, "r") as source_data:
+        data_read = [row for row in csv.DictReader(source_data, delimiter=",")]
+        return [
+            DictMonster("Pokemon", value["Id"], value["Name"], "", value["Type 1"], value["Type 2"],
+                        value["Generation"], value["Legendary"], value["HP"], value["Attack"], value["Defense"],
+                        value["Speed"], value["HP"])
+            for value in data_read
+        ]
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = ("Pokemon", 1, "Mon", "", "Dragon", "", 4, "False", 68, 90, 65, 82, 68, 1, "Team", 1, "Ash")
+
+    print("sys.getsizeof of one instance, with its __dict__")
+    for name, old, new, arguments in (
+        ("Monster", DictMonster, interface.Monster, 13),
+        ("TeamMonster", DictTeamMonster, interface.TeamMonster, 15),
+        ("Player", DictPlayer, interface.Player, 17),
+    ):
+        old_size = instance_size(old(*values[:arguments]))
+        new_size = instance_size(new(*values[:arguments]))
+        print(f"{name:>12} | dict {old_size:>4} B | slots {new_size:>4} B | {old_size / new_size:.2f}x")
+
+    print(f"\n{rows} monsters in a list, tracemalloc peak")
+    for name, monster_class in (("dict", DictMonster), ("slots", interface.Monster)):
+        elapsed, peak, _ = measured(lambda: [monster_class(*values[:13]) for _ in range(rows)])
+        print(f"{name:>12} | {peak / 2**20:>8.1f} MiB | {elapsed:.2f}s")
+
+    filepath = write_csv(rows)
+    try:
+        print(f"\nread_file of a {rows} rows csv, tracemalloc peak")
+        for name, function in (("dict", dict_read_file), ("slots", interface.read_file)):
+            elapsed, peak, _ = measured(function, filepath)
+            print(f"{name:>12} | {peak / 2**20:>8.1f} MiB | {elapsed:.2f}s")
+    finally:
+        os.remove(filepath)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,69 @@
 import json
 import csv
-import xmltodict
+import gzip
+import hashlib
+import shutil
+import time
 import yaml
 import os
 import sys
 
 from datetime import datetime
-from typing import Dict, Union, List
+from operator import getitem
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union, List
+from xml.etree import ElementTree
 
 id_number = 0
 
+# The key of each Monster argument, from id to speed, in the files, None when the category doesn't have it.
+MONSTER_KEYS: Dict[str, List[Optional[str]]] = {
+    "Pokemon": ["Id", "Name", None, "Type 1", "Type 2", "Generation", "Legendary", "HP", "Attack", "Defense", "Speed"],
+    "Digimon": ["Id", "Name", "Stage", "Type", None, None, None, "HP", "Atk", "Def", "Spd"],
+}
+
+# The digimon stages and types, in the order the trivia shows them.
+DIGIMON_STAGES: List[str] = ["In-Training", "Baby", "Rookie", "Champion", "Ultimate", "Mega", "Ultra", "Armor", "None"]
+DIGIMON_TYPES: List[str] = ["Data", "Vaccine", "Virus", "Free"]
+
+# The directory with the pokemon and digimon folders, the data folder of the repository by default.
+DATA_DIR: str = os.environ.get(
+    "DEX_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+)
+
+# The json lines log of the menu actions, rotated and compressed when it is bigger than
+# LOG_MAX_BYTES or older than LOG_MAX_AGE seconds.
+LOG_FILE: str = os.environ.get("DEX_LOG_FILE", "dex-actions.jsonl")
+LOG_MAX_BYTES: int = int(os.environ.get("DEX_LOG_MAX_BYTES", 1024 * 1024))
+LOG_MAX_AGE: float = float(os.environ.get("DEX_LOG_MAX_AGE", 24 * 60 * 60))
+
+# How many files the menu keeps the rosters, trivia and sha256 of, the least recently used are dropped.
+SESSION_MAX_FILES: int = int(os.environ.get("DEX_SESSION_FILES", 16))
+
+# The xml tags can't have spaces, so some keys have other names in the xml files.
+XML_TAGS: Dict[str, str] = {
+    "Type 1": "Type1",
+    "Type 2": "Type2",
+}
+
 
 class Monster:
+    # The slots replace the __dict__ of each instance, a monster uses less than half the memory.
+    __slots__ = (
+        "category",
+        "monster_id",
+        "name",
+        "stage",
+        "type",
+        "type2",
+        "generation",
+        "legendary",
+        "hp",
+        "attack",
+        "defense",
+        "speed",
+        "current_hp",
+    )
+
     def __init__(self, category, id, name, stage, type, type2, generation, legendary, hp, attack, defense, speed, cur_hp):
         self.category = category
         self.monster_id = id
@@ -55,6 +107,8 @@ class Monster:
 
 
 class TeamMonster(Monster):
+    __slots__ = ("team_id", "team_name")
+
     def __init__(self, category, id, name, stage, type, type2, generation, legendary, hp, attack, 
                 defense, speed, cur_hp, team_id, team_name):
         super().__init__(category, id, name, stage, type, type2, generation, legendary, hp, attack,
@@ -64,6 +118,8 @@ class TeamMonster(Monster):
 
 
 class Player(TeamMonster):
+    __slots__ = ("player_id", "player_name")
+
     def __init__(self, category, id, name, stage, type, type2, generation, legendary, hp, attack,
                  defense, speed, cur_hp, team_id, team_name, player_id, player_name):
         super().__init__(category, id, name, stage, type, type2, generation, legendary, hp, attack,
@@ -72,71 +128,164 @@ class Player(TeamMonster):
         self.player_name = player_name
 
 
-class Trivia():
-    monster_list = {}
-    monster_sum = "0"
-    highest_hp_monster = {}
-    highest_atk_monster = {}
-    lowest_atk_monster = {}
-    highest_def_monster = {}
-    highest_spd_monster = {}
-# é possível usar o stage list como um dict, para somar quantas chaves tem e no valor da chave ter quantos digimons tem em cada
-    training_dict = []
-    baby_dict = []
-    rookie_dict = []
-    champion_dict = []
-    ultimate_dict = []
-    mega_dict = []
-    ultra_dict = []
-    armor_dict = []
-    none_dict = []
-    data_dict = []
-    vaccine_dict = []
-    virus_dict = []
-    free_dict = []
-    baby_digimon = 0
-    rookie_digimon = 0
-    champion_digimon = 0
-    ultimate_digimon = 0
-    mega_digimon = 0
-    ultra_digimon = 0
-    data_type = 0
-    vaccine_type = 0
-    virus_type = 0
-    free_type = 0
-    training_strongest = {}
-    baby_strongest = {}
-    rookie_strongest = {}
-    champion_strongest = {}
-    ultimate_strongest = {}
-    mega_strongest = {}
-    ultra_strongest = {}
-    armor_strongest = {}
-    none_strongest = {}
-    data_strongest = {}
-    vaccine_strongest = {}
-    virus_strongest = {}
-    free_strongest = {}
-    digimon_types = []
-    digimon_stages = []
-
-    def get_hp(self):
-
-        return int(self.hp)
-
-    def get_atk(self):
-
-        return int(self.attack)
-
-    def get_def(self):
-
-        return int(self.defense)
-
-    def get_spd(self):
-
-        return int(self.speed)
-
-    def show_pokemon_trivia() -> None:
+# Shown in the trivia when a stage or type has no monster.
+NO_MONSTER = Monster("", "", "-", "-", "-", "", "", "", "-", "-", "-", "-", "-")
+
+
+class Trivia:
+    """
+    This class gathers the trivia of a list of monsters one monster
+    at a time, so it can be fed while a file is read, merged with the
+    trivia of the other parts of the list, and reset to be reused.
+
+    Each instance keeps its own counters, and only the monsters that
+    answer a question are kept, not the whole list.
+
+    Parameters
+    ----------
+    monsters:
+        The monsters to be added, the trivia starts empty by default.
+    """
+
+    def __init__(self, monsters: Iterable[Monster] = ()) -> None:
+        self.reset()
+        self.consume(monsters)
+
+    def reset(self) -> None:
+        """
+        This function empties the trivia, as if no monster was added.
+        """
+        self.monster_sum = 0
+        self.highest_hp_monster: Optional[Monster] = None
+        self.highest_atk_monster: Optional[Monster] = None
+        self.lowest_atk_monster: Optional[Monster] = None
+        self.highest_def_monster: Optional[Monster] = None
+        self.highest_spd_monster: Optional[Monster] = None
+        # The stages and types in the order they are found in the list.
+        self.stage_counts: Dict[str, int] = {}
+        self.type_counts: Dict[str, int] = {}
+        self.stage_strongest: Dict[str, Monster] = {}
+        self.type_strongest: Dict[str, Monster] = {}
+
+    @property
+    def digimon_stages(self) -> List[str]:
+        return list(self.stage_counts)
+
+    @property
+    def digimon_types(self) -> List[str]:
+        return list(self.type_counts)
+
+    @staticmethod
+    def highest(current: Optional[Monster], monster: Optional[Monster], stat: str) -> Optional[Monster]:
+        """
+        This function returns the monster with the highest stat, the
+        current one on a tie, so the first in the list wins.
+        """
+        if current is None or (monster is not None and int(getattr(monster, stat)) > int(getattr(current, stat))):
+            return monster
+        return current
+
+    @staticmethod
+    def lowest(current: Optional[Monster], monster: Optional[Monster], stat: str) -> Optional[Monster]:
+        """
+        This function returns the monster with the lowest stat, the
+        current one on a tie, so the first in the list wins.
+        """
+        if current is None or (monster is not None and int(getattr(monster, stat)) < int(getattr(current, stat))):
+            return monster
+        return current
+
+    def add(self, monster: Monster) -> None:
+        """
+        This function adds one monster to the trivia.
+
+        Parameters
+        ----------
+        monster:
+            The monster read from the file.
+        """
+        self.monster_sum += 1
+        self.highest_hp_monster = self.highest(self.highest_hp_monster, monster, "hp")
+        self.highest_atk_monster = self.highest(self.highest_atk_monster, monster, "attack")
+        self.lowest_atk_monster = self.lowest(self.lowest_atk_monster, monster, "attack")
+        self.highest_def_monster = self.highest(self.highest_def_monster, monster, "defense")
+        self.highest_spd_monster = self.highest(self.highest_spd_monster, monster, "speed")
+
+        self.stage_counts[monster.stage] = self.stage_counts.get(monster.stage, 0) + 1
+        self.type_counts[monster.type] = self.type_counts.get(monster.type, 0) + 1
+        self.stage_strongest[monster.stage] = self.highest(self.stage_strongest.get(monster.stage), monster, "attack")
+        self.type_strongest[monster.type] = self.highest(self.type_strongest.get(monster.type), monster, "attack")
+
+    def consume(self, monsters: Iterable[Monster]) -> "Trivia":
+        """
+        This function adds every monster of a list or generator.
+
+        Returns
+        -------
+        self:
+            The same trivia, so the calls can be chained.
+        """
+        for monster in monsters:
+            self.add(monster)
+        return self
+
+    def merge(self, other: "Trivia") -> "Trivia":
+        """
+        This function returns the trivia of this list followed by the
+        other list, the same as one trivia fed with both lists.
+
+        Parameters
+        ----------
+        other:
+            The trivia of the monsters that come after these ones.
+
+        Returns
+        -------
+            A new trivia, this one and the other are not changed.
+        """
+        merged = Trivia()
+        merged.monster_sum = self.monster_sum + other.monster_sum
+        merged.highest_hp_monster = self.highest(self.highest_hp_monster, other.highest_hp_monster, "hp")
+        merged.highest_atk_monster = self.highest(self.highest_atk_monster, other.highest_atk_monster, "attack")
+        merged.lowest_atk_monster = self.lowest(self.lowest_atk_monster, other.lowest_atk_monster, "attack")
+        merged.highest_def_monster = self.highest(self.highest_def_monster, other.highest_def_monster, "defense")
+        merged.highest_spd_monster = self.highest(self.highest_spd_monster, other.highest_spd_monster, "speed")
+
+        for trivia in (self, other):
+            for stage, count in trivia.stage_counts.items():
+                merged.stage_counts[stage] = merged.stage_counts.get(stage, 0) + count
+                merged.stage_strongest[stage] = self.highest(
+                    merged.stage_strongest.get(stage), trivia.stage_strongest[stage], "attack"
+                )
+            for monster_type, count in trivia.type_counts.items():
+                merged.type_counts[monster_type] = merged.type_counts.get(monster_type, 0) + count
+                merged.type_strongest[monster_type] = self.highest(
+                    merged.type_strongest.get(monster_type), trivia.type_strongest[monster_type], "attack"
+                )
+        return merged
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        This function returns the main answers of the trivia, with
+        only names and numbers, to be logged as json.
+
+        Returns
+        -------
+            The amount of monsters, the names of the highest ones, and
+            the amount in each stage and type.
+        """
+        return {
+            "monsters": self.monster_sum,
+            "highest_hp": (self.highest_hp_monster or NO_MONSTER).name,
+            "highest_attack": (self.highest_atk_monster or NO_MONSTER).name,
+            "lowest_attack": (self.lowest_atk_monster or NO_MONSTER).name,
+            "highest_defense": (self.highest_def_monster or NO_MONSTER).name,
+            "fastest": (self.highest_spd_monster or NO_MONSTER).name,
+            "stages": dict(self.stage_counts),
+            "types": dict(self.type_counts),
+        }
+
+    def show_pokemon_trivia(self) -> None:
         """
         This function will print a message in the CLI.
 
@@ -152,6 +301,12 @@ class Trivia():
 
         """
         break_line: str = (" " * 80) + "\n"
+        monster_sum = str(self.monster_sum)
+        # An empty list has no monster to show, it is shown with a "-".
+        highest_hp = self.highest_hp_monster or NO_MONSTER
+        highest_atk = self.highest_atk_monster or NO_MONSTER
+        highest_def = self.highest_def_monster or NO_MONSTER
+        highest_spd = self.highest_spd_monster or NO_MONSTER
 
         datenow = datetime.now()
         msg = break_line
@@ -165,9 +320,9 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> "
-            + Trivia.monster_sum
+            + monster_sum
             + " pokemons"
-            + (" " * (25 - len(Trivia.monster_sum)))
+            + (" " * (25 - len(monster_sum)))
             + "\n"
         )
         msg += break_line
@@ -175,15 +330,15 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> "
-            + Trivia.highest_hp_monster.name
+            + highest_hp.name
             + " with "
-            + str(Trivia.highest_hp_monster.hp)
+            + str(highest_hp.hp)
             + " HP points"
             + (
                 " "
                 * (
-                    (59 - len(Trivia.highest_hp_monster.name))
-                    - len(str(Trivia.highest_hp_monster.hp))
+                    (59 - len(highest_hp.name))
+                    - len(str(highest_hp.hp))
                 )
             )
             + "\n"
@@ -193,15 +348,15 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> "
-            + Trivia.highest_atk_monster.name
+            + highest_atk.name
             + " with "
-            + str(Trivia.highest_atk_monster.attack)
+            + str(highest_atk.attack)
             + " attack points."
             + (
                 " "
                 * (
-                    (54 - len(Trivia.highest_atk_monster.name))
-                    - len(str(Trivia.highest_atk_monster.attack))
+                    (54 - len(highest_atk.name))
+                    - len(str(highest_atk.attack))
                 )
             )
             + "\n"
@@ -211,15 +366,15 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> "
-            + Trivia.highest_def_monster.name
+            + highest_def.name
             + " with "
-            + str(Trivia.highest_def_monster.defense)
+            + str(highest_def.defense)
             + " defense points."
             + (
                 " "
                 * (
-                    (53 - len(Trivia.highest_def_monster.name))
-                    - len(str(Trivia.highest_def_monster.defense))
+                    (53 - len(highest_def.name))
+                    - len(str(highest_def.defense))
                 )
             )
             + "\n"
@@ -229,15 +384,15 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> "
-            + Trivia.highest_spd_monster.name
+            + highest_spd.name
             + " with "
-            + str(Trivia.highest_spd_monster.speed)
+            + str(highest_spd.speed)
             + " speed points."
             + (
                 " "
                 * (
-                    (55 - len(Trivia.highest_spd_monster.name))
-                    - len(str(Trivia.highest_spd_monster.speed))
+                    (55 - len(highest_spd.name))
+                    - len(str(highest_spd.speed))
                 )
             )
             + "\n"
@@ -254,7 +409,7 @@ class Trivia():
 
         data_saver(msg, "pokemon-trivia", id_number)
 
-    def show_digimon_trivia() -> None:
+    def show_digimon_trivia(self) -> None:
         """
         This function will print a message about in the CLI.
 
@@ -270,6 +425,17 @@ class Trivia():
 
         """
         break_line: str = (" " * 80) + "\n"
+        monster_sum = str(self.monster_sum)
+        # An empty list has no monster to show, it is shown with a "-".
+        highest_atk = self.highest_atk_monster or NO_MONSTER
+        lowest_atk = self.lowest_atk_monster or NO_MONSTER
+        stage_counts = self.stage_counts
+        type_counts = self.type_counts
+        # A stage or type missing in the list is shown with a "-".
+        stage_strongest = {stage: self.stage_strongest.get(stage, NO_MONSTER) for stage in DIGIMON_STAGES}
+        type_strongest = {
+            monster_type: self.type_strongest.get(monster_type, NO_MONSTER) for monster_type in DIGIMON_TYPES
+        }
 
         datenow = datetime.now()
         msg = break_line
@@ -283,9 +449,9 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> "
-            + Trivia.monster_sum
+            + monster_sum
             + " digimon"
-            + (" " * (25 - len(Trivia.monster_sum)))
+            + (" " * (25 - len(monster_sum)))
             + "\n"
         )
         msg += break_line
@@ -293,9 +459,9 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> In this list we have "
-            + str(len(Trivia.digimon_stages))
+            + str(len(self.digimon_stages))
             + " stages of digimon, they're "
-            + " ".join(Trivia.digimon_stages)
+            + " ".join(self.digimon_stages)
             + "\n"
         )
         msg += break_line
@@ -304,81 +470,81 @@ class Trivia():
             (" " * 4)
             + "> "
             + "In-Training: "
-            + str(len(Trivia.training_dict))
+            + str(stage_counts.get("In-Training", 0))
             + " digimon"
-            + (" " * (53 - len(Trivia.training_dict)))
+            + (" " * (53 - stage_counts.get("In-Training", 0)))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Baby: "
-            + str(len(Trivia.baby_dict))
+            + str(stage_counts.get("Baby", 0))
             + " digimon"
-            + (" " * (60 - len(Trivia.baby_dict)))
+            + (" " * (60 - stage_counts.get("Baby", 0)))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Rookie: "
-            + str(len(Trivia.rookie_dict))
+            + str(stage_counts.get("Rookie", 0))
             + " digimon"
-            + (" " * (60 - len(Trivia.rookie_dict)))
+            + (" " * (60 - stage_counts.get("Rookie", 0)))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Champion: "
-            + str(len(Trivia.champion_dict))
+            + str(stage_counts.get("Champion", 0))
             + " digimon"
-            + (" " * (60 - len(Trivia.champion_dict)))
+            + (" " * (60 - stage_counts.get("Champion", 0)))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Ultimate: "
-            + str(len(Trivia.ultimate_dict))
+            + str(stage_counts.get("Ultimate", 0))
             + " digimon"
-            + (" " * (60 - len(Trivia.ultimate_dict)))
+            + (" " * (60 - stage_counts.get("Ultimate", 0)))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Mega: "
-            + str(len(Trivia.mega_dict))
+            + str(stage_counts.get("Mega", 0))
             + " digimon"
-            + (" " * (60 - len(Trivia.mega_dict)))
+            + (" " * (60 - stage_counts.get("Mega", 0)))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Ultra: "
-            + str(len(Trivia.ultra_dict))
+            + str(stage_counts.get("Ultra", 0))
             + " digimon"
-            + (" " * (60 - len(Trivia.ultra_dict)))
+            + (" " * (60 - stage_counts.get("Ultra", 0)))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Armor: "
-            + str(len(Trivia.armor_dict))
+            + str(stage_counts.get("Armor", 0))
             + " digimon"
-            + (" " * (60 - len(Trivia.armor_dict)))
+            + (" " * (60 - stage_counts.get("Armor", 0)))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "None: "
-            + str(len(Trivia.none_dict))
+            + str(stage_counts.get("None", 0))
             + " digimon"
-            + (" " * (60 - len(Trivia.none_dict)))
+            + (" " * (60 - stage_counts.get("None", 0)))
             + "\n"
         )
         msg += break_line
@@ -391,15 +557,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "In-Training: "
-            + Trivia.training_strongest.name
+            + stage_strongest["In-Training"].name
             + ", "
-            + str(Trivia.training_strongest.attack)
+            + str(stage_strongest["In-Training"].attack)
             + (
                 " "
                 * (
                     65
-                    - len(Trivia.training_strongest.name)
-                    - len(str(Trivia.training_strongest.attack))
+                    - len(stage_strongest["In-Training"].name)
+                    - len(str(stage_strongest["In-Training"].attack))
                 )
             )
             + "\n"
@@ -408,15 +574,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Baby: "
-            + Trivia.baby_strongest.name
+            + stage_strongest["Baby"].name
             + ", "
-            + str(Trivia.baby_strongest.attack)
+            + str(stage_strongest["Baby"].attack)
             + (
                 " "
                 * (
                     65
-                    - len(Trivia.baby_strongest.name)
-                    - len(str(Trivia.baby_strongest.attack))
+                    - len(stage_strongest["Baby"].name)
+                    - len(str(stage_strongest["Baby"].attack))
                 )
             )
             + "\n"
@@ -425,15 +591,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Rookie: "
-            + Trivia.rookie_strongest.name
+            + stage_strongest["Rookie"].name
             + ", "
-            + str(Trivia.rookie_strongest.attack)
+            + str(stage_strongest["Rookie"].attack)
             + (
                 " "
                 * (
                     63
-                    - len(Trivia.rookie_strongest.name)
-                    - len(str(Trivia.rookie_strongest.attack))
+                    - len(stage_strongest["Rookie"].name)
+                    - len(str(stage_strongest["Rookie"].attack))
                 )
             )
             + "\n"
@@ -442,15 +608,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Champion: "
-            + Trivia.champion_strongest.name
+            + stage_strongest["Champion"].name
             + ", "
-            + str(Trivia.champion_strongest.attack)
+            + str(stage_strongest["Champion"].attack)
             + (
                 " "
                 * (
                     61
-                    - len(Trivia.champion_strongest.name)
-                    - len(str(Trivia.champion_strongest.attack))
+                    - len(stage_strongest["Champion"].name)
+                    - len(str(stage_strongest["Champion"].attack))
                 )
             )
             + "\n"
@@ -459,15 +625,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Ultimate: "
-            + Trivia.ultimate_strongest.name
+            + stage_strongest["Ultimate"].name
             + ", "
-            + str(Trivia.ultimate_strongest.attack)
+            + str(stage_strongest["Ultimate"].attack)
             + (
                 " "
                 * (
                     61
-                    - len(Trivia.ultimate_strongest.name)
-                    - len(str(Trivia.ultimate_strongest.attack))
+                    - len(stage_strongest["Ultimate"].name)
+                    - len(str(stage_strongest["Ultimate"].attack))
                 )
             )
             + "\n"
@@ -476,15 +642,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Mega: "
-            + Trivia.mega_strongest.name
+            + stage_strongest["Mega"].name
             + ", "
-            + str(Trivia.mega_strongest.attack)
+            + str(stage_strongest["Mega"].attack)
             + (
                 " "
                 * (
                     63
-                    - len(Trivia.mega_strongest.name)
-                    - len(str(Trivia.mega_strongest.attack))
+                    - len(stage_strongest["Mega"].name)
+                    - len(str(stage_strongest["Mega"].attack))
                 )
             )
             + "\n"
@@ -493,15 +659,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Ultra: "
-            + Trivia.ultra_strongest.name
+            + stage_strongest["Ultra"].name
             + ", "
-            + str(Trivia.ultra_strongest.attack)
+            + str(stage_strongest["Ultra"].attack)
             + (
                 " "
                 * (
                     64
-                    - len(Trivia.ultra_strongest.name)
-                    - len(str(Trivia.ultra_strongest.attack))
+                    - len(stage_strongest["Ultra"].name)
+                    - len(str(stage_strongest["Ultra"].attack))
                 )
             )
             + "\n"
@@ -510,15 +676,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Armor: "
-            + Trivia.armor_strongest.name
+            + stage_strongest["Armor"].name
             + ", "
-            + str(Trivia.armor_strongest.attack)
+            + str(stage_strongest["Armor"].attack)
             + (
                 " "
                 * (
                     64
-                    - len(Trivia.armor_strongest.name)
-                    - len(str(Trivia.armor_strongest.attack))
+                    - len(stage_strongest["Armor"].name)
+                    - len(str(stage_strongest["Armor"].attack))
                 )
             )
             + "\n"
@@ -527,15 +693,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "None: "
-            + Trivia.none_strongest.name
+            + stage_strongest["None"].name
             + ", "
-            + str(Trivia.none_strongest.attack)
+            + str(stage_strongest["None"].attack)
             + (
                 " "
                 * (
                     65
-                    - len(Trivia.none_strongest.name)
-                    - len(str(Trivia.none_strongest.attack))
+                    - len(stage_strongest["None"].name)
+                    - len(str(stage_strongest["None"].attack))
                 )
             )
             + "\n"
@@ -545,9 +711,9 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> In this list we have "
-            + str(len(Trivia.digimon_types))
+            + str(len(self.digimon_types))
             + " types of digimon, they're "
-            + " ".join(Trivia.digimon_types)
+            + " ".join(self.digimon_types)
             + "\n"
         )
         msg += break_line
@@ -556,32 +722,32 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Data: "
-            + str(len(Trivia.data_dict))
-            + (" " * (68 - len(str(Trivia.data_dict))))
+            + str(type_counts.get("Data", 0))
+            + (" " * (68 - len(str(type_counts.get("Data", 0)))))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Vaccine: "
-            + str(len(Trivia.vaccine_dict))
-            + (" " * (65 - len(str(Trivia.vaccine_dict))))
+            + str(type_counts.get("Vaccine", 0))
+            + (" " * (65 - len(str(type_counts.get("Vaccine", 0)))))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Virus: "
-            + str(len(Trivia.virus_dict))
-            + (" " * (67 - len(str(Trivia.virus_dict))))
+            + str(type_counts.get("Virus", 0))
+            + (" " * (67 - len(str(type_counts.get("Virus", 0)))))
             + "\n"
         )
         msg += (
             (" " * 4)
             + "> "
             + "Free: "
-            + str(len(Trivia.free_dict))
-            + (" " * (68 - len(str(Trivia.free_dict))))
+            + str(type_counts.get("Free", 0))
+            + (" " * (68 - len(str(type_counts.get("Free", 0)))))
             + "\n"
         )
         msg += break_line
@@ -594,15 +760,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Data: "
-            + Trivia.data_strongest.name
+            + type_strongest["Data"].name
             + ", "
-            + str(Trivia.data_strongest.attack)
+            + str(type_strongest["Data"].attack)
             + (
                 " "
                 * (
                     65
-                    - len(Trivia.data_strongest.name)
-                    - len(str(Trivia.data_strongest.attack))
+                    - len(type_strongest["Data"].name)
+                    - len(str(type_strongest["Data"].attack))
                 )
             )
             + "\n"
@@ -611,15 +777,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Vaccine: "
-            + Trivia.vaccine_strongest.name
+            + type_strongest["Vaccine"].name
             + ", "
-            + str(Trivia.vaccine_strongest.attack)
+            + str(type_strongest["Vaccine"].attack)
             + (
                 " "
                 * (
                     63
-                    - len(Trivia.vaccine_strongest.name)
-                    - len(str(Trivia.vaccine_strongest.attack))
+                    - len(type_strongest["Vaccine"].name)
+                    - len(str(type_strongest["Vaccine"].attack))
                 )
             )
             + "\n"
@@ -628,15 +794,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Virus: "
-            + Trivia.virus_strongest.name
+            + type_strongest["Virus"].name
             + ", "
-            + str(Trivia.virus_strongest.attack)
+            + str(type_strongest["Virus"].attack)
             + (
                 " "
                 * (
                     61
-                    - len(Trivia.virus_strongest.name)
-                    - len(str(Trivia.virus_strongest.attack))
+                    - len(type_strongest["Virus"].name)
+                    - len(str(type_strongest["Virus"].attack))
                 )
             )
             + "\n"
@@ -645,15 +811,15 @@ class Trivia():
             (" " * 4)
             + "> "
             + "Free: "
-            + Trivia.free_strongest.name
+            + type_strongest["Free"].name
             + ", "
-            + str(Trivia.free_strongest.attack)
+            + str(type_strongest["Free"].attack)
             + (
                 " "
                 * (
                     61
-                    - len(Trivia.free_strongest.name)
-                    - len(str(Trivia.free_strongest.attack))
+                    - len(type_strongest["Free"].name)
+                    - len(str(type_strongest["Free"].attack))
                 )
             )
             + "\n"
@@ -667,11 +833,11 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> "
-            + Trivia.lowest_atk_monster.name
+            + lowest_atk.name
             + ", on "
-            + Trivia.lowest_atk_monster.stage
+            + lowest_atk.stage
             + " stage, "
-            + Trivia.lowest_atk_monster.type
+            + lowest_atk.type
             + " type."
             + "\n"
         )
@@ -684,11 +850,11 @@ class Trivia():
         msg += (
             (" " * 4)
             + "> "
-            + Trivia.highest_atk_monster.name
+            + highest_atk.name
             + ", on "
-            + Trivia.highest_atk_monster.stage
+            + highest_atk.stage
             + " stage, "
-            + Trivia.highest_atk_monster.type
+            + highest_atk.type
             + " type."
             + "\n"
         )
@@ -705,6 +871,456 @@ class Trivia():
         data_saver(msg, "pokemon-trivia", id_number)
 
 
+class ActionLog:
+    """
+    This class writes each action chosen in the menu as one json line
+    at the end of the log file, e.g. the action, the inputs typed, the
+    files used and their sha256, the time it took and a summary of the
+    answers.
+
+    The log is only appended, each line in one write, so many menus can
+    log to the same file. When the file is bigger than max_bytes, or its
+    first line is older than max_age seconds, it is renamed with the
+    date and compressed with gzip, and a new file is started.
+
+    Parameters
+    ----------
+    path:
+        The log file.
+
+    max_bytes:
+        The size that rotates the log file.
+
+    max_age:
+        The seconds that rotate the log file.
+    """
+
+    def __init__(self, path: str = LOG_FILE, max_bytes: int = LOG_MAX_BYTES, max_age: float = LOG_MAX_AGE) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.session_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        # The inode of the log file and the time of its first line, read once for each file.
+        self.segment: Tuple[int, float] = (-1, 0.0)
+
+    def segment_started(self, status: os.stat_result) -> float:
+        """
+        This function returns when the current log file was started,
+        the time of its first line.
+        """
+        if self.segment[0] != status.st_ino:
+            started = status.st_mtime
+            try:
+                with open(self.path, "r", encoding="utf-8") as source_data:
+                    started = datetime.fromisoformat(json.loads(source_data.readline())["time"]).timestamp()
+            except (OSError, ValueError, KeyError, TypeError):
+                pass
+            self.segment = (status.st_ino, started)
+        return self.segment[1]
+
+    def expired(self, status: os.stat_result) -> bool:
+        """
+        This function tells if the current log file is older than
+        max_age. Another menu may have rotated it, and the new file got
+        the same inode, so the first line is read again before saying so.
+        """
+        if time.time() - self.segment_started(status) <= self.max_age:
+            return False
+        self.segment = (-1, 0.0)
+        return time.time() - self.segment_started(status) > self.max_age
+
+    def rotate(self) -> Optional[str]:
+        """
+        This function renames the log file with the current date, and
+        compresses it, the next line starts a new log file.
+
+        Returns
+        -------
+            The compressed file, None when another menu rotated it first.
+        """
+        root, extension = os.path.splitext(self.path)
+        rotated = f"{root}.{datetime.now().strftime('%Y%m%dT%H%M%S%f')}{extension}"
+        # The next log file can get the same inode, its first line must be read again.
+        self.segment = (-1, 0.0)
+        try:
+            os.rename(self.path, rotated)
+        except FileNotFoundError:
+            return None
+
+        with open(rotated, "rb") as source_data, gzip.open(f"{rotated}.gz", "wb", compresslevel=6) as target:
+            shutil.copyfileobj(source_data, target, 1024 * 1024)
+        os.remove(rotated)
+        return f"{rotated}.gz"
+
+    def write(self, event: Dict[str, Any]) -> None:
+        """
+        This function appends one event to the log, rotating the log
+        file first when it is too big or too old.
+
+        Parameters
+        ----------
+        event:
+            The event, with only json types.
+        """
+        line = (json.dumps(event, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+        try:
+            status = os.stat(self.path)
+        except FileNotFoundError:
+            status = None
+        if status is not None and status.st_size > 0 and (
+            status.st_size + len(line) > self.max_bytes or self.expired(status)
+        ):
+            self.rotate()
+
+        descriptor = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
+        try:
+            os.write(descriptor, line)
+        finally:
+            os.close(descriptor)
+
+    def record(
+        self,
+        action: str,
+        inputs: Dict[str, str],
+        files: Optional[Dict[str, Dict[str, Union[str, int]]]] = None,
+        elapsed: float = 0.0,
+        result: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        This function logs one action of the menu.
+
+        Parameters
+        ----------
+        action:
+            The option chosen, e.g. "trivia", or "invalid" when the
+            menu showed a warning.
+
+        inputs:
+            What the user typed for the action.
+
+        files:
+            The sha256 and size of each file used.
+
+        elapsed:
+            The seconds the answers took, without the time typing.
+
+        result:
+            The summary of the answers, or the warning shown.
+        """
+        self.write(
+            {
+                "time": datetime.now().isoformat(),
+                "session": self.session_id,
+                "action": action,
+                "inputs": inputs,
+                "files": files or {},
+                "elapsed_ms": round(elapsed * 1000, 3),
+                "result": result or {},
+            }
+        )
+
+
+def log_segments(path: str) -> List[str]:
+    """
+    This function returns the files of a log, the rotated ones from
+    the oldest, then the current one.
+
+    A crash during the rotation leaves the rotated file not compressed,
+    and maybe a part of its .gz, so the file not compressed is the one
+    returned for it.
+
+    Parameters
+    ----------
+    path:
+        The log file.
+
+    Returns
+    -------
+        The paths of the log files that exist.
+    """
+    root, extension = os.path.splitext(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    prefix = os.path.basename(root) + "."
+    names = set(os.listdir(directory))
+    rotated = sorted(
+        os.path.join(directory, name)
+        for name in names
+        if name.startswith(prefix)
+        and name != os.path.basename(path)
+        and (name.endswith(extension) or (name.endswith(f"{extension}.gz") and name[:-3] not in names))
+    )
+    return rotated + ([path] if os.path.exists(path) else [])
+
+
+def iter_log_events(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    This function reads the events of a log one line at a time, from
+    the compressed files to the current one, without keeping them.
+
+    A line that isn't json, e.g. cut by a crash, is skipped.
+
+    Parameters
+    ----------
+    path:
+        The log file.
+
+    Returns
+    -------
+        A generator of the events, from the oldest.
+    """
+    for segment in log_segments(path):
+        opener = gzip.open if segment.endswith(".gz") else open
+        with opener(segment, "rt", encoding="utf-8") as source_data:
+            for line in source_data:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(event, dict):
+                    yield event
+
+
+def session_report(events: Iterable[Dict[str, Any]], session_id: Optional[str] = None) -> str:
+    """
+    This function builds the final report of the actions logged, going
+    through the events once, so only the counters and the last answers
+    of each file are kept, not the log.
+
+    Parameters
+    ----------
+    events:
+        The events of the log, it can be a generator.
+
+    session_id:
+        When informed, only the actions of this menu session.
+
+    Returns
+    -------
+        The report message.
+    """
+    break_line: str = (" " * 80) + "\n"
+    sessions: Dict[str, int] = {}
+    actions: Dict[str, List[float]] = {}
+    files: Dict[str, Dict[str, Any]] = {}
+    warnings = 0
+    first_time = last_time = "-"
+
+    for event in events:
+        if session_id is not None and event.get("session") != session_id:
+            continue
+        if first_time == "-":
+            first_time = str(event.get("time", "-"))
+        last_time = str(event.get("time", "-"))
+        sessions[str(event.get("session"))] = sessions.get(str(event.get("session")), 0) + 1
+
+        action = str(event.get("action"))
+        totals = actions.setdefault(action, [0, 0.0])
+        totals[0] += 1
+        totals[1] += float(event.get("elapsed_ms", 0.0))
+        if action == "invalid":
+            warnings += 1
+
+        for filepath, identity in (event.get("files") or {}).items():
+            used = files.setdefault(filepath, {"uses": 0, "sha256": None, "versions": 0, "result": {}})
+            used["uses"] += 1
+            if identity.get("sha256") != used["sha256"]:
+                used["sha256"] = identity.get("sha256")
+                used["versions"] += 1
+            if event.get("result"):
+                used["result"] = event["result"]
+
+    msg = break_line
+    msg += ("reported generated on: " + datetime.now().isoformat()).ljust(80) + "\n"
+    msg += break_line
+    msg += " " + ("=" * 31) + " SESSION REPORT " + ("=" * 31) + " \n"
+    msg += break_line
+    msg += f"Sessions: {len(sessions)}, actions: {sum(sessions.values())}, warnings: {warnings}".ljust(80) + "\n"
+    msg += f"From {first_time} to {last_time}".ljust(80) + "\n"
+    msg += break_line
+    msg += "Actions:".ljust(80) + "\n"
+    for action, (count, elapsed_ms) in sorted(actions.items()):
+        msg += f"    > {action:<10} {count:>6} times, {elapsed_ms / count:>10.3f} ms on average".ljust(80) + "\n"
+    msg += break_line
+    msg += "Files:".ljust(80) + "\n"
+    for filepath, used in sorted(files.items()):
+        msg += f"    > {os.path.basename(filepath)}".ljust(80) + "\n"
+        msg += f"      used {used['uses']} times, sha256 {str(used['sha256'])[:16]}".ljust(80) + "\n"
+        if used["versions"] > 1:
+            msg += f"      WARNING: the file changed {used['versions'] - 1} times during the log".ljust(80) + "\n"
+        result = used["result"]
+        if "monsters" in result:
+            msg += f"      {result['monsters']} monsters".ljust(80) + "\n"
+            msg += f"      the strongest is {result.get('highest_attack')}".ljust(80) + "\n"
+            msg += f"      the highest HP is {result.get('highest_hp')}".ljust(80) + "\n"
+            msg += f"      the fastest is {result.get('fastest')}".ljust(80) + "\n"
+    msg += break_line
+    msg += "Thanks for using this Dex!" + (" " * 54) + "\n"
+    msg += break_line
+    return msg
+
+
+class Session:
+    """
+    This class keeps the rosters read and the trivia computed while
+    the menu runs, so choosing the same file again answers at once,
+    without reading it again.
+
+    Each file is known by its path, and read again only when its size
+    or modification time changed. Only the SESSION_MAX_FILES files used
+    last are kept.
+
+    Parameters
+    ----------
+    data_dir:
+        The directory with the pokemon and digimon folders.
+
+    action_log:
+        Where each action of the menu is logged, nothing is logged
+        when it isn't informed.
+    """
+
+    def __init__(self, data_dir: str, action_log: Optional[ActionLog] = None) -> None:
+        self.data_dir = data_dir
+        self.action_log = action_log
+        self.rosters: Dict[str, Tuple[Tuple[int, int], List[Monster]]] = {}
+        self.trivias: Dict[str, Tuple[Tuple[int, int], Trivia]] = {}
+        self.digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+    def monster_path(self, monster_category: str, file_format: str, monster_file: str) -> str:
+        """
+        This function returns the path of a file in the data directory.
+        """
+        return os.path.join(self.data_dir, monster_category, file_format, monster_file)
+
+    def cached(self, cache: Dict[str, Tuple[Tuple[int, int], Any]], key: str, identity: Tuple[int, int]) -> Any:
+        """
+        This function returns what is kept for a file, None when it
+        isn't kept or the file changed. It becomes the last one used.
+        """
+        entry = cache.pop(key, None)
+        if entry is None or entry[0] != identity:
+            return None
+        cache[key] = entry
+        return entry[1]
+
+    def remember(
+        self, cache: Dict[str, Tuple[Tuple[int, int], Any]], key: str, identity: Tuple[int, int], value: Any
+    ) -> Any:
+        """
+        This function keeps the value of a file, dropping the least
+        recently used when there are more than SESSION_MAX_FILES.
+        """
+        cache.pop(key, None)
+        cache[key] = (identity, value)
+        while len(cache) > SESSION_MAX_FILES:
+            del cache[next(iter(cache))]
+        return value
+
+    def roster(self, filepath: str) -> List[Monster]:
+        """
+        This function returns the monsters of a file, reading it only
+        the first time or when it changed.
+
+        Parameters
+        ----------
+        filepath:
+            The file path, it can be the full path or relative path.
+
+        Returns
+        -------
+            The list of Monster.
+        """
+        status = os.stat(filepath)
+        identity = (status.st_size, status.st_mtime_ns)
+        key = os.path.abspath(filepath)
+        monsters = self.cached(self.rosters, key, identity)
+        if monsters is None:
+            monsters = self.remember(self.rosters, key, identity, read_file(filepath))
+        return monsters
+
+    def trivia(self, filepath: str) -> Trivia:
+        """
+        This function returns the trivia of a file, computing it only
+        the first time or when the file changed.
+
+        Parameters
+        ----------
+        filepath:
+            The file path, it can be the full path or relative path.
+
+        Returns
+        -------
+            The trivia of the file monsters.
+        """
+        monsters = self.roster(filepath)
+        key = os.path.abspath(filepath)
+        identity = self.rosters[key][0]
+        trivia = self.cached(self.trivias, key, identity)
+        if trivia is None:
+            trivia = self.remember(self.trivias, key, identity, Trivia(monsters))
+        return trivia
+
+    def file_identity(self, filepath: str) -> Dict[str, Union[str, int]]:
+        """
+        This function returns the sha256 and size of a file, hashing it
+        only the first time or when it changed.
+
+        Parameters
+        ----------
+        filepath:
+            The file path, it can be the full path or relative path.
+
+        Returns
+        -------
+            The sha256 and the size of the file.
+        """
+        status = os.stat(filepath)
+        identity = (status.st_size, status.st_mtime_ns)
+        key = os.path.abspath(filepath)
+        sha256 = self.cached(self.digests, key, identity)
+        if sha256 is None:
+            digest = hashlib.sha256()
+            with open(filepath, "rb") as source_data:
+                for chunk in iter(lambda: source_data.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            sha256 = self.remember(self.digests, key, identity, digest.hexdigest())
+        return {"sha256": sha256, "size": identity[0]}
+
+    def log_action(
+        self,
+        action: str,
+        inputs: Dict[str, str],
+        filepaths: Iterable[str] = (),
+        elapsed: float = 0.0,
+        result: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        This function logs one action of the menu in the action log,
+        with the identity of each file used.
+
+        Parameters
+        ----------
+        action:
+            The option chosen, or "invalid" when a warning was shown.
+
+        inputs:
+            What the user typed for the action.
+
+        filepaths:
+            The files used by the action.
+
+        elapsed:
+            The seconds the answers took.
+
+        result:
+            The summary of the answers, or the warning shown.
+        """
+        if self.action_log is None:
+            return
+        files = {os.path.abspath(filepath): self.file_identity(filepath) for filepath in filepaths}
+        self.action_log.record(action, inputs, files, elapsed, result)
+
+
 def data_saver(
     data_to_be_saved: str,
     monster_type: str,
@@ -754,23 +1370,130 @@ def data_saver(
                 target.write(data_to_be_saved)
                 print("New entry added to the file successfully!")
         else:
+            # Nothing is saved, the menu is shown again instead of closing the session.
             print(user_choice)
             print(f"WARNING: Invalid Input.\n{client_usage()}")
-            quit()
+            return
 
     else:
         with open(f"{id_number}_{monster_type}.txt", "w") as target:
             target.write(data_to_be_saved)
 
 
-def read_file(filepath: str) -> List[Dict[str, Union[str, int]]]:
+def monster_builder(
+    category: str, keys: Optional[Dict[str, Union[str, int]]] = None, get: Callable[[Any, Any], str] = getitem
+) -> Callable[[Any], Monster]:
+    """
+    This function returns a function that creates a Monster straight
+    from a row read from a file, e.g. a csv row or a xml element,
+    without copying the row to a dict first.
+
+    Parameters
+    ----------
+    category:
+        "Pokemon" or "Digimon".
+
+    keys:
+        Where each key of MONSTER_KEYS is found in the row, when it
+        isn't the key itself, e.g. the csv column position.
+
+    get:
+        The function that reads one key of the row, the row[key]
+        by default.
+
+    Returns
+    -------
+        The function that creates the Monster of one row.
+    """
+    keys = keys or {}
+    fields = [None if key is None else keys.get(key, key) for key in MONSTER_KEYS[category]]
+
+    def build_monster(row: Any) -> Monster:
+        values = ["" if field is None else get(row, field) for field in fields]
+        # The current hp starts as the monster hp.
+        return Monster(category, *values, values[7])
+
+    return build_monster
+
+
+def monsters_from_dicts(data_read: Iterable[Dict[str, Union[str, int]]]) -> List[Monster]:
+    """
+    This function creates the monsters of the json and yaml files,
+    the parsers already return one dict per monster.
+
+    Parameters
+    ----------
+    data_read:
+        The monsters read from the file.
+
+    Returns
+    -------
+        The list of Monster.
+    """
+    build_pokemon = monster_builder("Pokemon")
+    build_digimon = monster_builder("Digimon")
+    monster_list = []
+    for value in data_read:
+        if "Legendary" in value:
+            monster_list.append(build_pokemon(value))
+        elif "Stage" in value:
+            monster_list.append(build_digimon(value))
+    return monster_list
+
+
+def xml_text(element: ElementTree.Element, tag: str) -> str:
+    """
+    This function returns the text of a xml tag inside the element,
+    an empty string when the tag is empty.
+    """
+    return (element.findtext(tag) or "").strip()
+
+
+def monsters_from_xml(source_data) -> List[Monster]:
+    """
+    This function creates the monsters of a xml file, reading each
+    <root> child, e.g. <id0> or <row>, with a pull parser and
+    dropping it once its Monster is created.
+
+    Parameters
+    ----------
+    source_data:
+        The opened xml file.
+
+    Returns
+    -------
+        The list of Monster.
+    """
+    build_pokemon = monster_builder("Pokemon", XML_TAGS, xml_text)
+    build_digimon = monster_builder("Digimon", XML_TAGS, xml_text)
+    monster_list = []
+    depth = 0
+    for event, element in ElementTree.iterparse(source_data, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                root = element
+            continue
+
+        depth -= 1
+        if depth == 1:
+            if element.find("Legendary") is not None:
+                monster_list.append(build_pokemon(element))
+            elif element.find("Stage") is not None:
+                monster_list.append(build_digimon(element))
+            root.clear()
+    return monster_list
+
+
+def parse_file(filepath: str) -> List[Monster]:
     """
     This function reads a file and acts according to its format
     it will fit in one of the conditionals.
 
     If its a .json it uses load.
-    If its a .csv it uses DictReader.
-    If its a .xml it uses xmltodict.
+    If its a .csv it uses reader, each row becomes a Monster by
+    the column positions of the header.
+    If its a .xml it uses iterparse.
     If its a .yaml it uses safe load.
 
     Parameters
@@ -780,57 +1503,72 @@ def read_file(filepath: str) -> List[Dict[str, Union[str, int]]]:
 
     Returns
     -------
-    data_read:
-        The file received will be returned in python data types.
+    monster_list:
+        The monsters of the file, as Monster instances.
+
+    Raises
+    ------
+    ValueError:
+        When the file format is not supported.
     """
     with open((filepath), "r") as source_data:
-        data_read = []
-
         if ".json" in filepath:
-            data_read = json.load(source_data)
+            return monsters_from_dicts(json.load(source_data))
 
         elif ".csv" in filepath:
-            csv_file = csv.DictReader(source_data, delimiter=",")
-            data_read = [row for row in csv_file]
+            rows = csv.reader(source_data, delimiter=",")
+            header = next(rows, [])
+            columns = {key: column for column, key in enumerate(header)}
+            if "Legendary" in columns:
+                build_monster = monster_builder("Pokemon", columns)
+            elif "Stage" in columns:
+                build_monster = monster_builder("Digimon", columns)
+            else:
+                return []
+            return [build_monster(row) for row in rows if row]
 
         elif ".xml" in filepath:
-            xml = source_data.read()
-            xml_file = xmltodict.parse(xml)
-            xml_dict = {key: value for key, value in xml_file["root"].items()}
-            for key, value in xml_dict.items():
-                data_read += [
-                    {key_list: value_list for key_list, value_list in value.items()}
-                ]
+            return monsters_from_xml(source_data)
 
         elif ".yaml" in filepath:
             yaml_file = source_data.read()
-            data_read = yaml.safe_load(yaml_file)
+            return monsters_from_dicts(yaml.safe_load(yaml_file) or [])
 
         else:
-            print(f"Error: File format not supported!\n{client_usage()}")
-            quit()
+            raise ValueError("File format not supported!")
 
-        monster_list = []
-        if ".xml" in filepath:
-            for key,value in enumerate(data_read):
-                if "Legendary" in value:
-                    monster_list.append(Monster("Pokemon", value["Id"],value["Name"],
-                    "", value["Type1"], value["Type2"],value["Generation"], value["Legendary"],
-                    value["HP"], value["Attack"], value["Defense"], value["Speed"], value["HP"]))
-                elif "Stage" in value:
-                    monster_list.append(Monster("Digimon", value["Id"], value["Name"],
-                    value["Stage"], value["Type"], "", "", "",
-                    value["HP"], value["Atk"],value["Def"], value["Spd"], value["HP"]))
-        else:
-            for key,value in enumerate(data_read):
-                if "Legendary" in value:
-                    monster_list.append(Monster("Pokemon", value["Id"], value["Name"],
-                    "", value["Type 1"], value["Type 2"], value["Generation"], value["Legendary"],
-                    value["HP"], value["Attack"], value["Defense"], value["Speed"], value["HP"]))
-                elif "Stage" in value:
-                    monster_list.append(Monster("Digimon", value["Id"], value["Name"],
-                    value["Stage"], value["Type"], "", "", "",
-                    value["HP"], value["Atk"], value["Def"], value["Spd"], value["HP"]))
+
+def read_file(filepath: str) -> List[Monster]:
+    """
+    This function reads the monsters of a file with parse_file, any
+    error of a file that can't be parsed, or of a monster without
+    one of its keys, is raised as a ValueError, so the menu shows the
+    warning and goes on.
+
+    Parameters
+    ----------
+    filepath:
+        The file path, it can be the full path or relative path.
+
+    Returns
+    -------
+    monster_list:
+        The monsters of the file, as Monster instances.
+
+    Raises
+    ------
+    ValueError:
+        When the file format is not supported, the file can't be
+        parsed, or it has no monsters.
+    """
+    try:
+        monster_list = parse_file(filepath)
+    except (
+        csv.Error, ElementTree.ParseError, yaml.YAMLError, KeyError, IndexError, TypeError, AttributeError
+    ) as error:
+        raise ValueError(f"File {os.path.basename(filepath)} can't be read: {error}") from error
+    if not monster_list:
+        raise ValueError(f"File {os.path.basename(filepath)} has no monsters.")
     return monster_list
 
 
@@ -868,6 +1606,19 @@ def client_usage() -> str:
     client_usage_msg: str = """
     CLI usage examples:
 
+    python interface.py [--data-dir DIR] [--log FILE]
+    The data directory has the pokemon and digimon folders, the
+    DEX_DATA_DIR environment variable also sets it.
+
+    Each action chosen is logged as a json line in dex-actions.jsonl,
+    or --log FILE, or DEX_LOG_FILE. The log is compressed and a new
+    one is started when it has more than DEX_LOG_MAX_BYTES (1 MiB) or
+    is older than DEX_LOG_MAX_AGE seconds (one day).
+
+    python interface.py --report [--log FILE] [--session ID] [--id ID]
+    Shows and saves the final report of the actions logged, of every
+    session or only of one, reading the compressed logs too.
+
     1 - HELP
     To use Help type one of the following:
     1, H, Help
@@ -893,185 +1644,181 @@ def client_usage() -> str:
     return client_usage_msg
 
 
-def main() -> None:
-
-    if sys.argv[0] == 'interface.py':
+def menu_action(session: Session) -> bool:
+    """
+    This function shows the menu once and answers the chosen option.
 
-        interface = ("Hello, Welcome to the Dex!" + "\n")
-        interface += ("\n"+"OPTIONS" + "\n")
-        interface += ("\n" + "1 - Help" + "\n")
-        interface += ("2 - Trivia" + "\n")
-        interface += ("3 - Info" + "\n")
-        interface += ("4 - Battle" + "\n")
-        interface += ("5 - Exit" + "\n\n")
-        print(interface)
-        main_menu_choice = input("Please insert the chosen option: ")
+    Parameters
+    ----------
+    session:
+        The rosters and trivia already read in this run.
 
-        if main_menu_choice == "1" or main_menu_choice.lower() == "h" or main_menu_choice.lower() == "help":
-            print(client_helper())
-            quit()
-        elif main_menu_choice not in ["1", "2", "3", "4", "5", "help", "trivia", "info", "battle",
-                                     "exit", "h", "t", "i", "b", "e"]:
-            print(f"WARNING: This command does not exist.\n{client_usage()}")
-            quit()
+    Returns
+    -------
+        False when the user chose to exit, True to show the menu again.
+    """
+    interface = ("Hello, Welcome to the Dex!" + "\n")
+    interface += ("\n"+"OPTIONS" + "\n")
+    interface += ("\n" + "1 - Help" + "\n")
+    interface += ("2 - Trivia" + "\n")
+    interface += ("3 - Info" + "\n")
+    interface += ("4 - Battle" + "\n")
+    interface += ("5 - Exit" + "\n\n")
+    print(interface)
+    main_menu_choice = input("Please insert the chosen option: ")
+    inputs = {"option": main_menu_choice}
+
+    if main_menu_choice == "1" or main_menu_choice.lower() == "h" or main_menu_choice.lower() == "help":
+        print(client_helper())
+        session.log_action("help", inputs)
+        return True
+    elif main_menu_choice == "5" or main_menu_choice.lower() == "e" or main_menu_choice.lower() == "exit":
+        session.log_action("exit", inputs)
+        return False
+    elif main_menu_choice.lower() not in ["1", "2", "3", "4", "5", "help", "trivia", "info", "battle",
+                                          "exit", "h", "t", "i", "b", "e"]:
+        print(f"WARNING: This command does not exist.\n{client_usage()}")
+        session.log_action("invalid", inputs, result={"warning": "This command does not exist."})
+        return True
+
+    if main_menu_choice == "2" or main_menu_choice.lower() == "t" or main_menu_choice.lower() == "trivia":
+        action = "trivia"
+    elif main_menu_choice == "3" or main_menu_choice.lower() == "i" or main_menu_choice.lower() == "info":
+        action = "info"
+    else:
+        action = "battle"
 
-        monster_menu = "\n"
-        monster_menu += ("Which category of monster you'll choose?" + "\n")
-        monster_menu += ("1 - Pokemon" + "\n")
-        monster_menu += ("2 - Digimon" + "\n")
-        print(monster_menu)
-        monster_category = input("Choose your monster category: ")
+    monster_menu = "\n"
+    monster_menu += ("Which category of monster you'll choose?" + "\n")
+    monster_menu += ("1 - Pokemon" + "\n")
+    monster_menu += ("2 - Digimon" + "\n")
+    print(monster_menu)
+    monster_category = input("Choose your monster category: ")
+    inputs["category"] = monster_category
 
-        if monster_category == "1" or monster_category.lower() == "p" or monster_category.lower() == "pokemon":
-            monster_category = 'pokemon'
+    if monster_category == "1" or monster_category.lower() == "p" or monster_category.lower() == "pokemon":
+        monster_category = 'pokemon'
 
-        elif monster_category == "2" or monster_category.lower() == "d" or monster_category.lower() == "digimon":
-            monster_category = 'digimon'
+    elif monster_category == "2" or monster_category.lower() == "d" or monster_category.lower() == "digimon":
+        monster_category = 'digimon'
 
-        else:
-            print(f"WARNING: This command does not exist.\n{client_usage()}")
-            quit()
+    else:
+        print(f"WARNING: This command does not exist.\n{client_usage()}")
+        session.log_action("invalid", inputs, result={"warning": "This command does not exist."})
+        return True
 
-        monster_file = input("Type the archive name:")
+    monster_file = input("Type the archive name:")
+    inputs["file"] = monster_file
 
+    if "pokemon" in monster_file:
+        if monster_category == "digimon":
+            print(f"WARNING: Different type of monsters.\n{client_usage()}")
+            session.log_action("invalid", inputs, result={"warning": "Different type of monsters."})
+            return True
+    elif "digimon" in monster_file:
+        if monster_category == "pokemon":
+            print(f"WARNING: Different type of monsters.\n{client_usage()}")
+            session.log_action("invalid", inputs, result={"warning": "Different type of monsters."})
+            return True
+    else:
+        print(f"WARNING: Different type of monsters.\n{client_usage()}")
+        session.log_action("invalid", inputs, result={"warning": "Different type of monsters."})
+        return True
+
+    if "json" in monster_file:
+        file_format = "json"
+    elif "xml" in monster_file:
+        file_format = "xml"
+    elif "csv" in monster_file:
+        file_format = "csv"
+    elif "yaml" in monster_file:
+        file_format = "yaml"
+    else:
+        print(f"Error: File format not supported!\n{client_usage()}")
+        session.log_action("invalid", inputs, result={"warning": "File format not supported!"})
+        return True
+
+    monster_path = session.monster_path(monster_category, file_format, monster_file)
+
+    if not os.path.exists(monster_path):
+        print(f"WARNING: File {monster_file} does not exist.")
+        session.log_action("invalid", inputs, result={"warning": f"File {monster_file} does not exist."})
+        return True
+
+    if action == "trivia":
+
+        start = time.perf_counter()
+        try:
+            trivia = session.trivia(monster_path)
+        except ValueError as error:
+            print(f"Error: {error}\n{client_usage()}")
+            session.log_action("invalid", inputs, [monster_path], result={"warning": str(error)})
+            return True
+        elapsed = time.perf_counter() - start
+        session.log_action(action, inputs, [monster_path], elapsed, trivia.summary())
         if "pokemon" in monster_file:
-            if monster_category == "digimon":
-                print(f"WARNING: Different type of monsters.\n{client_usage()}")
-                quit()
+            trivia.show_pokemon_trivia()
+
         elif "digimon" in monster_file:
-            if monster_category == "pokemon":
-                print(f"WARNING: Different type of monsters.\n{client_usage()}")
-                quit()
-        else:
-            print(f"WARNING: Different type of monsters.\n{client_usage()}")
-            quit()
+            trivia.show_digimon_trivia()
 
-        path = "/home/samara/Projects/dex_challenge/data"
+    elif action == "info":
+        print("test info")
+        session.log_action(action, inputs, [monster_path])
 
-        if "json" in monster_file:
-            file_format = "json"
-        elif "xml" in monster_file:
-            file_format = "xml"
-        elif "csv" in monster_file:
-            file_format = "csv"
-        elif "yaml" in monster_file:
-            file_format = "yaml"
-        else:
-            print(f"Error: File format not supported!\n{client_usage()}")
-            quit()
+    elif action == "battle":
+        print("test battle")
+        session.log_action(action, inputs, [monster_path])
 
-        monster_path = f"{path}/{monster_category}/{file_format}/{monster_file}"
+    return True
 
-        if os.path.exists(monster_path):
-            pass
 
-        else:
-            print(f"WARNING: File {monster_file} does not exist.")
+def main() -> None:
+
+    if os.path.basename(sys.argv[0]) == 'interface.py':
+
+        data_dir = DATA_DIR
+        log_file = LOG_FILE
+        report = False
+        session_id = None
+        id_number = "0"
+        arguments = iter(sys.argv[1:])
+        for argument in arguments:
+            if argument == "--report":
+                report = True
+                continue
+            value = next(arguments, None)
+            if argument not in ("--data-dir", "--log", "--session", "--id") or value is None:
+                print(f"WARNING! Incorrect amount of arguments.\n{client_usage()}")
+                quit()
+            if argument == "--data-dir":
+                data_dir = value
+            elif argument == "--log":
+                log_file = value
+            elif argument == "--session":
+                session_id = value
+            else:
+                id_number = value
+
+        if report:
+            # The log is read one line at a time, it can be bigger than the memory.
+            msg = session_report(iter_log_events(log_file), session_id)
+            print(msg)
+            data_saver(msg, "session-report", id_number)
             quit()
 
-        if main_menu_choice == "2" or main_menu_choice.lower() == "t" or main_menu_choice.lower() == "trivia":
-
-            if "pokemon" in monster_file:
-
-                data_arch1 = read_file(monster_path)
-
-                Trivia.monster_sum = str(len(data_arch1))
-                monster_order = sorted(data_arch1, key=Trivia.get_hp, reverse=True)
-                Trivia.highest_hp_monster = monster_order[0]
-                monster_order = sorted(data_arch1, key=Trivia.get_atk, reverse=True)
-                Trivia.highest_atk_monster = monster_order[0]
-                monster_order = sorted(data_arch1, key=Trivia.get_def, reverse=True)
-                Trivia.highest_def_monster = monster_order[0]
-                monster_order = sorted(data_arch1, key=Trivia.get_spd, reverse=True)
-                Trivia.highest_spd_monster = monster_order[0]
-
-                Trivia.show_pokemon_trivia()
-
-            elif "digimon" in monster_file:
-
-                data_arch1 = read_file(monster_path)
-
-                Trivia.monster_sum = str(len(data_arch1))
-                monster_order = sorted(data_arch1, key=Trivia.get_atk, reverse=True)
-                Trivia.highest_atk_monster = monster_order[0]
-                monster_order = sorted(data_arch1, key=Trivia.get_atk)
-                Trivia.lowest_atk_monster = monster_order[0]
-                monster_order = sorted(data_arch1, key=Trivia.get_def, reverse=True)
-
-                for idx in data_arch1:
-                    if idx.stage not in Trivia.digimon_stages:
-                        Trivia.digimon_stages.append(idx.stage)
-                        
-                    if idx.type not in Trivia.digimon_types:
-                        Trivia.digimon_types.append(idx.type)
-
-                    if idx.stage == "In-Training":
-                        Trivia.training_dict.append(idx)
-                    elif idx.stage == "Baby":
-                        Trivia.baby_dict.append(idx)
-                    elif idx.stage == "Rookie":
-                        Trivia.rookie_dict.append(idx)
-                    elif idx.stage == "Champion":
-                        Trivia.champion_dict.append(idx)
-                    elif idx.stage == "Ultimate":
-                        Trivia.ultimate_dict.append(idx)
-                    elif idx.stage == "Mega":
-                        Trivia.mega_dict.append(idx)
-                    elif idx.stage == "Ultra":
-                        Trivia.ultra_dict.append(idx)
-                    elif idx.stage == "Armor":
-                        Trivia.armor_dict.append(idx)
-                    elif idx.stage == "None":
-                        Trivia.none_dict.append(idx)
-                        
-                    if idx.type == "Data":
-                        Trivia.data_dict.append(idx)
-                    elif idx.type == "Vaccine":
-                        Trivia.vaccine_dict.append(idx)
-                    elif idx.type == "Virus":
-                        Trivia.virus_dict.append(idx)
-                    elif idx.type == "Free":
-                        Trivia.free_dict.append(idx)
-
-                monster_order = sorted(Trivia.training_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.training_strongest = monster_order[0]
-                monster_order = sorted(Trivia.baby_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.baby_strongest = monster_order[0]
-                monster_order = sorted(Trivia.rookie_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.rookie_strongest = monster_order[0]
-                monster_order = sorted(Trivia.champion_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.champion_strongest = monster_order[0]
-                monster_order = sorted(Trivia.ultimate_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.ultimate_strongest = monster_order[0]
-                monster_order = sorted(Trivia.mega_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.mega_strongest = monster_order[0]
-                monster_order = sorted(Trivia.ultra_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.ultra_strongest = monster_order[0]
-                monster_order = sorted(Trivia.armor_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.armor_strongest = monster_order[0]
-                monster_order = sorted(Trivia.none_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.none_strongest = monster_order[0]
-                
-                monster_order = sorted(Trivia.data_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.data_strongest = monster_order[0]
-                monster_order = sorted(Trivia.vaccine_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.vaccine_strongest = monster_order[0]
-                monster_order = sorted(Trivia.virus_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.virus_strongest = monster_order[0]
-                monster_order = sorted(Trivia.free_dict, key=Trivia.get_atk, reverse=True)
-                Trivia.free_strongest = monster_order[0]
-
-                Trivia.show_digimon_trivia()
-
-        elif main_menu_choice == "3" or main_menu_choice.lower() == "i" or main_menu_choice.lower() == "info":
-            print("test info")
-
-        elif main_menu_choice == "4" or main_menu_choice.lower() == "b" or main_menu_choice.lower() == "battle":
-            print("test battle")
-
-        elif main_menu_choice == "5" or main_menu_choice.lower() == "e" or main_menu_choice.lower() == "exit":
+        if not os.path.isdir(data_dir):
+            print(f"WARNING: Directory {data_dir} does not exist.")
             quit()
 
+        session = Session(data_dir, ActionLog(log_file))
+        try:
+            while menu_action(session):
+                pass
+        except EOFError:
+            # Ctrl+D closes the menu, like the Exit option.
+            print()
+
 
 if __name__ == "__main__":
     main()
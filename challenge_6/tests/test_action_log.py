@@ -0,0 +1,168 @@
+import glob
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timedelta
+
+import interface
+
+
+def event(action, age=0.0):
+    """
+    This function returns a log event written age seconds ago.
+    """
+    return {"time": (datetime.now() - timedelta(seconds=age)).isoformat(), "action": action}
+
+
+def read_lines(path):
+    """
+    This function returns the actions of a log file.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as source_data:
+        return [json.loads(line)["action"] for line in source_data]
+
+
+def test_lines_are_appended(tmp_path):
+    log = interface.ActionLog(str(tmp_path / "actions.jsonl"))
+    for action in ("trivia", "info", "battle"):
+        log.write(event(action))
+    assert read_lines(log.path) == ["trivia", "info", "battle"]
+    assert not glob.glob(str(tmp_path / "actions.*.gz"))
+
+
+def test_rotates_by_size(tmp_path):
+    log = interface.ActionLog(str(tmp_path / "actions.jsonl"), max_bytes=200)
+    for idx in range(10):
+        log.write(event(f"action-{idx}"))
+    rotated = sorted(glob.glob(str(tmp_path / "actions.*.gz")))
+    assert rotated
+    actions = [action for path in rotated for action in read_lines(path)] + read_lines(log.path)
+    assert actions == [f"action-{idx}" for idx in range(10)]
+
+
+def test_next_write_after_age_rotation_is_appended(tmp_path):
+    log = interface.ActionLog(str(tmp_path / "actions.jsonl"), max_age=60)
+    log.write(event("old", age=120))
+    log.write(event("first"))
+    assert len(glob.glob(str(tmp_path / "actions.*.gz"))) == 1
+    # A new file that got the inode of the rotated one must not look as old as it.
+    log.segment = (os.stat(log.path).st_ino, time.time() - 120)
+    log.write(event("second"))
+    log.write(event("third"))
+    assert len(glob.glob(str(tmp_path / "actions.*.gz"))) == 1
+    assert read_lines(log.path) == ["first", "second", "third"]
+
+
+def test_rotation_by_another_menu(tmp_path):
+    path = str(tmp_path / "actions.jsonl")
+    log = interface.ActionLog(path, max_age=60)
+    other = interface.ActionLog(path, max_age=60)
+    log.write(event("old", age=120))
+    other.write(event("first"))
+    log.write(event("second"))
+    assert len(glob.glob(str(tmp_path / "actions.*.gz"))) == 1
+    assert read_lines(path) == ["first", "second"]
+
+
+def session_event(session, action, filepath="pokemons.json", sha256="a" * 64, result=None):
+    """
+    This function returns an event of a menu session, using one file.
+    """
+    return {
+        "time": datetime.now().isoformat(),
+        "session": session,
+        "action": action,
+        "files": {filepath: {"sha256": sha256, "size": 10}},
+        "elapsed_ms": 2.0,
+        "result": result or {},
+    }
+
+
+def write_segment(path, events, compressed=True):
+    """
+    This function writes a rotated log file with the events.
+    """
+    lines = "".join(json.dumps(event) + "\n" for event in events)
+    if compressed:
+        with gzip.open(path, "wt", encoding="utf-8") as target:
+            target.write(lines)
+    else:
+        with open(path, "w", encoding="utf-8") as target:
+            target.write(lines)
+
+
+def test_segments_from_the_oldest(tmp_path):
+    path = str(tmp_path / "actions.jsonl")
+    write_segment(str(tmp_path / "actions.20200101T000000000000.jsonl.gz"), [session_event("s1", "trivia")])
+    # A crash between the rename and the compression leaves the rotated file as it was, and maybe a cut .gz.
+    write_segment(str(tmp_path / "actions.20200102T000000000000.jsonl"), [session_event("s1", "info")], False)
+    write_segment(str(tmp_path / "actions.20200103T000000000000.jsonl"), [session_event("s2", "battle")], False)
+    (tmp_path / "actions.20200103T000000000000.jsonl.gz").write_bytes(b"\x1f\x8b")
+    (tmp_path / "other.20200101T000000000000.jsonl.gz").write_bytes(b"")
+    with open(path, "w", encoding="utf-8") as target:
+        target.write(json.dumps(session_event("s2", "trivia")) + "\n")
+
+    assert interface.log_segments(path) == [
+        str(tmp_path / "actions.20200101T000000000000.jsonl.gz"),
+        str(tmp_path / "actions.20200102T000000000000.jsonl"),
+        str(tmp_path / "actions.20200103T000000000000.jsonl"),
+        path,
+    ]
+    assert [event["action"] for event in interface.iter_log_events(path)] == ["trivia", "info", "battle", "trivia"]
+
+
+def test_torn_line_is_skipped(tmp_path):
+    path = str(tmp_path / "actions.jsonl")
+    with open(path, "w", encoding="utf-8") as target:
+        target.write(json.dumps(session_event("s1", "trivia")) + "\n")
+        target.write(json.dumps(session_event("s1", "info"))[:25] + "\n")
+        target.write("[1, 2]\n")
+        target.write(json.dumps(session_event("s1", "battle")) + "\n")
+    assert [event["action"] for event in interface.iter_log_events(path)] == ["trivia", "battle"]
+
+
+def test_report_of_many_sessions(tmp_path):
+    path = str(tmp_path / "actions.jsonl")
+    result = {"monsters": 3, "highest_attack": "Mewtwo", "highest_hp": "Blissey", "fastest": "Ninjask"}
+    write_segment(
+        str(tmp_path / "actions.20200101T000000000000.jsonl.gz"),
+        [session_event("s1", "trivia", result=result), session_event("s1", "invalid", filepath="x.json")],
+    )
+    log = interface.ActionLog(path)
+    log.write(session_event("s2", "trivia", sha256="b" * 64))
+    log.write(session_event("s2", "info", filepath="digimons.json"))
+
+    msg = interface.session_report(interface.iter_log_events(path))
+    assert "Sessions: 2, actions: 4, warnings: 1" in msg
+    assert "> trivia          2 times" in msg
+    assert "WARNING: the file changed 1 times during the log" in msg
+    assert "the strongest is Mewtwo" in msg
+    assert {len(line) for line in msg.splitlines()} == {80}
+
+    msg = interface.session_report(interface.iter_log_events(path), "s2")
+    assert "Sessions: 1, actions: 2, warnings: 0" in msg
+    assert "> pokemons.json" in msg and "> digimons.json" in msg and "> x.json" not in msg
+    assert "WARNING" not in msg
+
+
+def test_report_option(tmp_path, monkeypatch, capsys):
+    path = str(tmp_path / "actions.jsonl")
+    write_segment(str(tmp_path / "actions.20200101T000000000000.jsonl"), [session_event("s1", "trivia")], False)
+    write_segment(path, [session_event("s2", "trivia"), session_event("s2", "battle")], False)
+    monkeypatch.setattr("sys.argv", ["interface.py", "--report", "--log", path, "--session", "s2", "--id", "7"])
+    try:
+        interface.main()
+    except SystemExit:
+        pass
+    assert "Sessions: 1, actions: 2, warnings: 0" in capsys.readouterr().out
+    with open("7_session-report.txt", encoding="utf-8") as report:
+        assert "> battle          1 times" in report.read()
+
+    monkeypatch.setattr("sys.argv", ["interface.py", "--report", "--log", path, "--id", "8"])
+    try:
+        interface.main()
+    except SystemExit:
+        pass
+    assert "Sessions: 2, actions: 3, warnings: 0" in capsys.readouterr().out
@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+
+import pytest
+
+import interface
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+CSV_HEADER = "Id,Name,Type 1,Type 2,Total,HP,Attack,Defense,Sp. Atk,Sp. Def,Speed,Generation,Legendary"
+# The files that can't be read, none of them closes the menu.
+BAD_ROSTERS = {
+    "pokemons_broken.json": "[{",
+    "pokemons_nostats.json": '[{"Name": "Bulbasaur", "Legendary": false}]',
+    "pokemons_unknown.json": '[{"Name": "Bulbasaur"}]',
+    "pokemons_header.csv": f"{CSV_HEADER}\n",
+    "pokemons_short.csv": f"{CSV_HEADER}\n1,Bulbasaur,Grass\n",
+    "pokemons_cut.xml": "<root><id0><Name>Bulbasaur</Name><Legendary>False",
+    "pokemons_bad.yaml": "- Name: [Bulbasaur\n  Legendary: false\n",
+    "pokemons_empty.yaml": "",
+}
+
+
+@pytest.fixture
+def session(tmp_path):
+    """
+    This fixture returns a menu session on a data directory with a
+    pokemon roster, a file of an unknown format and a broken one.
+    """
+    data_dir = tmp_path / "data"
+    shutil.copytree(os.path.join(DATA_DIR, "pokemon", "json"), data_dir / "pokemon" / "json")
+    for file_format in ("csv", "xml", "yaml"):
+        (data_dir / "pokemon" / file_format).mkdir()
+    for monster_file, content in BAD_ROSTERS.items():
+        (data_dir / "pokemon" / monster_file.split(".")[-1] / monster_file).write_text(content)
+    (data_dir / "pokemon" / "json" / "pokemons_json").write_text("[]")
+    return interface.Session(str(data_dir), interface.ActionLog(str(tmp_path / "actions.jsonl")))
+
+
+def typed(monkeypatch, *answers):
+    """
+    This function answers the input calls of the menu in order.
+    """
+    answers = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+
+def logged_actions(session):
+    """
+    This function returns the actions logged by the session.
+    """
+    with open(session.action_log.path, encoding="utf-8") as source_data:
+        return [json.loads(line)["action"] for line in source_data]
+
+
+def test_invalid_save_choice_goes_back_to_the_menu(session, monkeypatch, capsys):
+    with open("7_pokemon-trivia.txt", "w") as target:
+        target.write("kept")
+    typed(monkeypatch, "2", "1", "pokemons_1.json", "7", "maybe")
+    assert interface.menu_action(session) is True
+    assert "WARNING: Invalid Input." in capsys.readouterr().out
+    with open("7_pokemon-trivia.txt") as source_data:
+        assert source_data.read() == "kept"
+
+    typed(monkeypatch, "5")
+    assert interface.menu_action(session) is False
+    assert logged_actions(session) == ["trivia", "exit"]
+
+
+@pytest.mark.parametrize("monster_file", ["pokemons_json", *BAD_ROSTERS])
+def test_unreadable_file_goes_back_to_the_menu(session, monkeypatch, capsys, monster_file):
+    typed(monkeypatch, "2", "1", monster_file)
+    assert interface.menu_action(session) is True
+    assert capsys.readouterr().out.count("Error: ") == 1
+    assert logged_actions(session) == ["invalid"]
+
+
+def test_unsupported_format_is_a_value_error(tmp_path):
+    filepath = tmp_path / "pokemons.txt"
+    filepath.write_text("")
+    with pytest.raises(ValueError, match="File format not supported!"):
+        interface.read_file(str(filepath))
+
+
+def test_session_keeps_the_files_used_last(session, monkeypatch):
+    monkeypatch.setattr(interface, "SESSION_MAX_FILES", 2)
+    reads = []
+    read_file = interface.read_file
+    monkeypatch.setattr(interface, "read_file", lambda filepath: reads.append(filepath) or read_file(filepath))
+    first, second, third = (session.monster_path("pokemon", "json", f"pokemons_{idx}.json") for idx in (1, 2, 3))
+    shutil.copy(first, third)
+
+    for filepath in (first, second, first, third, first, second):
+        session.trivia(filepath)
+        session.file_identity(filepath)
+    # The first file was used again before the third, so the second one was dropped.
+    assert reads == [first, second, third, second]
+    for cache in (session.rosters, session.trivias, session.digests):
+        assert list(cache) == [os.path.abspath(first), os.path.abspath(second)]
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+import interface
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "data")
+ROSTERS = [
+    os.path.join(DATA_DIR, "pokemon", "json", "pokemons_1.json"),
+    os.path.join(DATA_DIR, "pokemon", "csv", "pokemons_2.csv"),
+    os.path.join(DATA_DIR, "digimon", "yaml", "digimons_1.yaml"),
+    os.path.join(DATA_DIR, "digimon", "xml", "digimons_2.xml"),
+]
+
+
+def first_of(monsters, stat, reverse):
+    """
+    This function returns the highest, or lowest, monster of a stat
+    with a stable sort, the first one seen wins a tie. The csv and xml
+    stats are strings, they are compared as numbers.
+    """
+    sign = -1 if reverse else 1
+    return sorted(monsters, key=lambda monster: sign * int(getattr(monster, stat)))[0]
+
+
+@pytest.mark.parametrize("filepath", ROSTERS, ids=os.path.basename)
+def test_trivia_matches_a_stable_sort(filepath):
+    monsters = interface.read_file(filepath)
+    trivia = interface.Trivia(monsters)
+    assert trivia.monster_sum == len(monsters)
+    assert trivia.highest_hp_monster is first_of(monsters, "hp", True)
+    assert trivia.highest_atk_monster is first_of(monsters, "attack", True)
+    assert trivia.lowest_atk_monster is first_of(monsters, "attack", False)
+    assert trivia.highest_def_monster is first_of(monsters, "defense", True)
+    assert trivia.highest_spd_monster is first_of(monsters, "speed", True)
+    for stage, count in trivia.stage_counts.items():
+        members = [monster for monster in monsters if monster.stage == stage]
+        assert count == len(members)
+        assert trivia.stage_strongest[stage] is first_of(members, "attack", True)
+
+
+@pytest.mark.parametrize("filepath", ROSTERS, ids=os.path.basename)
+@pytest.mark.parametrize("cut", [0, 1, 57])
+def test_merge_is_the_same_as_one_trivia(filepath, cut):
+    monsters = interface.read_file(filepath)
+    merged = interface.Trivia(monsters[:cut]).merge(interface.Trivia(monsters[cut:]))
+    whole = interface.Trivia(monsters)
+    assert merged.summary() == whole.summary()
+    assert merged.stage_strongest == whole.stage_strongest
+    assert merged.type_strongest == whole.type_strongest
+
+
+def test_instances_do_not_share_counters():
+    monsters = interface.read_file(ROSTERS[0])
+    first = interface.Trivia(monsters)
+    second = interface.Trivia(monsters[:3])
+    assert first.monster_sum == len(monsters)
+    assert second.monster_sum == 3
+    first.reset()
+    assert first.summary()["monsters"] == 0
+    assert first.stage_counts == {}
+    assert second.monster_sum == 3
+
+
+@pytest.mark.parametrize("show", ["show_pokemon_trivia", "show_digimon_trivia"])
+def test_empty_trivia_is_shown_with_dashes(show, monkeypatch, capsys):
+    monkeypatch.setattr("builtins.input", lambda prompt="": "9")
+    getattr(interface.Trivia(), show)()
+    out = capsys.readouterr().out
+    assert "> 0 " in out
+    assert "> -" in out